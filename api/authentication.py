@@ -3,7 +3,7 @@ import hashlib
 from django.contrib.auth.models import AnonymousUser
 from rest_framework import authentication, exceptions
 
-from core.models import Brand
+from core.catalog import catalog_cache
 
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
@@ -21,9 +21,8 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
         # Hash the API key to compare with stored hash
         api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
 
-        try:
-            brand = Brand.objects.get(api_key_hash=api_key_hash)
-        except Brand.DoesNotExist:
+        brand = catalog_cache.get_brand_by_api_key_hash(api_key_hash)
+        if brand is None:
             raise exceptions.AuthenticationFailed("Invalid API key")
 
         # Return brand as user and brand itself as auth
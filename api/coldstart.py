@@ -0,0 +1,182 @@
+"""
+Cold-start measurement for worker configurations.
+
+Each run spawns a fresh interpreter (like a newly forked uWSGI worker with
+`lazy-apps`) with per-mode environment overrides (WARMUP_ON_STARTUP on or
+off, full or lean settings profile), loads license_service.wsgi and sends
+the first N requests through the WSGI application in-process. Requests come
+from a `generate_dataset` manifest via api.loadtest. Each process then
+measures framework overhead alone: requests to an unrouted path, which run
+the middleware, URL resolution and the 404 handler without touching the
+database (with DEBUG off and the 404 log muted, as in production).
+"""
+
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from api.loadtest import SCENARIOS, Request, RequestFactory, percentile
+
+OVERHEAD_PATH = "/__coldstart__/not-found"
+OVERHEAD_REQUESTS = 500
+
+# Mode name -> environment overrides for the measured processes
+WARMUP_MODES = {"cold": {"WARMUP_ON_STARTUP": "0"}, "warm": {"WARMUP_ON_STARTUP": "1"}}
+
+
+def wsgi_environ(request: Request) -> dict:
+    path, _, query = request.path.partition("?")
+    environ = {
+        "REQUEST_METHOD": request.method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "coldstart",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "CONTENT_LENGTH": str(len(request.body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(request.body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in request.headers.items():
+        key = name.upper().replace("-", "_")
+        if key != "CONTENT_TYPE":
+            key = f"HTTP_{key}"
+        environ[key] = value
+    return environ
+
+
+def scenario_requests(factory: RequestFactory, scenario: str, count: int):
+    """Yield `count` requests drawn from a load-test scenario."""
+    methods, weights = zip(*SCENARIOS[scenario])
+    for _ in range(count):
+        yield getattr(factory, factory.rng.choices(methods, weights)[0])()
+
+
+def send_requests(application, requests) -> list:
+    """Send requests one by one; returns [(name, status, seconds)]."""
+    results = []
+    for request in requests:
+        status = []
+
+        def start_response(status_line, headers, exc_info=None):
+            status.append(int(status_line.split()[0]))
+
+        start = time.perf_counter()
+        response = application(wsgi_environ(request), start_response)
+        try:
+            for _chunk in response:
+                pass
+        finally:
+            if hasattr(response, "close"):
+                response.close()
+        results.append((request.name, status[0], time.perf_counter() - start))
+    return results
+
+
+def run_child(manifest_path: str, scenario: str, count: int, seed: int) -> dict:
+    """
+    Body of one measured process. Imports the application itself and reports
+    wall-clock timestamps so the parent can include interpreter start-up.
+    """
+    with open(manifest_path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+
+    from django.test.utils import override_settings
+
+    from license_service.wsgi import application
+
+    app_loaded_at = time.time()
+    factory = RequestFactory(manifest, random.Random(seed))
+    results = send_requests(application, scenario_requests(factory, scenario, count))
+    latencies = [seconds for _, _, seconds in results]
+    ordered = sorted(latencies)
+
+    probe = [Request("overhead", "GET", OVERHEAD_PATH)] * OVERHEAD_REQUESTS
+    request_logger = logging.getLogger("django.request")
+    request_logger.disabled = True
+    try:
+        with override_settings(DEBUG=False):
+            overhead = send_requests(application, probe)
+    finally:
+        request_logger.disabled = False
+    return {
+        "overhead_us": round(
+            statistics.fmean(seconds for _, _, seconds in overhead[10:]) * 1e6, 1
+        ),
+        "app_loaded_at": app_loaded_at,
+        "first_request_ms": round(latencies[0] * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "total_ms": round(sum(latencies) * 1000, 2),
+        "errors": sum(1 for _, status, _ in results if status >= 500),
+    }
+
+
+def measure(
+    manifest_path: str,
+    scenario: str = "mixed",
+    count: int = 100,
+    runs: int = 3,
+    seed: int = 1,
+    modes: dict = None,
+) -> dict:
+    """
+    Run `runs` fresh processes per mode (default: without and with warm-up)
+    and report the median of every metric per mode.
+    """
+    modes = modes or WARMUP_MODES
+    report = {"scenario": scenario, "requests": count, "runs": runs, "modes": {}}
+    for mode, overrides in modes.items():
+        env = dict(os.environ, **overrides)
+        samples = []
+        for run in range(runs):
+            spawned_at = time.time()
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "api.coldstart",
+                    manifest_path,
+                    scenario,
+                    str(count),
+                    str(seed + run),
+                ],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            sample = json.loads(completed.stdout.strip().splitlines()[-1])
+            startup = sample.pop("app_loaded_at") - spawned_at
+            sample["startup_seconds"] = round(startup, 4)
+            sample["time_to_first_response_seconds"] = round(
+                startup + sample["first_request_ms"] / 1000, 4
+            )
+            samples.append(sample)
+        report["modes"][mode] = {
+            key: round(statistics.median(sample[key] for sample in samples), 4)
+            for key in samples[0]
+        }
+    return report
+
+
+if __name__ == "__main__":
+    print(
+        json.dumps(
+            run_child(sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        )
+    )
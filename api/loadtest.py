@@ -0,0 +1,353 @@
+"""
+Self-contained load generator for the license API.
+
+Drives either a running deployment over HTTP/1.1 (uWSGI or any ASGI server,
+via a minimal keep-alive client built on asyncio streams) or the ASGI
+application in-process. Request data comes from a `generate_dataset`
+manifest, so runs hit realistic keys without any external service.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+
+@dataclass
+class Request:
+    name: str
+    method: str
+    path: str
+    headers: dict = field(default_factory=dict)
+    body: bytes = b""
+
+
+class RequestFactory:
+    """
+    Builds requests from a dataset manifest. Each method returns one Request.
+    """
+
+    # Licenses per bulk update, as a billing reconciliation run sends them
+    BULK_SIZE = 100
+
+    def __init__(self, manifest: dict, rng: random.Random):
+        self.rng = rng
+        self.keys = manifest["license_keys"]
+        self.licenses = manifest["licenses"]
+        self.licenses_by_brand = defaultdict(list)
+        for license_info in self.licenses:
+            self.licenses_by_brand[license_info["brand"]].append(license_info["id"])
+        self.api_keys = {b["slug"]: b["api_key"] for b in manifest["brands"]}
+        self.counter = 0
+        if not self.keys:
+            raise ValueError("Manifest contains no license keys")
+
+    def status(self) -> Request:
+        key = self.rng.choice(self.keys)
+        return Request("status", "GET", f"/api/v1/licenses/{key}/status")
+
+    def activate(self) -> Request:
+        self.counter += 1
+        body = {
+            "license_key": self.rng.choice(self.keys),
+            "instance_identifier": f"https://load-{self.counter}.example.com",
+        }
+        return Request(
+            "activate",
+            "POST",
+            "/api/v1/products/activations",
+            {"Content-Type": "application/json"},
+            json.dumps(body).encode(),
+        )
+
+    def brand_update(self) -> Request:
+        license_info = self.rng.choice(self.licenses)
+        return Request(
+            "brand_update",
+            "PATCH",
+            f"/api/v1/brands/licenses/{license_info['id']}",
+            {
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_keys[license_info["brand"]],
+            },
+            json.dumps({"status": "valid"}).encode(),
+        )
+
+    def brand_bulk_update(self) -> Request:
+        brand = self.rng.choice(self.licenses)["brand"]
+        license_ids = self.licenses_by_brand[brand]
+        updates = [
+            {"license_id": license_id, "status": "valid"}
+            for license_id in self.rng.sample(
+                license_ids, min(len(license_ids), self.BULK_SIZE)
+            )
+        ]
+        return Request(
+            "brand_bulk_update",
+            "PATCH",
+            "/api/v1/brands/licenses/bulk",
+            {
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_keys[brand],
+            },
+            json.dumps({"updates": updates}).encode(),
+        )
+
+
+# Scenario name -> [(RequestFactory method, weight)]
+SCENARIOS = {
+    "mixed": [("status", 90), ("activate", 8), ("brand_update", 2)],
+    "status": [("status", 100)],
+    "activation_storm": [("activate", 95), ("status", 5)],
+    "brand_sync": [("brand_update", 90), ("brand_bulk_update", 10)],
+}
+
+
+class HTTPTransport:
+    """
+    Minimal HTTP/1.1 client: one keep-alive connection per worker,
+    re-opened whenever the server closes it.
+    """
+
+    def __init__(self, base_url: str):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError("Only plain http:// targets are supported")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.target = f"http {self.host}:{self.port}"
+
+    def connection(self):
+        return _HTTPConnection(self)
+
+
+class _HTTPConnection:
+    def __init__(self, transport: HTTPTransport):
+        self.transport = transport
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def send(self, request: Request) -> int:
+        t = self.transport
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(t.host, t.port)
+
+        lines = [
+            f"{request.method} {t.prefix}{request.path} HTTP/1.1",
+            f"Host: {t.host}:{t.port}",
+            f"Content-Length: {len(request.body)}",
+        ]
+        lines += [f"{name}: {value}" for name, value in request.headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + request.body)
+        await self.writer.drain()
+
+        try:
+            status, keep_alive = await self._read_response()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+        if not keep_alive:
+            await self.close()
+        return status
+
+    async def _read_response(self):
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            await self.reader.read()
+            keep_alive = False
+        return status, keep_alive
+
+
+class ASGITransport:
+    """Calls an ASGI application in-process, bypassing the network."""
+
+    def __init__(self, application):
+        self.application = application
+        self.target = "asgi in-process"
+
+    def connection(self):
+        return _ASGIConnection(self.application)
+
+
+class _ASGIConnection:
+    def __init__(self, application):
+        self.application = application
+
+    async def close(self):
+        pass
+
+    async def send(self, request: Request) -> int:
+        path, _, query = request.path.partition("?")
+        headers = [(b"host", b"loadtest")]
+        headers += [
+            (name.lower().encode(), value.encode())
+            for name, value in request.headers.items()
+        ]
+        headers.append((b"content-length", str(len(request.body)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+        }
+        body_sent = False
+        status = None
+        response_done = asyncio.Event()
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": request.body}
+            # The client stays connected until the response is complete
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif not message.get("more_body", False):
+                response_done.set()
+
+        await self.application(scope, receive, send)
+        return status
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+class LoadTest:
+    """
+    Closed-loop load test: `concurrency` workers issue requests back to back
+    until `duration` seconds have elapsed or `max_requests` were sent.
+    """
+
+    def __init__(
+        self,
+        transport,
+        factory: RequestFactory,
+        scenario: str = "mixed",
+        concurrency: int = 10,
+        duration: float = 30.0,
+        max_requests: int = None,
+    ):
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {scenario}")
+        self.transport = transport
+        self.factory = factory
+        self.scenario = scenario
+        self.concurrency = concurrency
+        self.duration = duration
+        self.max_requests = max_requests
+        self.latencies = defaultdict(list)
+        self.status_codes = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+        self.sent = 0
+
+    def _next_request(self) -> Request:
+        methods, weights = zip(*SCENARIOS[self.scenario])
+        method = self.factory.rng.choices(methods, weights)[0]
+        return getattr(self.factory, method)()
+
+    async def _worker(self, deadline: float):
+        connection = self.transport.connection()
+        try:
+            while time.perf_counter() < deadline:
+                if self.max_requests is not None and self.sent >= self.max_requests:
+                    break
+                self.sent += 1
+                request = self._next_request()
+                start = time.perf_counter()
+                try:
+                    status = await connection.send(request)
+                except (OSError, asyncio.IncompleteReadError) as e:
+                    self.errors[request.name] += 1
+                    self.status_codes[request.name][type(e).__name__] += 1
+                    continue
+                self.latencies[request.name].append(time.perf_counter() - start)
+                self.status_codes[request.name][status] += 1
+                if status >= 500:
+                    self.errors[request.name] += 1
+        finally:
+            await connection.close()
+
+    async def run(self) -> dict:
+        started = time.perf_counter()
+        deadline = started + self.duration
+        await asyncio.gather(*(self._worker(deadline) for _ in range(self.concurrency)))
+        return self.report(time.perf_counter() - started)
+
+    def report(self, elapsed: float) -> dict:
+        def summarize(latencies, errors, total):
+            latencies = sorted(latencies)
+            return {
+                "requests": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            }
+
+        by_request = {}
+        for name, codes in self.status_codes.items():
+            total = sum(codes.values())
+            by_request[name] = summarize(self.latencies[name], self.errors[name], total)
+            by_request[name]["status_codes"] = {str(c): n for c, n in codes.items()}
+
+        all_latencies = [lat for values in self.latencies.values() for lat in values]
+        total = sum(r["requests"] for r in by_request.values())
+        overall = summarize(all_latencies, sum(self.errors.values()), total)
+        overall["throughput_rps"] = round(total / elapsed, 1) if elapsed else 0.0
+
+        return {
+            "target": self.transport.target,
+            "scenario": self.scenario,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(elapsed, 2),
+            "overall": overall,
+            "requests": by_request,
+        }
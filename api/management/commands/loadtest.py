@@ -0,0 +1,92 @@
+import asyncio
+import json
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.loadtest import (
+    SCENARIOS,
+    ASGITransport,
+    HTTPTransport,
+    LoadTest,
+    RequestFactory,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a load test against the license API using keys from a "
+        "generate_dataset manifest and report latency percentiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--manifest", required=True, help="Manifest from generate_dataset."
+        )
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument(
+            "--url", help="Base URL of a running uWSGI or ASGI deployment."
+        )
+        target.add_argument(
+            "--asgi",
+            action="store_true",
+            help="Drive license_service.asgi:application in-process.",
+        )
+        parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+        parser.add_argument("--concurrency", type=int, default=10)
+        parser.add_argument(
+            "--duration", type=float, default=30.0, help="Seconds to run."
+        )
+        parser.add_argument(
+            "--requests", type=int, help="Stop after this many requests."
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--json", help="Also write the report to this file.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["manifest"], encoding="utf-8") as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Cannot read manifest: {e}")
+
+        if options["asgi"]:
+            from license_service.asgi import application
+
+            transport = ASGITransport(application)
+        else:
+            transport = HTTPTransport(options["url"])
+
+        load_test = LoadTest(
+            transport,
+            RequestFactory(manifest, random.Random(options["seed"])),
+            scenario=options["scenario"],
+            concurrency=options["concurrency"],
+            duration=options["duration"],
+            max_requests=options["requests"],
+        )
+        report = asyncio.run(load_test.run())
+
+        overall = report["overall"]
+        self.stdout.write(
+            f"{report['target']} scenario={report['scenario']} "
+            f"concurrency={report['concurrency']} "
+            f"elapsed={report['elapsed_seconds']}s"
+        )
+        self.stdout.write(
+            f"{'request':<14}{'count':>8}{'errors':>8}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        )
+        for name, stats in sorted(report["requests"].items()) + [("TOTAL", overall)]:
+            self.stdout.write(
+                f"{name:<14}{stats['requests']:>8}{stats['errors']:>8}"
+                f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+            )
+        self.stdout.write(
+            f"throughput: {overall['throughput_rps']} req/s, "
+            f"error rate: {overall['error_rate']:.2%}"
+        )
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2)
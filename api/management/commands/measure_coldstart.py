@@ -0,0 +1,80 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.coldstart import WARMUP_MODES, measure
+from api.loadtest import SCENARIOS
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure time-to-first-response, first-N request latency and framework "
+        "overhead of fresh worker processes, with and without start-up warm-up "
+        "(--compare warmup) or with the full and lean settings (--compare settings)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--manifest", required=True, help="Manifest from generate_dataset."
+        )
+        parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+        parser.add_argument(
+            "--requests", type=int, default=100, help="Requests per process."
+        )
+        parser.add_argument(
+            "--runs", type=int, default=3, help="Processes per mode (median)."
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--compare", choices=["warmup", "settings"], default="warmup"
+        )
+        parser.add_argument(
+            "--lean-settings",
+            default="license_service.settings.api",
+            help="Settings module of the lean profile for --compare settings.",
+        )
+        parser.add_argument("--json", help="Also write the report to this file.")
+
+    def handle(self, *args, **options):
+        if options["compare"] == "settings":
+            modes = {
+                "full": {
+                    "DJANGO_SETTINGS_MODULE": os.environ["DJANGO_SETTINGS_MODULE"]
+                },
+                "lean": {"DJANGO_SETTINGS_MODULE": options["lean_settings"]},
+            }
+        else:
+            modes = WARMUP_MODES
+
+        try:
+            report = measure(
+                options["manifest"],
+                scenario=options["scenario"],
+                count=options["requests"],
+                runs=options["runs"],
+                seed=options["seed"],
+                modes=modes,
+            )
+        except Exception as e:
+            raise CommandError(f"Measurement failed: {e}")
+
+        self.stdout.write(
+            f"scenario={report['scenario']} requests={report['requests']} "
+            f"runs={report['runs']} (medians)"
+        )
+        self.stdout.write(
+            f"{'mode':<6}{'startup s':>11}{'first resp s':>14}{'first ms':>10}"
+            f"{'mean ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'overhead us':>13}"
+        )
+        for mode, stats in report["modes"].items():
+            self.stdout.write(
+                f"{mode:<6}{stats['startup_seconds']:>11}"
+                f"{stats['time_to_first_response_seconds']:>14}"
+                f"{stats['first_request_ms']:>10}{stats['mean_ms']:>9}"
+                f"{stats['p95_ms']:>9}{stats['p99_ms']:>9}{stats['overhead_us']:>13}"
+            )
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2)
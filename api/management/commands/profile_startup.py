@@ -0,0 +1,78 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.startup_profile import DEFAULT_PATHS, compare_reports, profile
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile cold start in fresh processes: import time per package, "
+        "Django start-up phases and first-request latency. Optionally compare "
+        "against a saved report and fail on regressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=3, help="Processes (median).")
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help=f"Path for a first GET request (repeatable; default {DEFAULT_PATHS}).",
+        )
+        parser.add_argument("--json", help="Write the report to this file.")
+        parser.add_argument("--baseline", help="Report to compare against.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Relative growth counted as a regression (default 0.2).",
+        )
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=5.0,
+            help="Ignore growth below this many milliseconds (default 5).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            report = profile(runs=options["runs"], paths=options["paths"])
+        except Exception as e:
+            raise CommandError(f"Profiling failed: {e}")
+
+        self.stdout.write(f"settings={report['settings']} runs={report['runs']}")
+        for section in ("phases_ms", "imports_ms", "first_request_ms"):
+            self.stdout.write(f"{section}:")
+            for name, value in report[section].items():
+                self.stdout.write(f"  {name:<40}{value:>10}")
+        self.stdout.write(
+            f"imports: {report['import_total_ms']} ms over "
+            f"{report['module_count']} modules"
+        )
+        self.stdout.write("slowest modules (self time):")
+        for name, value in report["top_modules_ms"].items():
+            self.stdout.write(f"  {name:<40}{value:>10}")
+
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, sort_keys=True)
+                fh.write("\n")
+
+        if options["baseline"]:
+            try:
+                with open(options["baseline"], encoding="utf-8") as fh:
+                    baseline = json.load(fh)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Cannot read baseline: {e}")
+
+            added = report["module_count"] - baseline.get("module_count", 0)
+            self.stdout.write(f"modules imported vs baseline: {added:+d}")
+            regressions = compare_reports(
+                baseline, report, options["threshold"], options["min_ms"]
+            )
+            if regressions:
+                for regression in regressions:
+                    self.stderr.write(f"REGRESSION {regression}")
+                raise CommandError(f"{len(regressions)} start-up regressions")
+            self.stdout.write(self.style.SUCCESS("No start-up regressions"))
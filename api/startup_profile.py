@@ -0,0 +1,184 @@
+"""
+Start-up profiling: per-package import time, Django start-up phases and
+first-request latency, measured in fresh interpreters.
+
+The child process runs under `python -X importtime` and times each phase
+itself; the parent parses the import log, takes the median of several runs
+and produces a JSON report with sorted keys, so reports from two commits
+can be diffed or compared with `compare_reports`. Only the standard library
+is imported at module level: the child must start cold.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Root packages reported separately; everything else is summed as "other"
+IMPORT_GROUPS = [
+    "api",
+    "core",
+    "license_service",
+    "django",
+    "rest_framework",
+    "pythonjsonlogger",
+    "prometheus_client",
+    "psycopg2",
+]
+
+DEFAULT_PATHS = ["/__startup__/not-found", "/metrics"]
+
+
+def parse_importtime(log: str) -> dict:
+    """
+    Parse `-X importtime` output into {"modules": {name: self_us},
+    "groups": {group: self_us}}. Self times are summed per root package so
+    nested imports are not counted twice.
+    """
+    modules = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        self_us, name = int(parts[0]), parts[2].strip()
+        modules[name] = modules.get(name, 0) + self_us
+
+    groups = {group: 0 for group in IMPORT_GROUPS + ["other"]}
+    for name, self_us in modules.items():
+        root = name.split(".")[0]
+        groups[root if root in groups else "other"] += self_us
+    return {"modules": modules, "groups": groups}
+
+
+def run_child(paths: list) -> dict:
+    """Body of one profiled process: time each start-up phase in order."""
+    phases = {}
+    start = time.perf_counter()
+
+    import django
+    from django.conf import settings
+
+    # First attribute access imports the settings module
+    len(settings.INSTALLED_APPS)
+    phases["settings"] = time.perf_counter() - start
+
+    mark = time.perf_counter()
+    django.setup(set_prefix=False)
+    phases["app_registry"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    from django.core.handlers.wsgi import WSGIHandler
+
+    handler = WSGIHandler()
+    phases["middleware"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    from django.urls import get_resolver
+
+    # Imports the URLconf, views and serializers
+    len(get_resolver().url_patterns)
+    phases["urlconf"] = time.perf_counter() - mark
+    phases["total"] = time.perf_counter() - start
+
+    import logging
+
+    from django.test.utils import override_settings
+
+    from api.coldstart import send_requests
+    from api.loadtest import Request
+
+    first_requests = {}
+    logging.getLogger("django.request").disabled = True
+    with override_settings(DEBUG=False):
+        for path in paths:
+            [(_, status, seconds)] = send_requests(
+                handler, [Request("first", "GET", path)]
+            )
+            first_requests[path] = {"status": status, "ms": round(seconds * 1000, 2)}
+
+    return {
+        "phases_ms": {name: round(s * 1000, 2) for name, s in phases.items()},
+        "first_requests": first_requests,
+    }
+
+
+def profile(runs: int = 3, paths: list = None) -> dict:
+    """Profile `runs` fresh processes and return the median report."""
+    paths = paths or DEFAULT_PATHS
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "api.startup_profile", *paths],
+            env=dict(os.environ, WARMUP_ON_STARTUP="0"),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sample = json.loads(completed.stdout.strip().splitlines()[-1])
+        sample["imports"] = parse_importtime(completed.stderr)
+        samples.append(sample)
+
+    def median(values):
+        return round(statistics.median(values), 2)
+
+    groups = IMPORT_GROUPS + ["other"]
+    imports_ms = {
+        group: median(s["imports"]["groups"][group] / 1000 for s in samples)
+        for group in groups
+    }
+    # Module list and top offenders from the run with the median import total
+    by_total = sorted(samples, key=lambda s: sum(s["imports"]["groups"].values()))
+    typical = by_total[len(by_total) // 2]["imports"]["modules"]
+    top_modules = sorted(typical.items(), key=lambda item: -item[1])[:20]
+
+    import django
+
+    return {
+        "settings": os.environ.get("DJANGO_SETTINGS_MODULE"),
+        "python": sys.version.split()[0],
+        "django": django.get_version(),
+        "runs": runs,
+        "phases_ms": {
+            phase: median(s["phases_ms"][phase] for s in samples)
+            for phase in samples[0]["phases_ms"]
+        },
+        "first_request_ms": {
+            path: median(s["first_requests"][path]["ms"] for s in samples)
+            for path in paths
+        },
+        "imports_ms": imports_ms,
+        "import_total_ms": round(sum(imports_ms.values()), 2),
+        "module_count": len(typical),
+        "top_modules_ms": {name: round(us / 1000, 2) for name, us in top_modules},
+    }
+
+
+def compare_reports(
+    baseline: dict, current: dict, threshold: float = 0.2, min_ms: float = 5.0
+) -> list:
+    """
+    Return human-readable regressions: any phase, import group or first
+    request that grew by more than `threshold` (fraction) and `min_ms`, or
+    that costs more than `min_ms` and was absent or free in the baseline
+    (such as a newly imported dependency).
+    """
+    regressions = []
+    for section in ("phases_ms", "imports_ms", "first_request_ms"):
+        for name, value in current.get(section, {}).items():
+            before = baseline.get(section, {}).get(name)
+            if not before:
+                if value > min_ms:
+                    regressions.append(f"{section}.{name}: new, {value} ms")
+                continue
+            if value - before > min_ms and value > before * (1 + threshold):
+                regressions.append(
+                    f"{section}.{name}: {before} ms -> {value} ms "
+                    f"(+{(value - before) / before:.0%})"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_child(sys.argv[1:])))
@@ -1,12 +1,17 @@
 from .brand_serializers import (
+    AnalyticsQuerySerializer,
+    BulkUpdateLicensesSerializer,
     CreateLicenseKeySerializer,
     CreateLicenseSerializer,
+    EntitlementResponseSerializer,
     LicenseKeyResponseSerializer,
     LicenseResponseSerializer,
     ProductSerializer,
     UpdateLicenseSerializer,
+    UsageRollupSerializer,
 )
 from .license_serializers import (
+    LicenseStatusBatchSerializer,
     LicenseStatusResponseSerializer,
     LicenseStatusSerializer,
 )
@@ -17,12 +22,17 @@ from .product_serializers import (
 )
 
 __all__ = [
+    "AnalyticsQuerySerializer",
+    "BulkUpdateLicensesSerializer",
     "CreateLicenseKeySerializer",
     "CreateLicenseSerializer",
+    "EntitlementResponseSerializer",
     "LicenseKeyResponseSerializer",
     "LicenseResponseSerializer",
     "ProductSerializer",
     "UpdateLicenseSerializer",
+    "UsageRollupSerializer",
+    "LicenseStatusBatchSerializer",
     "LicenseStatusResponseSerializer",
     "LicenseStatusSerializer",
     "ActivationResponseSerializer",
@@ -1,6 +1,10 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
-from core.models import License, LicenseKey, Product
+from core.catalog import catalog_cache
+from core.models import Entitlement, License, LicenseKey, Product, UsageRollup
 
 
 class CreateLicenseKeySerializer(serializers.Serializer):
@@ -39,20 +43,25 @@ class ProductSerializer(serializers.ModelSerializer):
     Serializer for product information.
     """
 
-    brand_name = serializers.CharField(source="brand.name", read_only=True)
+    brand_name = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
         fields = ["id", "name", "slug", "brand_name", "default_seat_limit"]
         read_only_fields = fields
 
+    def get_brand_name(self, obj):
+        if Product.brand.is_cached(obj):
+            return obj.brand.name
+        return catalog_cache.get_brand(obj.brand_id).name
+
 
 class LicenseResponseSerializer(serializers.ModelSerializer):
     """
     Response serializer for license with full details.
     """
 
-    product = ProductSerializer(read_only=True)
+    product = serializers.SerializerMethodField()
     license_key_str = serializers.CharField(source="license_key.key", read_only=True)
     customer_email = serializers.CharField(
         source="license_key.customer_email", read_only=True
@@ -77,6 +86,12 @@ class LicenseResponseSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def get_product(self, obj):
+        # Products come from the catalog cache unless already loaded
+        if not License.product.is_cached(obj):
+            obj.product = catalog_cache.get_product(obj.product_id)
+        return ProductSerializer(obj.product).data
+
     def get_seats_used(self, obj):
         return obj.get_active_activations_count()
 
@@ -84,12 +99,138 @@ class LicenseResponseSerializer(serializers.ModelSerializer):
         return obj.get_seat_limit()
 
 
+class EntitlementResponseSerializer(serializers.ModelSerializer):
+    """
+    Response serializer for an entitlement row.
+    Same shape as LicenseResponseSerializer, without touching the source tables.
+    """
+
+    id = serializers.UUIDField(source="license_id", read_only=True)
+    product = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(source="license_created_at", read_only=True)
+    updated_at = serializers.DateTimeField(source="license_updated_at", read_only=True)
+
+    class Meta:
+        model = Entitlement
+        fields = [
+            "id",
+            "license_key_str",
+            "customer_email",
+            "product",
+            "status",
+            "expires_at",
+            "seat_limit",
+            "seats_used",
+            "seats_total",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def get_product(self, obj):
+        return {
+            "id": str(obj.product_id),
+            "name": obj.product_name,
+            "slug": obj.product_slug,
+            "brand_name": obj.brand_name,
+            "default_seat_limit": obj.product_default_seat_limit,
+        }
+
+
 class UpdateLicenseSerializer(serializers.Serializer):
     """
     Serializer for updating license status/expiration (US2).
     """
 
+    # "expired" is only set by the expiry processor (ExpiryService)
     status = serializers.ChoiceField(
-        choices=License.Status.choices, required=False, allow_null=True
+        choices=[
+            choice
+            for choice in License.Status.choices
+            if choice[0] != License.Status.EXPIRED
+        ],
+        required=False,
+        allow_null=True,
     )
     expires_at = serializers.DateTimeField(required=False, allow_null=True)
+
+
+class BulkUpdateLicenseItemSerializer(UpdateLicenseSerializer):
+    """
+    One entry of a bulk license update.
+    """
+
+    license_id = serializers.UUIDField(required=True)
+
+    def validate(self, attrs):
+        if not attrs.get("status") and attrs.get("expires_at") is None:
+            raise serializers.ValidationError(
+                "Each update needs a status and/or expires_at"
+            )
+        return attrs
+
+
+class BulkUpdateLicensesSerializer(serializers.Serializer):
+    """
+    Serializer for bulk license status/expiration updates (US2, bulk).
+    """
+
+    MAX_UPDATES = 5000
+
+    updates = BulkUpdateLicenseItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_UPDATES
+    )
+
+    def validate_updates(self, updates):
+        license_ids = [update["license_id"] for update in updates]
+        if len(set(license_ids)) != len(license_ids):
+            raise serializers.ValidationError("Each license_id may appear only once")
+        return updates
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the brand analytics endpoint. The range defaults to
+    the last 30 days (daily) or 48 hours (hourly).
+    """
+
+    DEFAULT_RANGE = {"day": timedelta(days=30), "hour": timedelta(hours=48)}
+    MAX_RANGE = {"day": timedelta(days=366), "hour": timedelta(days=31)}
+
+    granularity = serializers.ChoiceField(
+        choices=UsageRollup.Granularity.choices, default="day"
+    )
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    product_slug = serializers.SlugField(required=False)
+
+    def validate(self, attrs):
+        granularity = attrs["granularity"]
+        attrs.setdefault("until", timezone.now())
+        attrs.setdefault("since", attrs["until"] - self.DEFAULT_RANGE[granularity])
+        if attrs["since"] >= attrs["until"]:
+            raise serializers.ValidationError("since must be before until")
+        if attrs["until"] - attrs["since"] > self.MAX_RANGE[granularity]:
+            raise serializers.ValidationError(
+                f"Range too large for {granularity} granularity "
+                f"(max {self.MAX_RANGE[granularity].days} days)"
+            )
+        return attrs
+
+
+class UsageRollupSerializer(serializers.ModelSerializer):
+    """
+    One analytics bucket.
+    """
+
+    class Meta:
+        model = UsageRollup
+        fields = [
+            "bucket_start",
+            "activations",
+            "deactivations",
+            "seat_limit_rejections",
+            "active_seats",
+            "seats_purchased",
+        ]
+        read_only_fields = fields
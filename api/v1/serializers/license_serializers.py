@@ -25,3 +25,17 @@ class LicenseStatusResponseSerializer(serializers.Serializer):
     customer_email = serializers.EmailField()
     valid = serializers.BooleanField()
     licenses = LicenseStatusSerializer(many=True)
+
+
+class LicenseStatusBatchSerializer(serializers.Serializer):
+    """
+    Request serializer for checking many license keys at once (US4, batch).
+    """
+
+    MAX_KEYS = 500
+
+    license_keys = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        allow_empty=False,
+        max_length=MAX_KEYS,
+    )
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from core.catalog import catalog_cache
 from core.models import Activation
 
 
@@ -19,7 +20,7 @@ class ActivationResponseSerializer(serializers.ModelSerializer):
     """
 
     license_id = serializers.UUIDField(source="license.id", read_only=True)
-    product_name = serializers.CharField(source="license.product.name", read_only=True)
+    product_name = serializers.SerializerMethodField()
     license_key = serializers.CharField(
         source="license.license_key.key", read_only=True
     )
@@ -38,6 +39,9 @@ class ActivationResponseSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def get_product_name(self, obj):
+        return catalog_cache.get_product(obj.license.product_id).name
+
 
 class DeactivateActivationSerializer(serializers.Serializer):
     """
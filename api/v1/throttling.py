@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from core import metrics
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """
+    Parse a DRF-style rate ("30/min") into (capacity, tokens per second).
+    The bucket holds up to `capacity` tokens and refills over the period.
+    """
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class LocalBucketStore:
+    """
+    Token buckets held in process memory. No I/O at all; limits apply per
+    worker process. Least recently used buckets are evicted beyond
+    `max_entries` (an evicted bucket simply starts full again).
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def consume(
+        self, key: str, capacity: int, refill_rate: float, cost: int = 1
+    ) -> float:
+        now = time.monotonic()
+        with self.lock:
+            tokens, updated = self.buckets.pop(key, (capacity, now))
+            tokens, wait = _take_tokens(
+                tokens, updated, now, capacity, refill_rate, cost
+            )
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_entries:
+                self.buckets.popitem(last=False)
+        return wait
+
+    def clear(self):
+        with self.lock:
+            self.buckets.clear()
+
+
+class CacheBucketStore:
+    """
+    Token buckets in a Django cache shared by all workers (RATE_LIMIT_CACHE
+    alias). Read-modify-write is not atomic, so concurrent requests may
+    slightly over-admit. Point the alias at a memory-backed cache
+    (Redis/Memcached/LocMem): a DatabaseCache costs queries per request.
+    """
+
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    def consume(
+        self, key: str, capacity: int, refill_rate: float, cost: int = 1
+    ) -> float:
+        cache = caches[self.alias]
+        cache_key = f"ratelimit:{key}"
+        now = time.time()
+        tokens, updated = cache.get(cache_key, (capacity, now))
+        tokens, wait = _take_tokens(tokens, updated, now, capacity, refill_rate, cost)
+        # Once fully refilled the bucket is equivalent to a missing one
+        cache.set(cache_key, (tokens, now), timeout=int(capacity / refill_rate) + 1)
+        return wait
+
+
+def _take_tokens(tokens, updated, now, capacity, refill_rate, cost=1):
+    tokens = min(capacity, tokens + (now - updated) * refill_rate)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / refill_rate
+
+
+_local_store = LocalBucketStore()
+
+
+def get_bucket_store():
+    backend = getattr(settings, "RATE_LIMIT_BACKEND", "local")
+    if backend == "cache":
+        return CacheBucketStore(getattr(settings, "RATE_LIMIT_CACHE", "default"))
+    return _local_store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token-bucket throttle scoped by the view's `throttle_scope`.
+    The rate is read from DEFAULT_THROTTLE_RATES["<scope>_<suffix>"];
+    a missing rate disables the throttle for that view. A request takes
+    one token, or `view.get_throttle_cost(request)` tokens (at most the
+    bucket's capacity) when the view defines it.
+    """
+
+    suffix = None
+
+    def get_bucket_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = f"{getattr(view, 'throttle_scope', None)}_{self.suffix}"
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+        if rate is None:
+            return True
+
+        bucket_key = self.get_bucket_key(request, view)
+        if bucket_key is None:
+            return True
+
+        capacity, refill_rate = parse_rate(rate)
+        cost = 1
+        if hasattr(view, "get_throttle_cost"):
+            cost = min(max(view.get_throttle_cost(request), 1), capacity)
+        wait = get_bucket_store().consume(
+            f"{scope}:{bucket_key}", capacity, refill_rate, cost
+        )
+        if wait:
+            self.wait_seconds = wait
+            metrics.RATE_LIMITED.labels(scope=scope).inc()
+            return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ClientIPRateThrottle(TokenBucketThrottle):
+    """Limits requests per client IP (honours NUM_PROXIES)."""
+
+    suffix = "ip"
+
+    def get_bucket_key(self, request, view):
+        return self.get_ident(request)
+
+
+class LicenseKeyRateThrottle(TokenBucketThrottle):
+    """
+    Limits requests per license key. The key comes from the URL, the request
+    body, or the activation id for endpoints addressed by activation.
+    """
+
+    suffix = "key"
+
+    def get_bucket_key(self, request, view):
+        for kwarg in ("license_key", "activation_id"):
+            if kwarg in view.kwargs:
+                return str(view.kwargs[kwarg])
+        if hasattr(request.data, "get") and request.data.get("license_key"):
+            return str(request.data["license_key"])
+        return None
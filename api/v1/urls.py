@@ -1,10 +1,14 @@
 from django.urls import path
 
 from .views import (
+    AnalyticsView,
+    BulkUpdateLicensesView,
     CreateActivationView,
     CreateLicenseKeyView,
     CreateLicenseView,
     DeactivateActivationView,
+    ExportView,
+    LicenseStatusBatchView,
     LicenseStatusView,
     ListLicensesByEmailView,
     UpdateLicenseView,
@@ -17,6 +21,11 @@ urlpatterns = [
         CreateLicenseKeyView.as_view(),
         name="create-license-key",
     ),
+    path(
+        "brands/licenses/bulk",
+        BulkUpdateLicensesView.as_view(),
+        name="bulk-update-licenses",
+    ),
     path(
         "brands/licenses/<uuid:license_id>",
         UpdateLicenseView.as_view(),
@@ -28,6 +37,8 @@ urlpatterns = [
         name="list-licenses-by-email",
     ),
     path("brands/licenses", CreateLicenseView.as_view(), name="create-license"),
+    path("brands/exports/<str:dataset>", ExportView.as_view(), name="export"),
+    path("brands/analytics", AnalyticsView.as_view(), name="analytics"),
     # Product APIs (US3, US5)
     path(
         "products/activations",
@@ -40,6 +51,11 @@ urlpatterns = [
         name="deactivate-activation",
     ),
     # Public APIs (US4)
+    path(
+        "licenses/status",
+        LicenseStatusBatchView.as_view(),
+        name="license-status-batch",
+    ),
     path(
         "licenses/<str:license_key>/status",
         LicenseStatusView.as_view(),
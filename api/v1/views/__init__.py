@@ -1,12 +1,16 @@
 from rest_framework.views import exception_handler
 
 from .brand_views import (
+    AnalyticsView,
+    BulkUpdateLicensesView,
     CreateLicenseKeyView,
     CreateLicenseView,
+    ExportView,
     ListLicensesByEmailView,
     UpdateLicenseView,
 )
-from .license_views import LicenseStatusView
+from .license_views import LicenseStatusBatchView, LicenseStatusView
+from .metrics_views import MetricsView
 from .product_views import CreateActivationView, DeactivateActivationView
 
 
@@ -25,11 +29,16 @@ def custom_exception_handler(exc, context):
 
 
 __all__ = [
+    "AnalyticsView",
+    "BulkUpdateLicensesView",
     "CreateLicenseKeyView",
     "CreateLicenseView",
+    "ExportView",
     "ListLicensesByEmailView",
     "UpdateLicenseView",
     "LicenseStatusView",
+    "LicenseStatusBatchView",
+    "MetricsView",
     "CreateActivationView",
     "DeactivateActivationView",
     "custom_exception_handler",
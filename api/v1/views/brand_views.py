@@ -1,20 +1,36 @@
 import logging
 
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.v1.permissions import IsBrandAuthenticated
 from api.v1.serializers import (
+    AnalyticsQuerySerializer,
+    BulkUpdateLicensesSerializer,
     CreateLicenseKeySerializer,
     CreateLicenseSerializer,
+    EntitlementResponseSerializer,
     LicenseKeyResponseSerializer,
     LicenseResponseSerializer,
     UpdateLicenseSerializer,
+    UsageRollupSerializer,
+)
+from core.catalog import catalog_cache
+from core.exceptions import (
+    LicenseAlreadyExistsError,
+    LicenseNotFoundError,
+    ProductNotFoundError,
+)
+from core.services import (
+    AuditService,
+    EntitlementService,
+    ExportService,
+    LicenseService,
+    RollupService,
 )
-from core.exceptions import LicenseAlreadyExistsError, ProductNotFoundError
-from core.models import License
-from core.services import AuditService, LicenseService
 
 logger = logging.getLogger(__name__)
 
@@ -110,9 +126,9 @@ class CreateLicenseView(APIView):
 
 class ListLicensesByEmailView(APIView):
     """
-    GET /api/v1/brands/licenses?customer_email=user@example.com
+    GET /api/v1/brands/licenses?customer_email=user@example.com[&valid=true]
     List all licenses for a customer email across all brands (US6).
-    Brand-only access.
+    Served from the entitlements read model. Brand-only access.
     """
 
     permission_classes = [IsBrandAuthenticated]
@@ -131,7 +147,10 @@ class ListLicensesByEmailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        licenses = LicenseService.get_licenses_by_email(customer_email)
+        valid_only = request.query_params.get("valid", "").lower() in ("1", "true")
+        licenses = EntitlementService.get_entitlements_by_email(
+            customer_email, valid_only=valid_only
+        )
 
         # Audit log
         brand = request.auth
@@ -144,7 +163,7 @@ class ListLicensesByEmailView(APIView):
             metadata={"customer_email": customer_email, "count": len(licenses)},
         )
 
-        serializer = LicenseResponseSerializer(licenses, many=True)
+        serializer = EntitlementResponseSerializer(licenses, many=True)
         return Response(
             {"customer_email": customer_email, "licenses": serializer.data},
             status=status.HTTP_200_OK,
@@ -165,31 +184,21 @@ class UpdateLicenseView(APIView):
 
         brand = request.auth
 
-        # Verify the license belongs to this brand
         try:
-            License.objects.get(id=license_id, license_key__brand=brand)
-        except License.DoesNotExist:
+            updated_license = LicenseService.update_brand_license(
+                brand=brand,
+                license_id=license_id,
+                status=serializer.validated_data.get("status"),
+                expires_at=serializer.validated_data.get("expires_at"),
+            )
+        except LicenseNotFoundError as e:
             return Response(
-                {
-                    "error": {
-                        "code": "LICENSE_NOT_FOUND",
-                        "message": (
-                            f"License {license_id} not found "
-                            "or does not belong to this brand"
-                        ),
-                    }
-                },
+                {"error": {"code": "LICENSE_NOT_FOUND", "message": str(e)}},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Update license
-        updated_license = LicenseService.update_license_status(
-            license_id=license_id,
-            status=serializer.validated_data.get("status"),
-            expires_at=serializer.validated_data.get("expires_at"),
-        )
-
         # Audit log
+        expires_at = serializer.validated_data.get("expires_at")
         AuditService.log_action(
             action="license.updated",
             actor=f"brand:{brand.slug}",
@@ -198,9 +207,165 @@ class UpdateLicenseView(APIView):
             brand=brand,
             metadata={
                 "status": serializer.validated_data.get("status"),
-                "expires_at": str(serializer.validated_data.get("expires_at")),
+                "expires_at": expires_at.isoformat() if expires_at else None,
             },
         )
 
         response_serializer = LicenseResponseSerializer(updated_license)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+class BulkUpdateLicensesView(APIView):
+    """
+    PATCH /api/v1/brands/licenses/bulk
+    Update status and/or expiration of many licenses at once (US2, bulk).
+    All-or-nothing: one unknown or foreign license rejects the whole batch.
+    """
+
+    permission_classes = [IsBrandAuthenticated]
+
+    def patch(self, request):
+        serializer = BulkUpdateLicensesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        brand = request.auth
+
+        try:
+            updated = LicenseService.bulk_update_licenses(
+                brand=brand, updates=serializer.validated_data["updates"]
+            )
+        except LicenseNotFoundError as e:
+            return Response(
+                {"error": {"code": "LICENSE_NOT_FOUND", "message": str(e)}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {
+                "updated": len(updated),
+                "licenses": [
+                    {
+                        "id": str(license_obj.id),
+                        "status": license_obj.status,
+                        "expires_at": (
+                            license_obj.expires_at.isoformat()
+                            if license_obj.expires_at
+                            else None
+                        ),
+                    }
+                    for license_obj in updated
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ExportView(APIView):
+    """
+    GET /api/v1/brands/exports/{licenses|activations}[?output=csv][&gzip=true]
+    Stream every license (with seat usage) or activation of the brand as
+    NDJSON (default) or CSV, optionally gzip-compressed.
+    """
+
+    permission_classes = [IsBrandAuthenticated]
+
+    def get(self, request, dataset):
+        fmt = request.query_params.get("output", "ndjson").lower()
+        compress = request.query_params.get("gzip", "").lower() in ("1", "true")
+
+        brand = request.auth
+
+        try:
+            chunks = ExportService.stream(brand, dataset, fmt, compress=compress)
+        except ValueError as e:
+            return Response(
+                {"error": {"code": "INVALID_PARAMETER", "message": str(e)}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Audit log
+        AuditService.log_action(
+            action="brand.exported",
+            actor=f"brand:{brand.slug}",
+            entity_type="brand",
+            entity_id=brand.id,
+            brand=brand,
+            metadata={"dataset": dataset, "format": fmt, "gzip": compress},
+        )
+
+        content_type, extension = ExportService.FORMATS[fmt]
+        filename = f"{brand.slug}-{dataset}-{timezone.now():%Y%m%dT%H%M%S}.{extension}"
+        if compress:
+            content_type, filename = "application/gzip", f"{filename}.gz"
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        # Let a reverse proxy pass chunks through instead of buffering them
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class AnalyticsView(APIView):
+    """
+    GET /api/v1/brands/analytics[?granularity=hour|day][&since=&until=]
+    [&product_slug=]
+    Seat utilization and activation trends per product. Reads only the
+    usage rollups (see `rollup_usage`), never activations or audit logs.
+    """
+
+    permission_classes = [IsBrandAuthenticated]
+
+    def get(self, request):
+        serializer = AnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        brand = request.auth
+
+        product = None
+        if params.get("product_slug"):
+            product = catalog_cache.get_product_by_slug(
+                brand.id, params["product_slug"]
+            )
+            if product is None:
+                return Response(
+                    {
+                        "error": {
+                            "code": "PRODUCT_NOT_FOUND",
+                            "message": f"Product {params['product_slug']} not found",
+                        }
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+        rollups = RollupService.get_usage(
+            brand, params["granularity"], params["since"], params["until"], product
+        )
+
+        products = {}
+        for rollup in rollups:
+            products.setdefault(rollup.product_id, []).append(rollup)
+
+        results = []
+        for product_id, buckets in products.items():
+            rollup_product = catalog_cache.get_product(product_id)
+            results.append(
+                {
+                    "product_slug": rollup_product.slug,
+                    "product_name": rollup_product.name,
+                    # Gauges of the latest bucket in the range
+                    "seats_used": buckets[-1].active_seats,
+                    "seats_purchased": buckets[-1].seats_purchased,
+                    "buckets": UsageRollupSerializer(buckets, many=True).data,
+                }
+            )
+
+        return Response(
+            {
+                "granularity": params["granularity"],
+                "since": params["since"],
+                "until": params["until"],
+                "products": results,
+            },
+            status=status.HTTP_200_OK,
+        )
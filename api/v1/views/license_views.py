@@ -1,11 +1,18 @@
 import logging
+import math
+import time
 
+from django.conf import settings
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from api.v1.serializers import LicenseStatusResponseSerializer
-from core.exceptions import LicenseNotFoundError
+from api.v1.serializers import (
+    LicenseStatusBatchSerializer,
+    LicenseStatusResponseSerializer,
+)
+from api.v1.throttling import ClientIPRateThrottle, LicenseKeyRateThrottle
+from core.exceptions import LicenseNotFoundError, StatusUnavailableError
 from core.services import ActivationService
 
 logger = logging.getLogger(__name__)
@@ -19,18 +26,105 @@ class LicenseStatusView(APIView):
     """
 
     permission_classes = []  # Public endpoint
+    throttle_classes = [ClientIPRateThrottle, LicenseKeyRateThrottle]
+    throttle_scope = "status"
 
     def get(self, request, license_key):
         try:
-            status_data = ActivationService.get_license_status(license_key)
+            status_data, stored_at = ActivationService.get_license_status_or_last_known(
+                license_key
+            )
 
             serializer = LicenseStatusResponseSerializer(data=status_data)
             serializer.is_valid(raise_exception=True)
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+            if stored_at is not None:
+                # Last known good status, served while the database is down
+                response["Age"] = str(max(0, math.floor(time.time() - stored_at)))
+                response["X-Status-Stale"] = "1"
+            return response
 
         except LicenseNotFoundError as e:
             return Response(
                 {"error": {"code": "LICENSE_NOT_FOUND", "message": str(e)}},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        except StatusUnavailableError as e:
+            return Response(
+                {"error": {"code": "SERVICE_UNAVAILABLE", "message": str(e)}},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={
+                    "Retry-After": str(math.ceil(settings.STATUS_BREAKER_RESET_TIMEOUT))
+                },
+            )
+
+
+class LicenseStatusBatchView(APIView):
+    """
+    POST /api/v1/licenses/status
+    Check the status of up to 500 license keys in one request (US4, batch),
+    for agencies and hosting panels managing many sites.
+    Public endpoint - no authentication required.
+    """
+
+    permission_classes = []  # Public endpoint
+    throttle_classes = [ClientIPRateThrottle]
+    throttle_scope = "status_batch"
+
+    def get_throttle_cost(self, request):
+        # Each key counts against the client's rate, as a status check would
+        if hasattr(request.data, "get"):
+            license_keys = request.data.get("license_keys")
+            if isinstance(license_keys, list):
+                return len(license_keys)
+        return 1
+
+    def post(self, request):
+        serializer = LicenseStatusBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        license_keys = serializer.validated_data["license_keys"]
+        try:
+            statuses, stored_at = ActivationService.get_license_statuses_or_last_known(
+                license_keys
+            )
+        except StatusUnavailableError as e:
+            return Response(
+                {"error": {"code": "SERVICE_UNAVAILABLE", "message": str(e)}},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={
+                    "Retry-After": str(math.ceil(settings.STATUS_BREAKER_RESET_TIMEOUT))
+                },
+            )
+
+        # Statuses are built as JSON-ready dicts: no per-key serializer pass
+        data = {
+            "results": {
+                key: status_data
+                for key, status_data in statuses.items()
+                if status_data is not None
+            },
+            "not_found": [
+                key for key, status_data in statuses.items() if status_data is None
+            ],
+        }
+        # During a database outage: keys with nothing stored, and the age in
+        # seconds of the last known good statuses served
+        unavailable = [
+            key for key in dict.fromkeys(license_keys) if key not in statuses
+        ]
+        if unavailable:
+            data["unavailable"] = unavailable
+        headers = {}
+        if stored_at:
+            now = time.time()
+            data["stale"] = {
+                key: max(0, math.floor(now - at)) for key, at in stored_at.items()
+            }
+            headers["X-Status-Stale"] = "1"
+        return Response(
+            data,
+            headers=headers,
+            status=status.HTTP_200_OK,
+        )
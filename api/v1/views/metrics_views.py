@@ -0,0 +1,26 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from core import metrics
+
+
+class MetricsView(View):
+    """
+    GET /metrics
+    Prometheus scrape endpoint.
+    When METRICS_AUTH_TOKEN is set, requires "Authorization: Bearer <token>".
+    """
+
+    def get(self, request):
+        token = getattr(settings, "METRICS_AUTH_TOKEN", None)
+        if token and not hmac.compare_digest(
+            request.META.get("HTTP_AUTHORIZATION", "").encode(),
+            f"Bearer {token}".encode(),
+        ):
+            return HttpResponseForbidden()
+
+        payload, content_type = metrics.render_latest()
+        return HttpResponse(payload, content_type=content_type)
@@ -5,6 +5,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.v1.serializers import ActivationResponseSerializer, CreateActivationSerializer
+from api.v1.throttling import ClientIPRateThrottle, LicenseKeyRateThrottle
+from core.catalog import catalog_cache
 from core.exceptions import (
     ActivationNotFoundError,
     LicenseCancelledError,
@@ -25,6 +27,8 @@ class CreateActivationView(APIView):
     """
 
     permission_classes = []  # Public endpoint, uses license key for auth
+    throttle_classes = [ClientIPRateThrottle, LicenseKeyRateThrottle]
+    throttle_scope = "activation"
 
     def post(self, request):
         serializer = CreateActivationSerializer(data=request.data)
@@ -47,7 +51,7 @@ class CreateActivationView(APIView):
                 actor=f"license_key:{license_key}",
                 entity_type="activation",
                 entity_id=activation.id,
-                brand=activation.license.product.brand,
+                brand=catalog_cache.get_product(activation.license.product_id).brand,
                 metadata={
                     "license_id": str(activation.license.id),
                     "instance_identifier": instance_identifier,
@@ -78,6 +82,16 @@ class CreateActivationView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
         except SeatLimitReachedError as e:
+            # Recorded outside the activation transaction, which rolled back;
+            # the usage rollups count these per product
+            AuditService.log_action(
+                action="activation.seat_limit_reached",
+                actor=f"license_key:{license_key}",
+                entity_type="license",
+                entity_id=e.license.id,
+                brand=catalog_cache.get_product(e.license.product_id).brand,
+                metadata={"instance_identifier": instance_identifier},
+            )
             return Response(
                 {"error": {"code": "SEAT_LIMIT_REACHED", "message": str(e)}},
                 status=status.HTTP_409_CONFLICT,
@@ -91,6 +105,8 @@ class DeactivateActivationView(APIView):
     """
 
     permission_classes = []  # Public endpoint
+    throttle_classes = [ClientIPRateThrottle, LicenseKeyRateThrottle]
+    throttle_scope = "deactivation"
 
     def delete(self, request, activation_id):
         try:
@@ -102,7 +118,7 @@ class DeactivateActivationView(APIView):
                 actor=f"license_key:{activation.license.license_key.key}",
                 entity_type="activation",
                 entity_id=activation.id,
-                brand=activation.license.product.brand,
+                brand=catalog_cache.get_product(activation.license.product_id).brand,
                 metadata={
                     "license_id": str(activation.license.id),
                     "instance_identifier": activation.instance_identifier,
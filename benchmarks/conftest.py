@@ -0,0 +1,154 @@
+import hashlib
+from dataclasses import dataclass
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.identifiers import instance_digest
+from core.models import Activation, Brand, License, LicenseKey, Product
+from core.services import EntitlementService
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """Shape of a benchmark dataset."""
+
+    brands: int
+    customers: int
+    keys_per_customer: int
+    licenses_per_key: int
+    activations_per_license: int
+
+
+DATASET_SIZES = [
+    pytest.param(DatasetSize(1, 5, 1, 1, 1), id="small"),
+    pytest.param(DatasetSize(3, 50, 2, 3, 3), id="medium"),
+    pytest.param(DatasetSize(5, 200, 3, 5, 5), id="large"),
+]
+
+
+@dataclass
+class Dataset:
+    """Handles to the rows benchmarks operate on."""
+
+    size: DatasetSize
+    brands: list
+    busiest_key: LicenseKey
+    busiest_customer: str
+    unlimited_license: License
+
+
+def build_dataset(size: DatasetSize) -> Dataset:
+    """
+    Populate the database with bulk inserts according to `size`.
+    Customer N owns `keys_per_customer` keys spread round-robin over brands,
+    each key holds `licenses_per_key` licenses with active activations.
+    """
+    brands = []
+    products = {}
+    for b in range(size.brands):
+        api_key = f"bench-api-key-{b}"
+        brand = Brand.objects.create(
+            name=f"Bench Brand {b}",
+            slug=f"bench{b}",
+            api_key_hash=hashlib.sha256(api_key.encode()).hexdigest(),
+        )
+        brand.plain_api_key = api_key
+        brands.append(brand)
+        products[brand.id] = Product.objects.bulk_create(
+            Product(
+                brand=brand,
+                name=f"Bench Product {b}-{p}",
+                slug=f"bench-product-{b}-{p}",
+                default_seat_limit=size.activations_per_license + 10,
+            )
+            for p in range(size.licenses_per_key)
+        )
+
+    license_keys = LicenseKey.objects.bulk_create(
+        LicenseKey(
+            key=f"BENCH-{c:06d}-{k:03d}",
+            brand=brands[(c + k) % size.brands],
+            customer_email=f"customer{c}@example.com",
+        )
+        for c in range(size.customers)
+        for k in range(size.keys_per_customer)
+    )
+
+    expires_at = timezone.now() + timezone.timedelta(days=365)
+    licenses = License.objects.bulk_create(
+        License(
+            license_key=license_key,
+            product=product,
+            status=License.Status.VALID,
+            expires_at=expires_at,
+        )
+        for license_key in license_keys
+        for product in products[license_key.brand_id]
+    )
+
+    Activation.objects.bulk_create(
+        (
+            Activation(
+                license=license_obj,
+                instance_identifier=identifier,
+                # bulk_create skips Activation.save()
+                instance_digest=instance_digest(identifier),
+            )
+            for license_obj in licenses
+            for a in range(size.activations_per_license)
+            for identifier in [f"https://site{a}.{license_obj.id}.example.com"]
+        ),
+        batch_size=1000,
+    )
+
+    unlimited_product = Product.objects.create(
+        brand=brands[0],
+        name="Bench Unlimited",
+        slug="bench-unlimited",
+        default_seat_limit=None,
+    )
+    unlimited_license = License.objects.create(
+        license_key=license_keys[0],
+        product=unlimited_product,
+        status=License.Status.VALID,
+    )
+    # bulk_create skips the signals that maintain the read model
+    EntitlementService.rebuild()
+
+    return Dataset(
+        size=size,
+        brands=brands,
+        busiest_key=license_keys[0],
+        busiest_customer=license_keys[0].customer_email,
+        unlimited_license=unlimited_license,
+    )
+
+
+@pytest.fixture
+def dataset(request, db):
+    """Build a dataset for an indirectly parametrized DatasetSize."""
+    return build_dataset(request.param)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def record_queries(benchmark):
+    """
+    Run `func` once outside the timed rounds and store its query count in the
+    benchmark's extra_info, so query regressions show up in the JSON output.
+    """
+
+    def record(func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            func(*args, **kwargs)
+        benchmark.extra_info["queries"] = len(ctx.captured_queries)
+
+    return record
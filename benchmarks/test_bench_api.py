@@ -0,0 +1,61 @@
+import itertools
+
+import pytest
+
+from .conftest import DATASET_SIZES
+
+pytestmark = pytest.mark.parametrize("dataset", DATASET_SIZES, indirect=True)
+
+
+def test_bench_api_license_status(benchmark, dataset, api_client, record_queries):
+    """GET /licenses/{key}/status end to end."""
+    url = f"/api/v1/licenses/{dataset.busiest_key.key}/status"
+
+    record_queries(api_client.get, url)
+    response = benchmark(api_client.get, url)
+    assert response.status_code == 200
+
+
+def test_bench_api_create_activation(benchmark, dataset, api_client, record_queries):
+    """POST /products/activations for a fresh instance."""
+    counter = itertools.count()
+    key = dataset.busiest_key.key
+
+    def activate():
+        return api_client.post(
+            "/api/v1/products/activations",
+            {
+                "license_key": key,
+                "instance_identifier": f"https://api-{next(counter)}.example.com",
+            },
+            format="json",
+        )
+
+    record_queries(activate)
+    response = benchmark(activate)
+    assert response.status_code == 201
+
+
+def test_bench_api_search_by_email(benchmark, dataset, api_client, record_queries):
+    """GET /brands/licenses/search for a multi-brand customer."""
+    api_client.credentials(HTTP_X_API_KEY=dataset.brands[0].plain_api_key)
+    url = f"/api/v1/brands/licenses/search?customer_email={dataset.busiest_customer}"
+
+    record_queries(api_client.get, url)
+    response = benchmark(api_client.get, url)
+    assert response.status_code == 200
+
+
+def test_bench_api_update_license(benchmark, dataset, api_client, record_queries):
+    """PATCH /brands/licenses/{id} toggling the status."""
+    license_obj = dataset.unlimited_license
+    api_client.credentials(HTTP_X_API_KEY=dataset.brands[0].plain_api_key)
+    url = f"/api/v1/brands/licenses/{license_obj.id}"
+    statuses = itertools.cycle(["suspended", "valid"])
+
+    def update():
+        return api_client.patch(url, {"status": next(statuses)}, format="json")
+
+    record_queries(update)
+    response = benchmark(update)
+    assert response.status_code == 200
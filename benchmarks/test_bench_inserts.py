@@ -0,0 +1,63 @@
+"""
+Insert throughput into a large table with random (uuid4) versus
+time-ordered (uuid7) primary keys. The table is prefilled with uuid4 rows,
+like a production table from before uuid7 keys, so both variants insert
+into the same index.
+"""
+
+import hashlib
+import uuid
+
+import pytest
+
+from core.ids import uuid7
+from core.models import AuditLog, Brand
+
+PREFILLED_ROWS = 200_000
+BATCH_SIZE = 1_000
+
+ID_GENERATORS = [
+    pytest.param(uuid.uuid4, id="uuid4"),
+    pytest.param(uuid7, id="uuid7"),
+]
+
+
+def _audit_rows(brand, make_id, count):
+    return (
+        AuditLog(
+            id=make_id(),
+            brand=brand,
+            action="activation.created",
+            actor="benchmark",
+            entity_type="activation",
+            entity_id=uuid.uuid4(),
+        )
+        for _ in range(count)
+    )
+
+
+@pytest.fixture
+def large_audit_table(db):
+    """An audit_logs table prefilled with PREFILLED_ROWS uuid4 rows."""
+    brand = Brand.objects.create(
+        name="Insert Bench",
+        slug="insert-bench",
+        api_key_hash=hashlib.sha256(b"insert-bench").hexdigest(),
+    )
+    AuditLog.objects.bulk_create(
+        _audit_rows(brand, uuid.uuid4, PREFILLED_ROWS), batch_size=5_000
+    )
+    return brand
+
+
+@pytest.mark.parametrize("make_id", ID_GENERATORS)
+def test_bench_insert_audit_logs(benchmark, large_audit_table, make_id):
+    """Insert BATCH_SIZE audit rows into the prefilled table."""
+
+    def insert():
+        AuditLog.objects.bulk_create(
+            _audit_rows(large_audit_table, make_id, BATCH_SIZE), batch_size=BATCH_SIZE
+        )
+
+    benchmark.extra_info["rows_per_round"] = BATCH_SIZE
+    benchmark.pedantic(insert, rounds=30, iterations=1, warmup_rounds=2)
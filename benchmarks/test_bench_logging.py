@@ -0,0 +1,90 @@
+"""
+Cost of one request's logging, as seen by the request thread: a status
+check logs one INFO line. Handlers write to a local file ("fast") or to
+an output that takes 50us per write ("slow"), like a stdout pipe whose log
+collector applies backpressure.
+
+- sync / queue: StreamHandler in the request thread versus
+  QueueListenerHandler (core/log.py)
+- sampled: QueueListenerHandler behind a SamplingFilter keeping 10%
+- disabled (fstring / lazy): the logger level discards the record;
+  an f-string still builds the message, %-style arguments do not
+"""
+
+import io
+import logging
+import time
+import uuid
+
+import pytest
+
+from core.log import QueueListenerHandler, SamplingFilter
+
+FORMAT = "{levelname} {asctime} {module} {message}"
+SLOW_WRITE = 50e-6
+ROUNDS = 5_000
+
+
+class SlowFile(io.TextIOWrapper):
+    """File whose writes block for SLOW_WRITE seconds."""
+
+    def write(self, text):
+        time.sleep(SLOW_WRITE)
+        return super().write(text)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    with open(tmp_path / "bench.log", "w") as stream:
+        yield stream
+
+
+@pytest.fixture(params=["fast", "slow"])
+def output(request, tmp_path):
+    path = tmp_path / "bench.log"
+    if request.param == "fast":
+        stream = open(path, "w")
+    else:
+        stream = SlowFile(open(path, "wb"))
+    with stream:
+        yield stream
+
+
+def make_logger(handler, level=logging.INFO, sample_rate=None):
+    handler.setFormatter(logging.Formatter(FORMAT, style="{"))
+    if sample_rate is not None:
+        handler.addFilter(SamplingFilter({"bench": sample_rate}))
+    logger = logging.Logger("bench.status", level)
+    logger.addHandler(handler)
+    return logger
+
+
+@pytest.mark.parametrize("variant", ["sync", "queue", "sampled"])
+def test_bench_log_per_request(benchmark, output, variant):
+    """One INFO line per request."""
+    if variant == "sync":
+        handler = logging.StreamHandler(output)
+    else:
+        # Unbounded: no record is dropped during the run
+        handler = QueueListenerHandler(stream=output, queue_size=0)
+    logger = make_logger(handler, sample_rate=0.1 if variant == "sampled" else None)
+    license_key = str(uuid.uuid4())
+
+    benchmark.pedantic(
+        logger.info,
+        args=("Retrieved status for license key %s", license_key),
+        rounds=ROUNDS,
+    )
+    handler.close()
+
+
+@pytest.mark.parametrize("style", ["fstring", "lazy"])
+def test_bench_log_disabled(benchmark, log_file, style):
+    """An INFO call on a logger at WARNING."""
+    logger = make_logger(logging.StreamHandler(log_file), level=logging.WARNING)
+    status = {"valid": True, "licenses": [{"seats_used": 3}] * 5}
+
+    if style == "fstring":
+        benchmark(lambda: logger.info(f"Retrieved status {status}"))
+    else:
+        benchmark(lambda: logger.info("Retrieved status %s", status))
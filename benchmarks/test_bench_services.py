@@ -0,0 +1,107 @@
+import itertools
+
+import pytest
+
+from core.models import LicenseKey
+from core.services import ActivationService, AuditService, LicenseService
+
+from .conftest import DATASET_SIZES
+
+pytestmark = pytest.mark.parametrize("dataset", DATASET_SIZES, indirect=True)
+
+
+def test_bench_activate_license(benchmark, dataset, record_queries):
+    """Activate a fresh instance on the busiest key."""
+    counter = itertools.count()
+    key = dataset.busiest_key.key
+
+    def activate():
+        return ActivationService.activate_license(
+            license_key_str=key,
+            instance_identifier=f"https://bench-{next(counter)}.example.com",
+        )
+
+    record_queries(activate)
+    benchmark(activate)
+
+
+def test_bench_activate_license_idempotent(benchmark, dataset, record_queries):
+    """Re-activate an instance that is already active."""
+    key = dataset.busiest_key.key
+    ActivationService.activate_license(key, "https://repeat.example.com")
+
+    def activate():
+        return ActivationService.activate_license(key, "https://repeat.example.com")
+
+    record_queries(activate)
+    benchmark(activate)
+
+
+def test_bench_get_license_status(benchmark, dataset, record_queries):
+    """Status check on the key with the most licenses and activations."""
+    key = dataset.busiest_key.key
+
+    record_queries(ActivationService.get_license_status, key)
+    benchmark(ActivationService.get_license_status, key)
+
+
+@pytest.mark.parametrize("mode", ["per_key", "batch"])
+def test_bench_get_license_statuses(benchmark, dataset, record_queries, settings, mode):
+    """Cold status check of 100 keys: one call per key versus one batch call."""
+    settings.STATUS_CACHE_ENABLED = False
+    keys = list(LicenseKey.objects.order_by("key").values_list("key", flat=True)[:100])
+
+    def per_key():
+        return [ActivationService.get_license_status(key) for key in keys]
+
+    def batch():
+        return ActivationService.get_license_statuses(keys)
+
+    check = per_key if mode == "per_key" else batch
+    record_queries(check)
+    benchmark(check)
+
+
+def test_bench_get_licenses_by_email(benchmark, dataset, record_queries):
+    """Cross-brand email search for a customer owning several keys."""
+    email = dataset.busiest_customer
+
+    record_queries(LicenseService.get_licenses_by_email, email)
+    benchmark(LicenseService.get_licenses_by_email, email)
+
+
+def test_bench_bulk_create_licenses(benchmark, dataset):
+    """Provision 50 licenses for new customers, one service call each."""
+    brand = dataset.brands[0]
+    product_slug = brand.products.order_by("slug").first().slug
+    counter = itertools.count()
+
+    def create_batch():
+        batch = next(counter)
+        for i in range(50):
+            LicenseService.create_license(
+                brand=brand,
+                customer_email=f"bulk{batch}-{i}@example.com",
+                product_slug=product_slug,
+            )
+
+    benchmark.pedantic(create_batch, rounds=5, iterations=1)
+
+
+def test_bench_audit_log_action(benchmark, dataset, record_queries):
+    """Write a single audit entry."""
+    brand = dataset.brands[0]
+    license_obj = dataset.unlimited_license
+
+    def log():
+        return AuditService.log_action(
+            action="license.updated",
+            actor=f"brand:{brand.slug}",
+            entity_type="license",
+            entity_id=license_obj.id,
+            brand=brand,
+            metadata={"status": "valid"},
+        )
+
+    record_queries(log)
+    benchmark(log)
@@ -1,6 +1,144 @@
+import json
+
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .identifiers import instance_digest
+from .models import (
+    Activation,
+    ActivationHistory,
+    AuditLog,
+    Brand,
+    License,
+    LicenseKey,
+    Product,
+)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for tables with millions of rows. On PostgreSQL the row count
+    comes from planner statistics: `pg_class.reltuples` for the whole
+    table, the `EXPLAIN` row estimate for a filtered changelist. Only
+    counts estimated below ADMIN_EXACT_COUNT_LIMIT are counted exactly, so
+    page numbers of large results are approximate.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self._estimate()
+        if estimate is None or estimate < settings.ADMIN_EXACT_COUNT_LIMIT:
+            return super().count
+        return estimate
+
+    def _estimate(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # -1 until the table is first vacuumed or analyzed
+                return row[0] if row and row[0] >= 0 else None
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class RecentValuesFilter(admin.SimpleListFilter):
+    """
+    Filter on the distinct values of `field_name` among the newest
+    `sample_size` rows, instead of a SELECT DISTINCT over the whole table.
+    """
+
+    field_name = None
+    sample_size = 10_000
+
+    def lookups(self, request, model_admin):
+        recent = model_admin.model._default_manager.order_by("-created_at").values_list(
+            self.field_name, flat=True
+        )[: self.sample_size]
+        return [(value, value) for value in sorted(set(recent))]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.field_name: self.value()})
+        return queryset
+
+
+class ActionFilter(RecentValuesFilter):
+    title = "action"
+    parameter_name = "action"
+    field_name = "action"
+
+
+class EntityTypeFilter(RecentValuesFilter):
+    title = "entity type"
+    parameter_name = "entity_type"
+    field_name = "entity_type"
+
 
-from .models import Activation, AuditLog, Brand, License, LicenseKey, Product
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Base admin for tables with millions of rows.
+
+    The changelist counts rows with EstimatedCountPaginator and skips the
+    second, unfiltered count. Search replaces the default `icontains`
+    lookups, which scan the table, with index-backed ones:
+    `exact_search_fields` match the term exactly (fields whose type cannot
+    hold the term are skipped) and `prefix_search_fields` match it as a
+    prefix.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    exact_search_fields = ()
+    prefix_search_fields = ()
+
+    def get_search_fields(self, request):
+        return [*self.exact_search_fields, *self.prefix_search_fields]
+
+    def search_lookups(self, term: str) -> list[Q]:
+        lookups = []
+        for name in self.exact_search_fields:
+            field = get_fields_from_path(self.model, name)[-1]
+            try:
+                value = field.to_python(term)
+            except ValidationError:
+                continue
+            lookups.append(Q(**{name: value}))
+        for name in self.prefix_search_fields:
+            lookups.append(Q(**{f"{name}__startswith": term}))
+        return lookups
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        lookups = self.search_lookups(term)
+        if not lookups:
+            return queryset.none(), False
+        # One subquery per lookup, each served by its own index: an OR
+        # across joined tables would make the planner scan instead
+        matches = [
+            self.model._default_manager.filter(lookup).values("pk").order_by()
+            for lookup in lookups
+        ]
+        return queryset.filter(pk__in=matches[0].union(*matches[1:])), False
 
 
 @admin.register(Brand)
@@ -14,20 +152,25 @@ class BrandAdmin(admin.ModelAdmin):
 class ProductAdmin(admin.ModelAdmin):
     list_display = ["name", "brand", "slug", "default_seat_limit", "created_at"]
     list_filter = ["brand"]
+    list_select_related = ["brand"]
     search_fields = ["name", "slug"]
+    autocomplete_fields = ["brand"]
     readonly_fields = ["id", "created_at", "updated_at"]
 
 
 @admin.register(LicenseKey)
-class LicenseKeyAdmin(admin.ModelAdmin):
+class LicenseKeyAdmin(LargeTableAdmin):
     list_display = ["key", "brand", "customer_email", "created_at"]
     list_filter = ["brand"]
-    search_fields = ["key", "customer_email"]
+    list_select_related = ["brand"]
+    exact_search_fields = ["customer_email"]
+    prefix_search_fields = ["key"]
+    autocomplete_fields = ["brand"]
     readonly_fields = ["id", "key", "created_at", "updated_at"]
 
 
 @admin.register(License)
-class LicenseAdmin(admin.ModelAdmin):
+class LicenseAdmin(LargeTableAdmin):
     list_display = [
         "license_key",
         "product",
@@ -37,12 +180,15 @@ class LicenseAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["status", "product__brand"]
-    search_fields = ["license_key__key", "product__name"]
+    list_select_related = ["license_key", "product__brand"]
+    exact_search_fields = ["id", "license_key__key", "license_key__customer_email"]
+    raw_id_fields = ["license_key"]
+    autocomplete_fields = ["product"]
     readonly_fields = ["id", "created_at", "updated_at"]
 
 
 @admin.register(Activation)
-class ActivationAdmin(admin.ModelAdmin):
+class ActivationAdmin(LargeTableAdmin):
     list_display = [
         "license",
         "instance_identifier",
@@ -50,13 +196,39 @@ class ActivationAdmin(admin.ModelAdmin):
         "deactivated_at",
     ]
     list_filter = ["deactivated_at"]
-    search_fields = ["license__license_key__key", "instance_identifier"]
+    list_select_related = ["license__license_key", "license__product__brand"]
+    exact_search_fields = ["id", "license__license_key__key"]
+    raw_id_fields = ["license"]
     readonly_fields = ["id", "activated_at"]
 
+    def search_lookups(self, term: str) -> list[Q]:
+        # Any spelling of an instance identifier finds it by its digest
+        return [*super().search_lookups(term), Q(instance_digest=instance_digest(term))]
+
+
+@admin.register(ActivationHistory)
+class ActivationHistoryAdmin(LargeTableAdmin):
+    list_display = [
+        "license",
+        "instance_identifier",
+        "activated_at",
+        "deactivated_at",
+        "archived_at",
+    ]
+    list_select_related = ["license__license_key", "license__product__brand"]
+    exact_search_fields = ["id", "license__license_key__key"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(AuditLog)
-class AuditLogAdmin(admin.ModelAdmin):
+class AuditLogAdmin(LargeTableAdmin):
     list_display = ["action", "entity_type", "entity_id", "actor", "created_at"]
-    list_filter = ["action", "entity_type", "brand"]
-    search_fields = ["actor", "entity_id"]
+    list_filter = [ActionFilter, EntityTypeFilter, "brand"]
+    exact_search_fields = ["id", "entity_id"]
+    autocomplete_fields = ["brand"]
     readonly_fields = ["id", "created_at"]
@@ -0,0 +1,140 @@
+"""
+Bloom filter of license keys, used to reject unknown keys without a query.
+
+A Bloom filter never forgets a key it was given, so the only risk is a key
+created after the filter was built. Every license key creation stamps
+CHANGED_KEY in the CATALOG_CACHE_ALIAS cache after commit.
+On a negative answer the filter compares that stamp with its own watermark
+and, when newer keys exist, first adds every key created since the watermark
+(minus LICENSE_KEY_FILTER_OVERLAP seconds for transactions that were still
+open). The shared cache is therefore only read for keys the filter rejects.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from core.models import LicenseKey
+
+logger = logging.getLogger(__name__)
+
+CHANGED_KEY = "license_keys:changed_at"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for `capacity` items at `error_rate`
+    false positives, using double hashing over one blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.size = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class LicenseKeyFilter:
+    """
+    Worker-local Bloom filter over LicenseKey.key. Answers "might exist"
+    until built, and always when LICENSE_KEY_FILTER_ENABLED is off.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.watermark = None
+        self.caught_up_at = 0.0
+
+    def build(self) -> int:
+        """Load every license key. Returns the number of keys loaded."""
+        watermark = timezone.now()
+        # Headroom so keys created during the worker's lifetime keep the
+        # false positive rate near the target
+        capacity = int(LicenseKey.objects.count() * 1.2) + 10_000
+        bloom = BloomFilter(capacity, settings.LICENSE_KEY_FILTER_ERROR_RATE)
+        for key in LicenseKey.objects.values_list("key", flat=True).iterator(
+            chunk_size=10_000
+        ):
+            bloom.add(key)
+
+        with self.lock:
+            self.bloom, self.watermark = bloom, watermark
+
+        logger.info("Built license key filter with %s keys", bloom.count)
+
+        return bloom.count
+
+    def clear(self):
+        with self.lock:
+            self.bloom = self.watermark = None
+
+    def might_contain(self, key: str) -> bool:
+        """False only if `key` is certainly not a license key."""
+        bloom = self.bloom
+        if bloom is None or not settings.LICENSE_KEY_FILTER_ENABLED:
+            return True
+        if key in bloom:
+            return True
+
+        changed_at = caches[settings.CATALOG_CACHE_ALIAS].get(CHANGED_KEY)
+        if changed_at is None or changed_at < self.watermark:
+            return False
+        # Newer keys exist. Catch up at most once per check interval and let
+        # the database answer in between.
+        now = time.monotonic()
+        if now - self.caught_up_at < settings.CATALOG_CACHE_CHECK_INTERVAL:
+            return True
+        self.caught_up_at = now
+        self._catch_up()
+        return key in self.bloom
+
+    def _catch_up(self):
+        watermark = timezone.now()
+        since = self.watermark - timedelta(seconds=settings.LICENSE_KEY_FILTER_OVERLAP)
+        keys = LicenseKey.objects.filter(created_at__gte=since).values_list(
+            "key", flat=True
+        )
+        with self.lock:
+            for key in keys:
+                self.bloom.add(key)
+            self.watermark = watermark
+
+    def key_created(self, key: str):
+        """Record a committed license key for this and every other worker."""
+        if self.bloom is not None:
+            with self.lock:
+                self.bloom.add(key)
+        caches[settings.CATALOG_CACHE_ALIAS].set(
+            CHANGED_KEY, timezone.now(), timeout=None
+        )
+
+
+license_key_filter = LicenseKeyFilter()
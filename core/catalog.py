@@ -0,0 +1,166 @@
+"""
+In-process read-through cache for Brand and Product rows.
+
+Brands and products change rarely but are read on nearly every request
+(authentication, license creation, response serialization). Each worker
+keeps them in memory, keyed by id, API key hash and (brand, slug).
+
+Invalidation: saving or deleting a Brand or Product clears the local cache
+and bumps a version counter in the CATALOG_CACHE_ALIAS Django cache. Every
+worker compares that version at most once per CATALOG_CACHE_CHECK_INTERVAL
+seconds and drops its entries when it changed, so other workers converge
+within the interval. CATALOG_CACHE_TTL bounds staleness if the shared cache
+is unavailable or process-local (LocMem): if the version cannot be bumped,
+the saving worker still drops its own entries and moves to a local version,
+and the write goes through. Cached instances are shared
+between requests and must be treated as read-only.
+"""
+
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core import metrics
+from core.models import Brand, Product
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "catalog:version"
+
+
+class CatalogCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.generation = 0
+        self.version = None
+        self.checked_at = 0.0
+        self.loaded_at = 0.0
+
+    def get_brand(self, brand_id) -> Brand | None:
+        return self._get(
+            ("brand", str(brand_id)),
+            lambda: Brand.objects.filter(id=brand_id).first(),
+        )
+
+    def get_brand_by_api_key_hash(self, api_key_hash: str) -> Brand | None:
+        return self._get(
+            ("brand_api_key", api_key_hash),
+            lambda: Brand.objects.filter(api_key_hash=api_key_hash).first(),
+            requests_counter=metrics.AUTH_CACHE_REQUESTS,
+        )
+
+    def get_product(self, product_id) -> Product | None:
+        return self._get(
+            ("product", str(product_id)),
+            lambda: Product.objects.select_related("brand")
+            .filter(id=product_id)
+            .first(),
+        )
+
+    def get_product_by_slug(self, brand_id, slug: str) -> Product | None:
+        return self._get(
+            ("product_slug", str(brand_id), slug),
+            lambda: Product.objects.select_related("brand")
+            .filter(brand_id=brand_id, slug=slug)
+            .first(),
+        )
+
+    def get_version(self):
+        """
+        Version of the catalog this worker serves; changes whenever a brand
+        or product is edited (seen by other workers within the check interval).
+        """
+        self._sync()
+        return self.version
+
+    def preload(self) -> int:
+        """Load every brand and product. Returns the number of rows loaded."""
+        self._sync()
+        generation = self.generation
+        entries = {}
+        brands = {}
+        for brand in Brand.objects.all():
+            brands[brand.id] = brand
+            entries[("brand", str(brand.id))] = brand
+            entries[("brand_api_key", brand.api_key_hash)] = brand
+        products = list(Product.objects.all())
+        for product in products:
+            product.brand = brands[product.brand_id]
+            entries[("product", str(product.id))] = product
+            entries[("product_slug", str(product.brand_id), product.slug)] = product
+
+        with self.lock:
+            if generation == self.generation:
+                self.entries.update(entries)
+        return len(brands) + len(products)
+
+    def _get(self, key: tuple, loader, requests_counter=None):
+        self._sync()
+        try:
+            value = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            if requests_counter is not None:
+                requests_counter.labels(result="hit").inc()
+            return value
+
+        if requests_counter is not None:
+            requests_counter.labels(result="miss").inc()
+
+        generation = self.generation
+        value = loader()
+        # Misses are not cached: unknown keys must not grow the cache
+        if value is not None:
+            with self.lock:
+                # Skip the store if an invalidation raced with the load
+                if generation == self.generation:
+                    self.entries[key] = value
+        return value
+
+    def _sync(self):
+        now = time.monotonic()
+        if now - self.checked_at < settings.CATALOG_CACHE_CHECK_INTERVAL:
+            return
+        self.checked_at = now
+
+        try:
+            version = caches[settings.CATALOG_CACHE_ALIAS].get(VERSION_KEY, 0)
+        except Exception:
+            version = self.version
+
+        if version != self.version or now - self.loaded_at > settings.CATALOG_CACHE_TTL:
+            self.clear()
+            self.version = version
+            self.loaded_at = now
+
+    def clear(self):
+        """Drop this worker's entries."""
+        with self.lock:
+            self.entries = {}
+            self.generation += 1
+
+    def invalidate(self):
+        """Drop local entries and tell every other worker to do the same."""
+        self.clear()
+        cache = caches[settings.CATALOG_CACHE_ALIAS]
+        try:
+            try:
+                self.version = cache.incr(VERSION_KEY)
+            except ValueError:
+                cache.add(VERSION_KEY, 1, timeout=None)
+        except Exception as e:
+            # Other workers see the change within CATALOG_CACHE_TTL; this one
+            # stops using status cache entries of the old version now
+            self.version = f"local:{uuid.uuid4().hex}"
+            logger.warning(
+                "Could not bump the catalog version: %s: %s", type(e).__name__, e
+            )
+
+
+catalog_cache = CatalogCache()
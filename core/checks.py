@@ -0,0 +1,42 @@
+"""
+System checks of deployment settings, run by `manage.py check` and
+`manage.py migrate` (which the container entrypoint runs before starting).
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+PROCESS_LOCAL_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@register(Tags.caches, deploy=False)
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Cache aliases that carry invalidations between processes must not be
+    process-local: with several uWSGI processes and a job worker, a change
+    made in one would go unnoticed by the others until entries expire.
+    """
+    aliases = {"CATALOG_CACHE_ALIAS": settings.CATALOG_CACHE_ALIAS}
+    if settings.STATUS_CACHE_ENABLED:
+        aliases["STATUS_CACHE_ALIAS"] = settings.STATUS_CACHE_ALIAS
+    if settings.RATE_LIMIT_BACKEND == "cache":
+        aliases["RATE_LIMIT_CACHE"] = settings.RATE_LIMIT_CACHE
+
+    # Single-process setups (tests, runserver) may use a local cache
+    level = Warning if settings.DEBUG else Error
+    messages = []
+    for setting, alias in aliases.items():
+        backend = settings.CACHES.get(alias, {}).get("BACKEND")
+        if backend in PROCESS_LOCAL_BACKENDS:
+            messages.append(
+                level(
+                    f"{setting} points at the process-local cache {alias!r} "
+                    f"({backend}).",
+                    hint="Configure a cache shared by all processes (REDIS_URL).",
+                    id="core.E001" if level is Error else "core.W001",
+                )
+            )
+    return messages
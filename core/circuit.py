@@ -0,0 +1,75 @@
+"""
+Per-process circuit breaker for calls to a dependency that may fail as a
+whole (the database during an outage).
+
+Closed: calls go through. After `failure_threshold` consecutive failures the
+circuit opens and `allow()` refuses calls for `reset_timeout` seconds, so a
+failing database is not hit by every request. Then one trial call goes
+through (half-open): its success closes the circuit, its failure opens it
+again.
+"""
+
+import logging
+import threading
+import time
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may go through now."""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # Let one trial call through; another one only if this one
+                # never reports back
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit %s closed", self.name)
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                metrics.CIRCUIT_OPENED.labels(circuit=self.name).inc()
+                logger.warning(
+                    "Circuit %s opened after %s failures", self.name, self.failures
+                )
@@ -0,0 +1,444 @@
+"""
+Synthetic dataset generation for benchmarking, load testing and EXPLAIN work.
+
+Rows are produced from a seeded random generator, so the same seed and
+reference time always yield the same brands, keys, licenses, activations
+and audit entries. Bulk rows bypass the ORM: PostgreSQL receives them via
+COPY, other backends via executemany.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.utils import timezone
+
+from core.identifiers import instance_digest
+from core.models import (
+    Activation,
+    ActivationHistory,
+    AuditLog,
+    Brand,
+    Entitlement,
+    License,
+    LicenseKey,
+    OutboxEvent,
+    Product,
+    UsageRollup,
+)
+from core.services.entitlement_service import EntitlementService
+
+# Column order of the tuples produced for each bulk-loaded model
+COLUMNS = {
+    LicenseKey: ["id", "key", "brand_id", "customer_email", "created_at", "updated_at"],
+    License: [
+        "id",
+        "license_key_id",
+        "product_id",
+        "status",
+        "expires_at",
+        "seat_limit",
+        "created_at",
+        "updated_at",
+    ],
+    Activation: [
+        "id",
+        "license_id",
+        "instance_identifier",
+        "instance_digest",
+        "activated_at",
+        "deactivated_at",
+        "metadata",
+    ],
+    AuditLog: [
+        "id",
+        "brand_id",
+        "action",
+        "actor",
+        "entity_type",
+        "entity_id",
+        "metadata",
+        "created_at",
+    ],
+}
+
+PLUGIN_VERSIONS = ["1.0.0", "1.2.3", "2.0.0", "2.1.4", "3.0.0-beta"]
+
+
+@dataclass
+class DatasetConfig:
+    """Knobs for a synthetic dataset."""
+
+    seed: int = 42
+    brands: int = 5
+    products_per_brand: int = 3
+    customers: int = 10_000
+    max_keys_per_customer: int = 20
+    history_days: int = 730
+    chunk_size: int = 50_000
+    manifest_sample_size: int = 1_000
+    as_of: datetime = None
+
+
+def _copy_value(value):
+    """Render a value for COPY ... WITH (FORMAT csv); unquoted empty is NULL."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    return value
+
+
+def brand_api_key(slug: str, seed: int) -> str:
+    """Plain API key of a generated brand, reproducible from the seed."""
+    return f"dataset-{slug}-{seed}"
+
+
+class BulkWriter:
+    """
+    Buffers row tuples per model and writes them in FK order once any buffer
+    reaches `chunk_size`.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.buffers = {model: [] for model in COLUMNS}
+        self.counts = {model: 0 for model in COLUMNS}
+
+    def add(self, model, row: tuple):
+        buffer = self.buffers[model]
+        buffer.append(row)
+        if len(buffer) >= self.chunk_size:
+            self.flush()
+
+    @transaction.atomic
+    def flush(self):
+        with connection.cursor() as cursor:
+            for model, rows in self.buffers.items():
+                if not rows:
+                    continue
+                if connection.vendor == "postgresql":
+                    self._copy(cursor, model, rows)
+                else:
+                    self._insert(cursor, model, rows)
+                self.counts[model] += len(rows)
+                rows.clear()
+
+    @staticmethod
+    def _copy(cursor, model, rows):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow([_copy_value(value) for value in row])
+        buf.seek(0)
+
+        columns = ", ".join(
+            connection.ops.quote_name(model._meta.get_field(name).column)
+            for name in COLUMNS[model]
+        )
+        cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buf,
+        )
+
+    @staticmethod
+    def _insert(cursor, model, rows):
+        db = connections[DEFAULT_DB_ALIAS]
+        native_uuid = db.features.has_native_uuid_field
+        adapt_datetime = db.ops.adapt_datetimefield_value
+
+        def prep(value):
+            # Avoid Field.get_db_prep_save: it is the bottleneck at this volume
+            if isinstance(value, uuid.UUID) and not native_uuid:
+                return value.hex
+            if isinstance(value, datetime):
+                return adapt_datetime(value)
+            if isinstance(value, dict):
+                return json.dumps(value)
+            return value
+
+        fields = [model._meta.get_field(name) for name in COLUMNS[model]]
+        columns = ", ".join(db.ops.quote_name(f.column) for f in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        cursor.executemany(
+            f"INSERT INTO {db.ops.quote_name(model._meta.db_table)} "
+            f"({columns}) VALUES ({placeholders})",
+            [[prep(value) for value in row] for row in rows],
+        )
+
+
+class DatasetGenerator:
+    """
+    Generates a production-shaped dataset:
+
+    - customers own a Pareto-distributed number of keys (most have one,
+      a long tail owns many), spread over brands with skewed popularity
+    - keys carry one to three products of their brand
+    - licenses are mostly valid, some suspended/cancelled, some expired
+    - activations include historic deactivations and never exceed the
+      effective seat limit with active rows
+    - every license, activation and deactivation has its audit entry
+    """
+
+    def __init__(self, config: DatasetConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.as_of = config.as_of or timezone.now().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self.writer = BulkWriter(config.chunk_size)
+        self.manifest = {
+            "seed": config.seed,
+            "as_of": self.as_of.isoformat(),
+            "brands": [],
+            "license_keys": [],
+            "customer_emails": [],
+            "licenses": [],
+        }
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _past(self, start: datetime, max_days: float) -> datetime:
+        """Random moment between `start` and `start + max_days`, capped at as_of."""
+        moment = start + timedelta(seconds=self.rng.uniform(0, max_days * 86400))
+        return min(moment, self.as_of)
+
+    def _create_catalog(self):
+        """Brands and products are few, so they go through the ORM."""
+        catalog = []
+        for b in range(self.config.brands):
+            slug = f"dsbrand{b}"
+            brand = Brand.objects.create(
+                id=self._uuid(),
+                name=f"Dataset Brand {b}",
+                slug=slug,
+                api_key_hash=hashlib.sha256(
+                    brand_api_key(slug, self.config.seed).encode()
+                ).hexdigest(),
+            )
+            products = [
+                Product.objects.create(
+                    id=self._uuid(),
+                    brand=brand,
+                    name=f"Dataset Product {b}-{p}",
+                    slug=f"dsproduct-{b}-{p}",
+                    default_seat_limit=self.rng.choice([1, 3, 5, 25, None]),
+                )
+                for p in range(self.config.products_per_brand)
+            ]
+            catalog.append((brand, products))
+            self.manifest["brands"].append(
+                {
+                    "id": str(brand.id),
+                    "slug": slug,
+                    "api_key": brand_api_key(slug, self.config.seed),
+                }
+            )
+        return catalog
+
+    def _sample(self, name: str, value):
+        sample = self.manifest[name]
+        if len(sample) < self.config.manifest_sample_size:
+            sample.append(value)
+
+    def run(self) -> dict:
+        """Generate the dataset and return a manifest describing it."""
+        started = time.perf_counter()
+        if connection.vendor == "sqlite" and not connection.in_atomic_block:
+            with connection.cursor() as cursor:
+                # Local databases only: trade durability for load speed
+                cursor.execute("PRAGMA synchronous = OFF")
+                cursor.execute("PRAGMA cache_size = -262144")
+
+        catalog = self._create_catalog()
+        brand_weights = [1 / (b + 1) for b in range(len(catalog))]
+
+        for c in range(self.config.customers):
+            email = f"customer{c}@example.com"
+            key_count = min(
+                self.config.max_keys_per_customer,
+                int(self.rng.paretovariate(1.5)),
+            )
+            if key_count > 1:
+                self._sample("customer_emails", email)
+
+            for _ in range(key_count):
+                brand, products = self.rng.choices(catalog, brand_weights)[0]
+                self._generate_key(brand, products, email)
+
+        self.writer.flush()
+        # Bulk rows bypass the signals that maintain the read model
+        entitlements = EntitlementService.rebuild()
+        elapsed = time.perf_counter() - started
+
+        self.manifest["counts"] = {
+            model._meta.db_table: count for model, count in self.writer.counts.items()
+        }
+        self.manifest["counts"][Entitlement._meta.db_table] = entitlements
+        self.manifest["elapsed_seconds"] = round(elapsed, 3)
+        return self.manifest
+
+    def _generate_key(self, brand: Brand, products: list, email: str):
+        rng = self.rng
+        key_id = self._uuid()
+        key = f"{brand.slug.upper()}-{self._uuid()}"
+        key_created = self._past(
+            self.as_of - timedelta(days=self.config.history_days),
+            self.config.history_days,
+        )
+        self.writer.add(
+            LicenseKey, (key_id, key, brand.id, email, key_created, key_created)
+        )
+
+        product_count = min(len(products), rng.choices([1, 2, 3], [70, 20, 10])[0])
+        has_valid = False
+        for product in rng.sample(products, product_count):
+            license_id = self._uuid()
+            created = self._past(key_created, 30)
+
+            roll = rng.random()
+            if roll < 0.85:
+                status = License.Status.VALID
+            elif roll < 0.95:
+                status = License.Status.CANCELLED
+            else:
+                status = License.Status.SUSPENDED
+            expires_at = None if rng.random() < 0.25 else created + timedelta(days=365)
+            seat_limit = None if rng.random() < 0.8 else rng.choice([1, 3, 5, 10, 25])
+
+            self.writer.add(
+                License,
+                (
+                    license_id,
+                    key_id,
+                    product.id,
+                    status,
+                    expires_at,
+                    seat_limit,
+                    created,
+                    created,
+                ),
+            )
+            self.writer.add(
+                AuditLog,
+                (
+                    self._uuid(),
+                    brand.id,
+                    "license.created",
+                    f"brand:{brand.slug}",
+                    "license",
+                    license_id,
+                    {"product_slug": product.slug, "customer_email": email},
+                    created,
+                ),
+            )
+
+            if status == License.Status.VALID:
+                has_valid = True
+                self._sample("licenses", {"id": str(license_id), "brand": brand.slug})
+
+            limit = seat_limit or product.default_seat_limit or 10
+            self._generate_activations(brand, license_id, key, created, limit)
+
+        if has_valid:
+            self._sample("license_keys", key)
+
+    def _generate_activations(
+        self, brand: Brand, license_id, key: str, created: datetime, limit: int
+    ):
+        rng = self.rng
+        active = 0
+        for _ in range(min(limit * 3, int(rng.paretovariate(1.2)) - 1)):
+            activation_id = self._uuid()
+            activated_at = self._past(created, 365)
+            deactivated_at = None
+            if active >= limit or rng.random() < 0.3:
+                deactivated_at = self._past(activated_at, 180)
+            else:
+                active += 1
+            identifier = f"https://site{rng.getrandbits(40):010x}.example.com"
+            metadata = {"plugin_version": rng.choice(PLUGIN_VERSIONS)}
+
+            self.writer.add(
+                Activation,
+                (
+                    activation_id,
+                    license_id,
+                    identifier,
+                    instance_digest(identifier),
+                    activated_at,
+                    deactivated_at,
+                    metadata,
+                ),
+            )
+            audit_metadata = {
+                "license_id": str(license_id),
+                "instance_identifier": identifier,
+            }
+            self.writer.add(
+                AuditLog,
+                (
+                    self._uuid(),
+                    brand.id,
+                    "activation.created",
+                    f"license_key:{key}",
+                    "activation",
+                    activation_id,
+                    audit_metadata,
+                    activated_at,
+                ),
+            )
+            if deactivated_at is not None:
+                self.writer.add(
+                    AuditLog,
+                    (
+                        self._uuid(),
+                        brand.id,
+                        "activation.deactivated",
+                        f"license_key:{key}",
+                        "activation",
+                        activation_id,
+                        audit_metadata,
+                        deactivated_at,
+                    ),
+                )
+
+
+def flush_dataset():
+    """Remove every licensing row, children first."""
+    models = [
+        OutboxEvent,
+        UsageRollup,
+        Entitlement,
+        AuditLog,
+        ActivationHistory,
+        Activation,
+        License,
+        LicenseKey,
+        Product,
+        Brand,
+    ]
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            tables = ", ".join(
+                connection.ops.quote_name(m._meta.db_table) for m in models
+            )
+            cursor.execute(f"TRUNCATE {tables} CASCADE")
+        else:
+            for model in models:
+                cursor.execute(
+                    f"DELETE FROM {connection.ops.quote_name(model._meta.db_table)}"
+                )
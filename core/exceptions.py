@@ -19,7 +19,10 @@ class LicenseCancelledError(LicenseServiceException):
 
 
 class SeatLimitReachedError(LicenseServiceException):
-    pass
+    def __init__(self, message: str = "", license=None):
+        super().__init__(message)
+        # The license whose seats are exhausted, for audit and analytics
+        self.license = license
 
 
 class ProductNotFoundError(LicenseServiceException):
@@ -44,3 +47,7 @@ class BrandNotFoundError(LicenseServiceException):
 
 class ActivationNotFoundError(LicenseServiceException):
     pass
+
+
+class StatusUnavailableError(LicenseServiceException):
+    pass
@@ -0,0 +1,35 @@
+"""
+Normalization and hashing of activation instance identifiers.
+
+Clients send the same site in many spellings (`https://Site.com/`,
+`site.com`, `http://www.site.com:80`). Identifiers are normalized before
+hashing, and activations are looked up by the 16-byte digest of the
+normalized form instead of the raw string of up to 500 characters.
+"""
+
+import hashlib
+import re
+
+DIGEST_SIZE = 16
+
+_SCHEME = re.compile(r"^https?://")
+_DEFAULT_PORT = re.compile(r":(80|443)$")
+
+
+def normalize_instance_identifier(value: str) -> str:
+    """
+    Canonical form of an instance identifier: trimmed and lowercased,
+    without http(s) scheme, leading "www.", default port or trailing
+    slashes. Identifiers that are not URLs only get trimmed and lowercased.
+    """
+    identifier = _SCHEME.sub("", value.strip().lower())
+    host, slash, path = identifier.partition("/")
+    host = _DEFAULT_PORT.sub("", host.removeprefix("www."))
+    return f"{host}{slash}{path}".rstrip("/")
+
+
+def instance_digest(value: str) -> bytes:
+    """Fixed-size digest of the normalized identifier, used for lookups."""
+    return hashlib.blake2b(
+        normalize_instance_identifier(value).encode(), digest_size=DIGEST_SIZE
+    ).digest()
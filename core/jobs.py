@@ -0,0 +1,318 @@
+"""
+Database-backed background job queue.
+
+Jobs are rows in the `jobs` table. A worker claims the oldest due job with
+`SELECT ... FOR UPDATE SKIP LOCKED` on PostgreSQL, so any number of workers
+share the queue without blocking each other. Databases without SKIP LOCKED
+(SQLite) fall back to a conditional UPDATE: a worker only runs a job if its
+`queued -> running` transition matched the row.
+
+A claimed job is leased for JOB_LEASE seconds, and the lease is renewed
+every JOB_HEARTBEAT_INTERVAL seconds while the job runs; jobs of a worker
+that died become due again once the lease runs out. Failed jobs are
+retried with doubling delays up to `max_attempts`. Recurring jobs come
+from JOB_SCHEDULE: every worker enqueues the current interval's run under
+a unique key, so exactly one run per interval is queued however many
+workers there are.
+
+Tasks are plain functions registered with `@task` in core/tasks.py and take
+JSON-serializable keyword arguments.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.utils import timezone
+
+from core import metrics
+from core.models import Job
+
+logger = logging.getLogger(__name__)
+
+TASKS = {}
+
+
+def task(name: str, max_attempts: int = 3):
+    """Register a function as a job task under `name`."""
+
+    def decorator(func):
+        func.max_attempts = max_attempts
+        TASKS[name] = func
+        return func
+
+    return decorator
+
+
+def get_task(name: str):
+    # Importing the module registers the built-in tasks
+    from core import tasks  # noqa: F401
+
+    try:
+        return TASKS[name]
+    except KeyError:
+        raise ValueError(f"Unknown task: {name}")
+
+
+def enqueue(name: str, run_at=None, unique_key: str = None, **kwargs) -> Job | None:
+    """
+    Queue a run of task `name` (at `run_at`, default now). With a
+    `unique_key`, returns None if a job with that key already exists.
+    """
+    func = get_task(name)
+    job = Job(
+        task=name,
+        kwargs=kwargs,
+        run_at=run_at or timezone.now(),
+        max_attempts=func.max_attempts,
+        unique_key=unique_key,
+    )
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        if unique_key is None:
+            raise
+        return None
+    return job
+
+
+def schedule_recurring(now=None) -> int:
+    """
+    Enqueue the current run of every JOB_SCHEDULE task that has none yet.
+    Returns the number of jobs created.
+    """
+    now = now or timezone.now()
+    timestamp = int(now.timestamp())
+    jobs = []
+    for name, interval in settings.JOB_SCHEDULE.items():
+        slot = timestamp - timestamp % int(interval)
+        jobs.append(
+            Job(
+                task=name,
+                run_at=datetime.fromtimestamp(slot, tz=dt_timezone.utc),
+                max_attempts=1,
+                unique_key=f"schedule:{name}:{slot}",
+            )
+        )
+    existing = set(
+        Job.objects.filter(unique_key__in=[job.unique_key for job in jobs]).values_list(
+            "unique_key", flat=True
+        )
+    )
+    missing = [job for job in jobs if job.unique_key not in existing]
+    Job.objects.bulk_create(missing, ignore_conflicts=True)
+    return len(missing)
+
+
+def claim(worker_id: str, now=None) -> Job | None:
+    """Claim the oldest due job for `worker_id`, or return None."""
+    now = now or timezone.now()
+    lease = {
+        "status": Job.Status.RUNNING,
+        "locked_by": worker_id,
+        "locked_until": now + timedelta(seconds=settings.JOB_LEASE),
+        "started_at": now,
+    }
+    with transaction.atomic():
+        due = Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=now).order_by(
+            "run_at", "id"
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        job = due.first()
+        if job is None:
+            return None
+        # Without SKIP LOCKED another worker may have taken it meanwhile
+        if not Job.objects.filter(id=job.id, status=Job.Status.QUEUED).update(**lease):
+            return None
+
+    for field, value in lease.items():
+        setattr(job, field, value)
+    return job
+
+
+def requeue_expired(now=None) -> int:
+    """Make running jobs whose lease expired (dead worker) due again."""
+    now = now or timezone.now()
+    return Job.objects.filter(status=Job.Status.RUNNING, locked_until__lt=now).update(
+        status=Job.Status.QUEUED, run_at=now, locked_by="", locked_until=None
+    )
+
+
+class _Heartbeat:
+    """
+    Renews the lease of a running job every JOB_HEARTBEAT_INTERVAL seconds
+    from a background thread, so that jobs running longer than JOB_LEASE
+    are not requeued and run a second time.
+    """
+
+    def __init__(self, job: Job):
+        self.job = job
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name=f"heartbeat-{job.id}", daemon=True
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopping.set()
+        self.thread.join()
+
+    def _run(self):
+        try:
+            while not self.stopping.wait(settings.JOB_HEARTBEAT_INTERVAL):
+                try:
+                    renewed = Job.objects.filter(
+                        id=self.job.id,
+                        status=Job.Status.RUNNING,
+                        locked_by=self.job.locked_by,
+                    ).update(
+                        locked_until=timezone.now()
+                        + timedelta(seconds=settings.JOB_LEASE)
+                    )
+                except Exception:
+                    logger.exception(
+                        "Could not renew the lease of job #%s", self.job.id
+                    )
+                    continue
+                if not renewed:
+                    logger.warning(
+                        "Job %s #%s lost its lease", self.job.task, self.job.id
+                    )
+                    return
+        finally:
+            connection.close()
+
+
+def run_job(job: Job) -> str:
+    """Run a claimed job and record the outcome: done, retry or failed."""
+    metrics.JOB_QUEUE_LATENCY.labels(task=job.task).observe(
+        max((job.started_at - job.run_at).total_seconds(), 0)
+    )
+    start = time.perf_counter()
+    job.attempts += 1
+    try:
+        with _Heartbeat(job):
+            get_task(job.task)(**job.kwargs)
+    except Exception as e:
+        logger.exception(
+            "Job %s #%s failed (attempt %s)", job.task, job.id, job.attempts
+        )
+        job.last_error = f"{type(e).__name__}: {e}"
+        if job.attempts < job.max_attempts:
+            result = "retry"
+            job.status = Job.Status.QUEUED
+            job.run_at = timezone.now() + timedelta(
+                seconds=settings.JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+        else:
+            result = "failed"
+            job.status = Job.Status.FAILED
+    else:
+        result = "done"
+        job.status = Job.Status.DONE
+        job.last_error = ""
+    finally:
+        duration = time.perf_counter() - start
+        metrics.JOB_DURATION.labels(task=job.task).observe(duration)
+
+    holder = job.locked_by
+    job.finished_at = timezone.now()
+    job.locked_by, job.locked_until = "", None
+    # Only the lease holder may record the outcome: after an expired lease
+    # the job may already belong to another worker
+    Job.objects.filter(id=job.id, status=Job.Status.RUNNING, locked_by=holder).update(
+        status=job.status,
+        run_at=job.run_at,
+        attempts=job.attempts,
+        last_error=job.last_error,
+        finished_at=job.finished_at,
+        locked_by="",
+        locked_until=None,
+    )
+    metrics.JOBS.labels(task=job.task, result=result).inc()
+
+    logger.info("Job %s #%s: %s in %.3fs", job.task, job.id, result, duration)
+
+    return result
+
+
+def purge(now=None) -> int:
+    """Delete finished jobs older than JOB_RETENTION_DAYS."""
+    cutoff = (now or timezone.now()) - timedelta(days=settings.JOB_RETENTION_DAYS)
+    deleted, _ = Job.objects.filter(
+        status__in=[Job.Status.DONE, Job.Status.FAILED], finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+class Worker:
+    """
+    Runs jobs in `threads` threads until stopped. Each thread claims and
+    runs one job at a time and sleeps JOB_POLL_INTERVAL when none is due.
+    """
+
+    def __init__(self, threads: int = 1, schedule: bool = True):
+        self.threads = threads
+        self.schedule = schedule
+        self.stopping = threading.Event()
+        self.id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def stop(self):
+        self.stopping.set()
+
+    def run(self):
+        pool = [
+            threading.Thread(target=self._loop, args=(n,), name=f"worker-{n}")
+            for n in range(self.threads)
+        ]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+
+    def run_burst(self) -> int:
+        """Run due jobs in this thread until none is left; returns the count."""
+        if self.schedule:
+            schedule_recurring()
+        requeue_expired()
+        processed = 0
+        while (job := claim(self.id)) is not None:
+            run_job(job)
+            processed += 1
+        return processed
+
+    def _loop(self, number: int):
+        worker_id = f"{self.id}:{number}"
+        # One thread keeps the schedule and the leases; all of them run jobs
+        housekeeping = number == 0
+        checked_at = 0.0
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                try:
+                    if housekeeping and time.monotonic() - checked_at >= 1:
+                        checked_at = time.monotonic()
+                        if self.schedule:
+                            schedule_recurring()
+                        requeue_expired()
+                    job = claim(worker_id)
+                    if job is not None:
+                        run_job(job)
+                        continue
+                except Exception:
+                    # Keep the worker alive through database hiccups
+                    logger.exception("Worker loop error")
+                self.stopping.wait(settings.JOB_POLL_INTERVAL)
+        finally:
+            connection.close()
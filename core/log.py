@@ -0,0 +1,126 @@
+"""
+Logging handlers and filters for request paths (configured in LOGGING).
+
+QueueListenerHandler keeps log I/O off the request thread: records are put
+on a bounded in-memory queue and written by a background thread. When the
+queue is full (the output cannot keep up) records are dropped and counted
+instead of blocking requests. Threads do not survive fork, so a forked
+child (`run_worker --processes`) starts its own queue and listener.
+
+SamplingFilter keeps a fraction of the INFO and DEBUG records of chatty
+loggers (LOG_SAMPLE_RATES); warnings and errors always pass. Kept records
+carry `sample_rate`, so volumes can be scaled back up from the logs.
+"""
+
+import copy
+import logging
+import os
+import queue
+import random
+import sys
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+
+from core import metrics
+
+# Open handlers, whose listeners forked children restart
+_handlers = weakref.WeakSet()
+
+
+def _restart_listeners():
+    for handler in list(_handlers):
+        handler._after_fork()
+
+
+os.register_at_fork(after_in_child=_restart_listeners)
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for room: the queue may be full when the handler closes
+        self.queue.put(self._sentinel)
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    QueueHandler with its own listener thread writing to `stream`.
+
+    The listener starts with the handler and again in every forked child
+    (uWSGI lazy-apps workers configure logging themselves anyway). Closing the handler, which `logging.shutdown()` does at
+    exit, writes out the records still queued.
+    """
+
+    def __init__(self, stream=None, queue_size: int = 10_000):
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        super().__init__(queue.Queue(queue_size))
+        self._start_listener()
+        _handlers.add(self)
+
+    def _start_listener(self):
+        self.listener = _Listener(self.queue, self.target)
+        self.listener.start()
+
+    def _after_fork(self):
+        # The parent's listener thread is gone, and its queue may hold
+        # records the parent writes or a lock held by another thread
+        self.queue = queue.Queue(self.queue.maxsize)
+        self._start_listener()
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Unlike QueueHandler.prepare(), only merge the message arguments
+        # here (they may be objects that change after the call) and leave
+        # the formatting to the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.LOG_RECORDS_DROPPED.labels(logger=record.name).inc()
+
+    def close(self):
+        _handlers.discard(self)
+        self.listener.stop()
+        self.target.close()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps INFO and lower records of the loggers in `rates` (logger name to
+    fraction kept, children included) with that probability.
+    """
+
+    def __init__(self, rates: dict[str, float] | None = None):
+        super().__init__()
+        self.rates = rates or {}
+        self.resolved = {}
+
+    def filter(self, record) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1:
+            return True
+        record.sample_rate = rate
+        return random.random() < rate
+
+    def _rate(self, name: str) -> float:
+        rate = self.resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self.resolved[name] = rate
+        return rate
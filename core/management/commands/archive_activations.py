@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from core.services import ArchiveService
+
+
+class Command(BaseCommand):
+    help = (
+        "Move activations deactivated more than ACTIVATION_ARCHIVE_AFTER_DAYS "
+        "ago to the activation_history table, in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        archived = ArchiveService.archive_activations(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} activations"))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.services import ActivationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute the instance identifier digest of activations that lack one, "
+        "in batches. Run once after migrating; safe to interrupt and rerun."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--recompute",
+            action="store_true",
+            help="Recompute every digest (after changing the normalization rules)",
+        )
+
+    def handle(self, *args, **options):
+        updated = ActivationService.backfill_instance_digests(
+            batch_size=options["batch_size"], recompute=options["recompute"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} activations"))
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services import OutboxService
+
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver pending outbox events to brand webhooks. Runs one pass, or "
+        "keeps polling with --loop. Several dispatchers may run at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep running and poll."
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when nothing is due (with --loop).",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=1000, help="Events claimed per pass."
+        )
+
+    def handle(self, *args, **options):
+        if not options["loop"]:
+            attempted = OutboxService.dispatch(limit=options["limit"])
+            purged = OutboxService.purge()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Attempted {attempted} events, purged {purged} old events"
+                )
+            )
+            return
+
+        purged_at = 0.0
+        while True:
+            if time.monotonic() - purged_at > PURGE_INTERVAL:
+                OutboxService.purge()
+                purged_at = time.monotonic()
+            if OutboxService.dispatch(limit=options["limit"]) == 0:
+                time.sleep(options["interval"])
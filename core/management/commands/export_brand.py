@@ -0,0 +1,41 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Brand
+from core.services import ExportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a brand's licenses or activations as NDJSON or CSV to a file "
+        "or stdout, with flat memory use."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("brand", help="Brand slug.")
+        parser.add_argument("dataset", choices=sorted(ExportService.DATASETS))
+        parser.add_argument(
+            "--format", choices=sorted(ExportService.FORMATS), default="ndjson"
+        )
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output.")
+        parser.add_argument("--output", help="File to write (default: stdout).")
+
+    def handle(self, *args, **options):
+        brand = Brand.objects.filter(slug=options["brand"]).first()
+        if brand is None:
+            raise CommandError(f"Brand not found: {options['brand']}")
+
+        chunks = ExportService.stream(
+            brand, options["dataset"], options["format"], compress=options["gzip"]
+        )
+        if options["output"]:
+            with open(options["output"], "wb") as fh:
+                written = sum(fh.write(chunk) for chunk in chunks)
+            self.stderr.write(
+                self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}")
+            )
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
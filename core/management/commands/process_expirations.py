@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.services import ExpiryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark valid licenses past their expiry as expired, with audit entries "
+        "and change events. Safe to run concurrently and on a schedule."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Licenses transitioned per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        expired = ExpiryService.expire_licenses(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} licenses"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.services import EntitlementService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the entitlements read model from the license tables. "
+        "Only needed after writes that bypass the ORM (raw SQL, restores)."
+    )
+
+    def handle(self, *args, **options):
+        written = EntitlementService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} entitlements"))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from core.services import RollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the hourly and daily usage rollups behind the brand analytics "
+        "API. Incremental and idempotent; run it on a schedule (e.g. every "
+        "5 minutes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="Recompute from this ISO 8601 time instead of the last run.",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None or since.tzinfo is None:
+                raise CommandError("--since must be an ISO 8601 time with offset")
+
+        written = RollupService.run(since=since)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} rollup rows"))
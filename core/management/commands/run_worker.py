@@ -0,0 +1,76 @@
+import multiprocessing
+import signal
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.jobs import Worker
+
+
+def _run_process(threads: int, schedule: bool):
+    worker = Worker(threads=threads, schedule=schedule)
+    signal.signal(signal.SIGTERM, lambda *args: worker.stop())
+    signal.signal(signal.SIGINT, lambda *args: worker.stop())
+    worker.run()
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs from the database queue: scheduled tasks "
+        "(JOB_SCHEDULE) and enqueued jobs. Run as many workers as needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=4, help="Job threads per process."
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Worker processes (for CPU-bound tasks).",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Run the jobs due now in this process, then exit.",
+        )
+        parser.add_argument(
+            "--no-schedule",
+            dest="schedule",
+            action="store_false",
+            help="Do not enqueue JOB_SCHEDULE runs from this worker.",
+        )
+
+    def handle(self, *args, **options):
+        if options["burst"]:
+            processed = Worker(schedule=options["schedule"]).run_burst()
+            self.stdout.write(self.style.SUCCESS(f"Ran {processed} jobs"))
+            return
+
+        threads, schedule = options["threads"], options["schedule"]
+        self.stdout.write(
+            f"Worker starting: {options['processes']} processes x {threads} threads"
+        )
+        if options["processes"] == 1:
+            _run_process(threads, schedule)
+            return
+
+        # Children must not share the parent's database connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        children = [
+            context.Process(target=_run_process, args=(threads, schedule))
+            for _ in range(options["processes"])
+        ]
+        for child in children:
+            child.start()
+
+        def stop_children(*args):
+            for child in children:
+                child.terminate()
+
+        signal.signal(signal.SIGTERM, stop_children)
+        signal.signal(signal.SIGINT, stop_children)
+        for child in children:
+            child.join()
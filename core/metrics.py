@@ -0,0 +1,143 @@
+"""
+Prometheus metrics for licensing operations.
+
+Metrics are process-local by default. When ``PROMETHEUS_MULTIPROC_DIR`` is
+set (uWSGI with ``processes > 1``), prometheus_client stores every sample in
+per-process mmap files in that directory and the ``/metrics`` view merges
+them at scrape time, so counters stay correct across workers.
+"""
+
+import functools
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+ACTIVATIONS = Counter(
+    "license_activations_total",
+    "Successful license activations.",
+    ["result"],  # created | existing
+)
+DEACTIVATIONS = Counter(
+    "license_deactivations_total",
+    "License deactivation requests.",
+    ["result"],  # deactivated | already_deactivated
+)
+SEAT_LIMIT_REJECTIONS = Counter(
+    "license_seat_limit_rejections_total",
+    "Activations rejected because every seat was in use.",
+)
+STATUS_CHECKS = Counter(
+    "license_status_checks_total",
+    "License status checks.",
+    ["result"],  # found | not_found
+)
+STATUS_CACHE_REQUESTS = Counter(
+    "license_status_cache_requests_total",
+    "License status lookups by cache result.",
+    ["result"],  # hit | miss | coalesced | error
+)
+STATUS_FALLBACKS = Counter(
+    "license_status_fallbacks_total",
+    "Status checks the database could not answer.",
+    ["result"],  # served (last known good) | unavailable
+)
+CIRCUIT_OPENED = Counter(
+    "license_circuit_opened_total",
+    "Times a circuit breaker opened.",
+    ["circuit"],
+)
+LOG_RECORDS_DROPPED = Counter(
+    "license_log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+    ["logger"],
+)
+AUTH_CACHE_REQUESTS = Counter(
+    "license_auth_cache_requests_total",
+    "Brand API key lookups by cache result.",
+    ["result"],  # hit | miss
+)
+RATE_LIMITED = Counter(
+    "license_rate_limited_total",
+    "Requests rejected with 429 by a rate limit.",
+    ["scope"],
+)
+AUDIT_FLUSHES = Counter(
+    "license_audit_flushes_total",
+    "Audit log writes to the database.",
+)
+AUDIT_ROWS = Counter(
+    "license_audit_rows_total",
+    "Audit log rows written to the database.",
+)
+WEBHOOK_EVENTS = Counter(
+    "license_webhook_events_total",
+    "Outbox events by delivery outcome.",
+    ["result"],  # delivered | failed | abandoned
+)
+JOBS = Counter(
+    "license_jobs_total",
+    "Background jobs run by the worker.",
+    ["task", "result"],  # done | retry | failed
+)
+JOB_DURATION = Histogram(
+    "license_job_duration_seconds",
+    "Run time of background jobs.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_QUEUE_LATENCY = Histogram(
+    "license_job_queue_latency_seconds",
+    "Delay between a job becoming due and a worker starting it.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+OPERATION_LATENCY = Histogram(
+    "license_operation_duration_seconds",
+    "Latency of licensing operations in the service layer.",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+def timed(operation: str):
+    """
+    Decorator recording the wrapped call's latency in OPERATION_LATENCY.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                OPERATION_LATENCY.labels(operation=operation).observe(
+                    time.perf_counter() - start
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def render_latest() -> tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+    Aggregates across worker processes when multiprocess mode is enabled.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="license",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("valid", "Valid"),
+                    ("suspended", "Suspended"),
+                    ("cancelled", "Cancelled"),
+                    ("expired", "Expired"),
+                ],
+                default="valid",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="license",
+            index=models.Index(
+                fields=["status", "expires_at"], name="licenses_status_126198_idx"
+            ),
+        ),
+    ]
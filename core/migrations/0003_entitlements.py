@@ -0,0 +1,120 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_entitlements(apps, schema_editor):
+    License = apps.get_model("core", "License")
+    Entitlement = apps.get_model("core", "Entitlement")
+
+    licenses = (
+        License.objects.select_related("license_key", "product__brand")
+        .annotate(
+            active_seats=Count(
+                "activations", filter=Q(activations__deactivated_at__isnull=True)
+            )
+        )
+        .order_by("id")
+    )
+    batch = []
+    for license_obj in licenses.iterator(chunk_size=1000):
+        product = license_obj.product
+        seats_total = license_obj.seat_limit
+        if seats_total is None:
+            seats_total = product.default_seat_limit
+        batch.append(
+            Entitlement(
+                license_id=license_obj.id,
+                customer_email=license_obj.license_key.customer_email,
+                license_key_str=license_obj.license_key.key,
+                product_id=product.id,
+                product_name=product.name,
+                product_slug=product.slug,
+                product_default_seat_limit=product.default_seat_limit,
+                brand_name=product.brand.name,
+                status=license_obj.status,
+                expires_at=license_obj.expires_at,
+                seat_limit=license_obj.seat_limit,
+                seats_total=seats_total,
+                seats_used=license_obj.active_seats,
+                license_created_at=license_obj.created_at,
+                license_updated_at=license_obj.updated_at,
+            )
+        )
+        if len(batch) == 1000:
+            Entitlement.objects.bulk_create(batch)
+            batch = []
+    Entitlement.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_license_expired_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Entitlement",
+            fields=[
+                (
+                    "license",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="entitlement",
+                        serialize=False,
+                        to="core.license",
+                    ),
+                ),
+                ("customer_email", models.EmailField(max_length=254)),
+                ("license_key_str", models.CharField(max_length=255)),
+                ("product_name", models.CharField(max_length=255)),
+                ("product_slug", models.SlugField(max_length=100)),
+                (
+                    "product_default_seat_limit",
+                    models.IntegerField(blank=True, null=True),
+                ),
+                ("brand_name", models.CharField(max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("valid", "Valid"),
+                            ("suspended", "Suspended"),
+                            ("cancelled", "Cancelled"),
+                            ("expired", "Expired"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(blank=True, null=True)),
+                ("seat_limit", models.IntegerField(blank=True, null=True)),
+                ("seats_total", models.IntegerField(blank=True, null=True)),
+                ("seats_used", models.IntegerField(default=0)),
+                ("license_created_at", models.DateTimeField()),
+                ("license_updated_at", models.DateTimeField()),
+                ("refreshed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.product",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "entitlements",
+                "indexes": [
+                    models.Index(
+                        fields=["customer_email", "license_created_at"],
+                        name="entitlement_custome_94e20c_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_entitlements, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_entitlements"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="licensekey",
+            index=models.Index(
+                fields=["created_at"], name="license_key_created_03f706_idx"
+            ),
+        ),
+    ]
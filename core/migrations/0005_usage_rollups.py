@@ -0,0 +1,95 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_license_key_created_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UsageRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                ("activations", models.IntegerField(default=0)),
+                ("deactivations", models.IntegerField(default=0)),
+                ("seat_limit_rejections", models.IntegerField(default=0)),
+                ("active_seats", models.IntegerField(default=0)),
+                ("seats_purchased", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "usage_rollups",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="activation",
+            index=models.Index(
+                fields=["activated_at"], name="activations_activat_2bc0ed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activation",
+            index=models.Index(
+                fields=["deactivated_at"], name="activations_deactiv_644423_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="usagerollup",
+            name="brand",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="core.brand",
+            ),
+        ),
+        migrations.AddField(
+            model_name="usagerollup",
+            name="product",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="core.product",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usagerollup",
+            index=models.Index(
+                fields=["brand", "granularity", "bucket_start"],
+                name="usage_rollu_brand_i_58abe3_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usagerollup",
+            index=models.Index(
+                fields=["granularity", "bucket_start"],
+                name="usage_rollu_granula_2f168b_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="usagerollup",
+            constraint=models.UniqueConstraint(
+                fields=("product", "granularity", "bucket_start"),
+                name="usage_rollup_bucket_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:29
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_usage_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="brand",
+            name="webhook_secret",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="brand",
+            name="webhook_url",
+            field=models.URLField(blank=True, max_length=500),
+        ),
+        migrations.CreateModel(
+            name="OutboxEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("event_type", models.CharField(max_length=100)),
+                (
+                    "payload",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("next_attempt_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.IntegerField(default=0)),
+                ("delivered_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "brand",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.brand",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "outbox_events",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("next_attempt_at__isnull", False)),
+                        fields=["next_attempt_at"],
+                        name="outbox_pending_idx",
+                    ),
+                    models.Index(
+                        fields=["created_at"], name="outbox_even_created_dc5a3b_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
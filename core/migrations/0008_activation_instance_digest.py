@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_jobs"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="activation",
+            name="activations_instanc_9c1fa8_idx",
+        ),
+        migrations.AddField(
+            model_name="activation",
+            name="instance_digest",
+            field=models.BinaryField(max_length=16, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="activation",
+            index=models.Index(
+                condition=models.Q(("deactivated_at__isnull", True)),
+                fields=["license", "instance_digest"],
+                name="activation_live_digest_idx",
+            ),
+        ),
+    ]
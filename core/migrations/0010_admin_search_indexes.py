@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="auditlog",
+            name="audit_logs_entity__d4c2e5_idx",
+        ),
+        migrations.AddIndex(
+            model_name="activation",
+            index=models.Index(
+                fields=["instance_digest"], name="activations_instanc_6b7242_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["entity_id"], name="audit_logs_entity__4a3b61_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="licensekey",
+            index=models.Index(
+                fields=["key"],
+                name="license_key_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-19 00:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_admin_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivationHistory",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("instance_identifier", models.CharField(max_length=500)),
+                ("instance_digest", models.BinaryField(max_length=16, null=True)),
+                ("activated_at", models.DateTimeField()),
+                ("deactivated_at", models.DateTimeField()),
+                ("metadata", models.JSONField(blank=True, default=dict)),
+                ("archived_at", models.DateTimeField()),
+                (
+                    "license",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activation_history",
+                        to="core.license",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "activation history",
+                "db_table": "activation_history",
+            },
+        ),
+    ]
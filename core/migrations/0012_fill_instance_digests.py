@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-19 01:20
+
+from django.db import migrations, transaction
+
+from core.identifiers import instance_digest
+
+BATCH_SIZE = 5000
+
+
+def fill_instance_digests(apps, schema_editor):
+    """
+    Fill `instance_digest` of rows written before 0008, in primary key
+    order, committing each batch.
+    """
+    for model_name in ("Activation", "ActivationHistory"):
+        model = apps.get_model("core", model_name)
+        rows = model.objects.filter(instance_digest__isnull=True).order_by("id")
+        last_id = None
+        while True:
+            batch = rows if last_id is None else rows.filter(id__gt=last_id)
+            batch = list(batch.values_list("id", "instance_identifier")[:BATCH_SIZE])
+            if not batch:
+                break
+            with transaction.atomic():
+                model.objects.bulk_update(
+                    [
+                        model(id=row_id, instance_digest=instance_digest(raw))
+                        for row_id, raw in batch
+                    ],
+                    ["instance_digest"],
+                )
+            last_id = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+    # One transaction per batch instead of one for the whole table
+    atomic = False
+
+    dependencies = [
+        ("core", "0011_activation_history"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_instance_digests, migrations.RunPython.noop),
+    ]
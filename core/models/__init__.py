@@ -1,9 +1,14 @@
 from .activation import Activation
+from .activation_history import ActivationHistory
 from .audit_log import AuditLog
 from .brand import Brand
+from .entitlement import Entitlement
+from .job import Job
 from .license import License
 from .license_key import LicenseKey
+from .outbox_event import OutboxEvent
 from .product import Product
+from .usage_rollup import UsageRollup
 
 __all__ = [
     "Brand",
@@ -11,5 +16,10 @@ __all__ = [
     "LicenseKey",
     "License",
     "Activation",
+    "ActivationHistory",
     "AuditLog",
+    "Entitlement",
+    "Job",
+    "OutboxEvent",
+    "UsageRollup",
 ]
@@ -1,16 +1,22 @@
-import uuid
-
 from django.db import models
 
+from core.identifiers import DIGEST_SIZE, instance_digest
+from core.ids import uuid7
+
 from .license import License
 
 
 class Activation(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     license = models.ForeignKey(
         License, on_delete=models.CASCADE, related_name="activations"
     )
     instance_identifier = models.CharField(max_length=500)
+    # Digest of the normalized identifier; null only on rows written before
+    # it existed, until `backfill_instance_digests` has run
+    instance_digest = models.BinaryField(
+        max_length=DIGEST_SIZE, null=True, editable=False
+    )
     activated_at = models.DateTimeField(auto_now_add=True)
     deactivated_at = models.DateTimeField(null=True, blank=True)
     metadata = models.JSONField(default=dict, blank=True)
@@ -19,9 +25,25 @@ class Activation(models.Model):
         db_table = "activations"
         indexes = [
             models.Index(fields=["license", "deactivated_at"]),
-            models.Index(fields=["instance_identifier"]),
+            # Idempotent activation lookup: the live activation of a license
+            # for an instance
+            models.Index(
+                fields=["license", "instance_digest"],
+                condition=models.Q(deactivated_at__isnull=True),
+                name="activation_live_digest_idx",
+            ),
+            # Admin search by instance, over every license and live or
+            # deactivated rows, which the partial index above cannot serve
+            models.Index(fields=["instance_digest"]),
+            # Time-range scans of the usage rollup job
+            models.Index(fields=["activated_at"]),
+            models.Index(fields=["deactivated_at"]),
         ]
 
+    def save(self, *args, **kwargs):
+        self.instance_digest = instance_digest(self.instance_identifier)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         status = "active" if self.deactivated_at is None else "deactivated"
         return f"{self.license.license_key.key} - {self.instance_identifier} ({status})"
@@ -0,0 +1,47 @@
+from django.db import models
+
+from core.identifiers import DIGEST_SIZE
+
+from .license import License
+
+
+class ActivationHistory(models.Model):
+    """
+    Activations deactivated longer than ACTIVATION_ARCHIVE_AFTER_DAYS ago,
+    moved out of `activations` by ArchiveService. Rows keep their id, so
+    audit entries and repeated deactivation requests still find them.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    license = models.ForeignKey(
+        License, on_delete=models.CASCADE, related_name="activation_history"
+    )
+    instance_identifier = models.CharField(max_length=500)
+    instance_digest = models.BinaryField(
+        max_length=DIGEST_SIZE, null=True, editable=False
+    )
+    activated_at = models.DateTimeField()
+    deactivated_at = models.DateTimeField()
+    metadata = models.JSONField(default=dict, blank=True)
+    archived_at = models.DateTimeField()
+
+    # Columns copied from `activations`
+    COPIED_FIELDS = [
+        "id",
+        "license_id",
+        "instance_identifier",
+        "instance_digest",
+        "activated_at",
+        "deactivated_at",
+        "metadata",
+    ]
+
+    class Meta:
+        db_table = "activation_history"
+        verbose_name_plural = "activation history"
+
+    def __str__(self):
+        return f"{self.license.license_key.key} - {self.instance_identifier} (archived)"
+
+    def is_active(self):
+        return False
@@ -1,12 +1,12 @@
-import uuid
-
 from django.db import models
 
+from core.ids import uuid7
+
 from .brand import Brand
 
 
 class AuditLog(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     brand = models.ForeignKey(
         Brand,
         on_delete=models.SET_NULL,
@@ -25,7 +25,8 @@ class AuditLog(models.Model):
         db_table = "audit_logs"
         indexes = [
             models.Index(fields=["brand", "created_at"]),
-            models.Index(fields=["entity_type", "entity_id"]),
+            # Entity ids are UUIDs, unique across entity types
+            models.Index(fields=["entity_id"]),
             models.Index(fields=["created_at"]),
         ]
 
@@ -0,0 +1,86 @@
+from django.db import models
+
+from .license import License
+from .product import Product
+
+
+class Entitlement(models.Model):
+    """
+    Denormalized read model of a license for customer-email lookups (US6).
+    One row per license, maintained by core.receivers; never write directly.
+    """
+
+    license = models.OneToOneField(
+        License,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="entitlement",
+    )
+    customer_email = models.EmailField()
+    license_key_str = models.CharField(max_length=255)
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    product_name = models.CharField(max_length=255)
+    product_slug = models.SlugField(max_length=100)
+    product_default_seat_limit = models.IntegerField(null=True, blank=True)
+    brand_name = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=License.Status.choices)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    seat_limit = models.IntegerField(null=True, blank=True)
+    seats_total = models.IntegerField(null=True, blank=True)
+    seats_used = models.IntegerField(default=0)
+    license_created_at = models.DateTimeField()
+    license_updated_at = models.DateTimeField()
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    # Columns rewritten on every refresh
+    REFRESH_FIELDS = [
+        "customer_email",
+        "license_key_str",
+        "product",
+        "product_name",
+        "product_slug",
+        "product_default_seat_limit",
+        "brand_name",
+        "status",
+        "expires_at",
+        "seat_limit",
+        "seats_total",
+        "seats_used",
+        "license_created_at",
+        "license_updated_at",
+        "refreshed_at",
+    ]
+
+    class Meta:
+        db_table = "entitlements"
+        indexes = [
+            models.Index(fields=["customer_email", "license_created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.customer_email} - {self.product_name}"
+
+    @classmethod
+    def from_license(cls, license_obj: License) -> "Entitlement":
+        """
+        Build a row from a license loaded with select_related("license_key",
+        "product__brand") and with_seats_used().
+        """
+        product = license_obj.product
+        return cls(
+            license_id=license_obj.id,
+            customer_email=license_obj.license_key.customer_email,
+            license_key_str=license_obj.license_key.key,
+            product_id=product.id,
+            product_name=product.name,
+            product_slug=product.slug,
+            product_default_seat_limit=product.default_seat_limit,
+            brand_name=product.brand.name,
+            status=license_obj.status,
+            expires_at=license_obj.expires_at,
+            seat_limit=license_obj.seat_limit,
+            seats_total=license_obj.get_seat_limit(),
+            seats_used=license_obj.get_active_activations_count(),
+            license_created_at=license_obj.created_at,
+            license_updated_at=license_obj.updated_at,
+        )
@@ -0,0 +1,52 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+
+class Job(models.Model):
+    """
+    Background job, claimed and run by `manage.py run_worker` (core/jobs.py).
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    id = models.BigAutoField(primary_key=True)
+    task = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.QUEUED
+    )
+    run_at = models.DateTimeField()
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=1)
+    # Set for scheduled runs so every worker enqueues the same slot only once
+    unique_key = models.CharField(max_length=200, null=True, blank=True, unique=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "jobs"
+        indexes = [
+            models.Index(
+                fields=["run_at"],
+                condition=Q(status="queued"),
+                name="jobs_queued_idx",
+            ),
+            models.Index(
+                fields=["locked_until"],
+                condition=Q(status="running"),
+                name="jobs_running_idx",
+            ),
+            models.Index(fields=["finished_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.id} ({self.status})"
@@ -1,19 +1,57 @@
-import uuid
-
 from django.db import models
+from django.db.models import BooleanField, Case, Count, Q, Value, When
 from django.utils import timezone
 
+from core.ids import uuid7
+
 from .license_key import LicenseKey
 from .product import Product
 
 
+class LicenseQuerySet(models.QuerySet):
+    @staticmethod
+    def _validity_q(now):
+        return Q(status=License.Status.VALID) & (
+            Q(expires_at__isnull=True) | Q(expires_at__gt=now)
+        )
+
+    def effectively_valid(self, now=None):
+        """Licenses that are valid right now: status valid and not past expiry."""
+        return self.filter(self._validity_q(now or timezone.now()))
+
+    def past_expiry(self, now=None):
+        """Licenses still marked valid whose expiry has passed."""
+        return self.filter(
+            status=License.Status.VALID, expires_at__lte=now or timezone.now()
+        )
+
+    def with_validity(self, now=None):
+        """Annotate `currently_valid`, computed by the database."""
+        return self.annotate(
+            currently_valid=Case(
+                When(self._validity_q(now or timezone.now()), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def with_seats_used(self):
+        """Annotate `seats_used`, the number of active activations."""
+        return self.annotate(
+            seats_used=Count(
+                "activations", filter=Q(activations__deactivated_at__isnull=True)
+            )
+        )
+
+
 class License(models.Model):
     class Status(models.TextChoices):
         VALID = "valid", "Valid"
         SUSPENDED = "suspended", "Suspended"
         CANCELLED = "cancelled", "Cancelled"
+        EXPIRED = "expired", "Expired"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     license_key = models.ForeignKey(
         LicenseKey, on_delete=models.CASCADE, related_name="licenses"
     )
@@ -28,18 +66,23 @@ class License(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LicenseQuerySet.as_manager()
+
     class Meta:
         db_table = "licenses"
         unique_together = [["license_key", "product"]]
         indexes = [
             models.Index(fields=["license_key", "status"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["status", "expires_at"]),
         ]
 
     def __str__(self):
         return f"{self.license_key.key} - {self.product.name}"
 
     def is_expired(self):
+        if self.status == self.Status.EXPIRED:
+            return True
         if self.expires_at is None:
             return False
         return timezone.now() > self.expires_at
@@ -55,6 +98,9 @@ class License(models.Model):
         return None
 
     def get_active_activations_count(self):
+        # Use the with_seats_used() annotation when the row was loaded with it
+        if hasattr(self, "seats_used"):
+            return self.seats_used
         return self.activations.filter(deactivated_at__isnull=True).count()
 
     def has_available_seats(self):
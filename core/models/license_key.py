@@ -1,12 +1,12 @@
-import uuid
-
 from django.db import models
 
+from core.ids import uuid7
+
 from .brand import Brand
 
 
 class LicenseKey(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     key = models.CharField(max_length=255, unique=True, db_index=True)
     brand = models.ForeignKey(
         Brand, on_delete=models.CASCADE, related_name="license_keys"
@@ -20,6 +20,13 @@ class LicenseKey(models.Model):
         indexes = [
             models.Index(fields=["customer_email"]),
             models.Index(fields=["brand", "customer_email"]),
+            models.Index(fields=["created_at"]),
+            # LIKE 'prefix%' on PostgreSQL with a non-C collation (admin search)
+            models.Index(
+                fields=["key"],
+                name="license_key_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
         ]
 
     def __str__(self):
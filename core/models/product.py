@@ -1,12 +1,12 @@
-import uuid
-
 from django.db import models
 
+from core.ids import uuid7
+
 from .brand import Brand
 
 
 class Product(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     brand = models.ForeignKey(Brand, on_delete=models.CASCADE, related_name="products")
     name = models.CharField(max_length=255)
     slug = models.SlugField(max_length=100)
@@ -0,0 +1,54 @@
+from django.db import models
+
+from .brand import Brand
+from .product import Product
+
+
+class UsageRollup(models.Model):
+    """
+    Pre-aggregated seat usage of one product per hour or day (UTC), written
+    only by RollupService. Counters cover events inside the bucket; the
+    seat gauges are as of the end of the bucket (or the last run, for the
+    current one).
+    """
+
+    class Granularity(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    brand = models.ForeignKey(Brand, on_delete=models.CASCADE, related_name="+")
+    granularity = models.CharField(max_length=4, choices=Granularity.choices)
+    bucket_start = models.DateTimeField()
+    activations = models.IntegerField(default=0)
+    deactivations = models.IntegerField(default=0)
+    seat_limit_rejections = models.IntegerField(default=0)
+    active_seats = models.IntegerField(default=0)
+    seats_purchased = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Columns rewritten when a bucket is recomputed
+    UPDATE_FIELDS = [
+        "activations",
+        "deactivations",
+        "seat_limit_rejections",
+        "active_seats",
+        "seats_purchased",
+        "updated_at",
+    ]
+
+    class Meta:
+        db_table = "usage_rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "granularity", "bucket_start"],
+                name="usage_rollup_bucket_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["brand", "granularity", "bucket_start"]),
+            models.Index(fields=["granularity", "bucket_start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} {self.granularity} {self.bucket_start}"
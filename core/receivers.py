@@ -0,0 +1,129 @@
+"""
+Signal receivers keeping the entitlements read model, the catalog cache and
+the status cache in step with the source tables. Connected in
+CoreConfig.ready().
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.bloom import license_key_filter
+from core.catalog import catalog_cache
+from core.models import Activation, Brand, License, LicenseKey, Product
+from core.services.entitlement_service import EntitlementService
+from core.signals import licenses_changed
+from core.status_cache import status_cache
+
+
+@receiver(post_save, sender=License)
+def refresh_license_entitlement(sender, instance, raw=False, **kwargs):
+    if not raw:
+        EntitlementService.refresh_license(instance)
+
+
+@receiver(licenses_changed)
+def refresh_changed_entitlements(sender, license_ids, **kwargs):
+    EntitlementService.refresh_licenses(license_ids)
+
+
+@receiver(post_save, sender=Activation)
+@receiver(post_delete, sender=Activation)
+def refresh_entitlement_seats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        # Counted after commit: inside the activation's transaction the
+        # count misses concurrent uncommitted activations of the license
+        license_id = instance.license_id
+        transaction.on_commit(lambda: EntitlementService.refresh_seats(license_id))
+
+
+@receiver(post_save, sender=LicenseKey)
+def add_key_to_filter(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        transaction.on_commit(lambda: license_key_filter.key_created(instance.key))
+
+
+@receiver(post_save, sender=LicenseKey)
+def refresh_key_entitlements(sender, instance, created, raw=False, **kwargs):
+    # A new key has no licenses yet
+    if not created and not raw:
+        EntitlementService.refresh_licenses(
+            instance.licenses.values_list("id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_entitlements(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        EntitlementService.refresh_licenses(
+            instance.licenses.values_list("id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Brand)
+def refresh_brand_entitlements(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        EntitlementService.refresh_licenses(
+            License.objects.filter(product__brand=instance).values_list("id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_cache(sender, **kwargs):
+    catalog_cache.invalidate()
+    # Again after commit, in case a worker re-read the old row meanwhile
+    transaction.on_commit(catalog_cache.invalidate)
+
+
+def _invalidate_status(license_keys):
+    license_keys = list(license_keys)
+    status_cache.invalidate(license_keys)
+    # Again after commit: a rebuild meanwhile may have read the old rows
+    transaction.on_commit(lambda: status_cache.invalidate(license_keys))
+
+
+def _keys_of_licenses(license_ids):
+    return LicenseKey.objects.filter(licenses__id__in=license_ids).values_list(
+        "key", flat=True
+    )
+
+
+def _key_of_license(license_obj: License):
+    # The key is usually loaded along with the license: no query then
+    if License.license_key.is_cached(license_obj):
+        return [license_obj.license_key.key]
+    return LicenseKey.objects.filter(id=license_obj.license_key_id).values_list(
+        "key", flat=True
+    )
+
+
+@receiver(post_save, sender=License)
+@receiver(post_delete, sender=License)
+def invalidate_license_status(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _invalidate_status(_key_of_license(instance))
+
+
+@receiver(licenses_changed)
+def invalidate_changed_status(sender, license_ids, **kwargs):
+    _invalidate_status(_keys_of_licenses(list(license_ids)))
+
+
+@receiver(post_save, sender=Activation)
+@receiver(post_delete, sender=Activation)
+def invalidate_activation_status(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if Activation.license.is_cached(instance):
+        _invalidate_status(_key_of_license(instance.license))
+    else:
+        _invalidate_status(_keys_of_licenses([instance.license_id]))
+
+
+@receiver(post_save, sender=LicenseKey)
+def invalidate_key_status(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        _invalidate_status([instance.key])
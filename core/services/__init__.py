@@ -1,5 +1,21 @@
 from .activation_service import ActivationService
+from .archive_service import ArchiveService
 from .audit_service import AuditService
+from .entitlement_service import EntitlementService
+from .expiry_service import ExpiryService
+from .export_service import ExportService
 from .license_service import LicenseService
+from .outbox_service import OutboxService
+from .rollup_service import RollupService
 
-__all__ = ["LicenseService", "ActivationService", "AuditService"]
+__all__ = [
+    "LicenseService",
+    "ActivationService",
+    "ArchiveService",
+    "AuditService",
+    "EntitlementService",
+    "ExpiryService",
+    "ExportService",
+    "OutboxService",
+    "RollupService",
+]
@@ -1,9 +1,17 @@
 import logging
+import time
 import uuid
+from contextlib import contextmanager
 
-from django.db import transaction
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from core import metrics
+from core.bloom import license_key_filter
+from core.catalog import catalog_cache
+from core.circuit import CircuitOpenError
 from core.exceptions import (
     ActivationNotFoundError,
     LicenseCancelledError,
@@ -11,8 +19,13 @@ from core.exceptions import (
     LicenseNotFoundError,
     LicenseSuspendedError,
     SeatLimitReachedError,
+    StatusUnavailableError,
 )
-from core.models import Activation, License, LicenseKey
+from core.identifiers import instance_digest
+from core.models import Activation, ActivationHistory, License, LicenseKey
+from core.services.outbox_service import OutboxService
+from core.status_cache import status_cache
+from core.status_fallback import status_breaker, status_store
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +36,7 @@ class ActivationService:
     """
 
     @staticmethod
+    @metrics.timed("activate")
     @transaction.atomic
     def activate_license(
         license_key_str: str, instance_identifier: str, metadata: dict = None
@@ -33,15 +47,27 @@ class ActivationService:
         """
         # Get license key
         try:
+            if not license_key_filter.might_contain(license_key_str):
+                raise LicenseKey.DoesNotExist
             license_key = LicenseKey.objects.get(key=license_key_str)
         except LicenseKey.DoesNotExist:
             raise LicenseNotFoundError(f"License key {license_key_str} not found")
 
         # For now, we'll activate the first valid license
         # In practice, you might want to specify which product to activate
-        valid_licenses = license_key.licenses.filter(status=License.Status.VALID)
-
-        if not valid_licenses.exists():
+        valid_licenses = list(license_key.licenses.effectively_valid())
+
+        if not valid_licenses:
+            # Nothing is currently valid; a valid license with an expiry date
+            # must be past it
+            expired_license = license_key.licenses.filter(
+                Q(status=License.Status.EXPIRED)
+                | Q(status=License.Status.VALID, expires_at__isnull=False)
+            ).first()
+            if expired_license:
+                raise LicenseExpiredError(
+                    f"License {expired_license.id} expired at {expired_license.expires_at}"
+                )
             raise LicenseNotFoundError(
                 f"No valid licenses found for key {license_key_str}"
             )
@@ -62,13 +88,15 @@ class ActivationService:
                 SeatLimitReachedError,
             ) as e:
                 # Try next license
-                logger.warning(f"Could not activate license {license_obj.id}: {e}")
+                logger.warning("Could not activate license %s: %s", license_obj.id, e)
                 last_error = e
                 continue
 
         if activation is None:
             # If we have a specific error from the last attempt, raise it
             if last_error:
+                if isinstance(last_error, SeatLimitReachedError):
+                    metrics.SEAT_LIMIT_REJECTIONS.inc()
                 raise last_error
             # Otherwise, no licenses were found
             raise LicenseNotFoundError(
@@ -101,17 +129,28 @@ class ActivationService:
                 f"License {license_obj.id} expired at {license_obj.expires_at}"
             )
 
-        # Check for existing activation (idempotent)
-        existing_activation = Activation.objects.filter(
-            license=license_obj,
-            instance_identifier=instance_identifier,
-            deactivated_at__isnull=True,
-        ).first()
+        # Check for existing activation (idempotent): spellings of the same
+        # instance share the digest of its normalized identifier. Rows
+        # written without a digest (by workers still running the previous
+        # release during a deploy) are matched on the raw identifier.
+        existing_activation = (
+            Activation.objects.filter(license=license_obj, deactivated_at__isnull=True)
+            .filter(
+                Q(instance_digest=instance_digest(instance_identifier))
+                | Q(
+                    instance_digest__isnull=True,
+                    instance_identifier=instance_identifier,
+                )
+            )
+            .first()
+        )
 
         if existing_activation:
             logger.info(
-                f"Activation already exists for instance {instance_identifier}, returning existing"
+                "Activation already exists for instance %s, returning existing",
+                instance_identifier,
             )
+            metrics.ACTIVATIONS.labels(result="existing").inc()
             return existing_activation
 
         # Check seat limit
@@ -120,7 +159,8 @@ class ActivationService:
             seats_used = license_obj.get_active_activations_count()
             raise SeatLimitReachedError(
                 f"Seat limit of {seat_limit} reached for license {license_obj.id} "
-                f"({seats_used}/{seat_limit} seats used)"
+                f"({seats_used}/{seat_limit} seats used)",
+                license=license_obj,
             )
 
         # Create activation
@@ -129,58 +169,275 @@ class ActivationService:
             instance_identifier=instance_identifier,
             metadata=metadata or {},
         )
+        metrics.ACTIVATIONS.labels(result="created").inc()
+        OutboxService.record(
+            catalog_cache.get_product(license_obj.product_id).brand,
+            "activation.created",
+            lambda: ActivationService._event_payload(activation),
+        )
 
         logger.info(
-            f"Activated license {license_obj.id} for instance {instance_identifier} "
-            f"(activation: {activation.id})"
+            "Activated license %s for instance %s (activation: %s)",
+            license_obj.id,
+            instance_identifier,
+            activation.id,
         )
 
         return activation
 
     @staticmethod
-    def deactivate_activation(activation_id: uuid.UUID) -> Activation:
+    @metrics.timed("deactivate")
+    @transaction.atomic
+    def deactivate_activation(
+        activation_id: uuid.UUID,
+    ) -> Activation | ActivationHistory:
         """
         Deactivate a specific activation (US5).
-        Frees up a seat for reuse.
+        Frees up a seat for reuse. Archived activations are returned from
+        the history table as already deactivated.
         """
         try:
-            activation = Activation.objects.get(id=activation_id)
+            activation = Activation.objects.select_related("license__license_key").get(
+                id=activation_id
+            )
         except Activation.DoesNotExist:
-            raise ActivationNotFoundError(f"Activation {activation_id} not found")
+            activation = (
+                ActivationHistory.objects.select_related("license__license_key")
+                .filter(id=activation_id)
+                .first()
+            )
+            if activation is None:
+                raise ActivationNotFoundError(f"Activation {activation_id} not found")
 
         if activation.deactivated_at is not None:
             logger.warning(
-                f"Activation {activation_id} is already deactivated, ignoring"
+                "Activation %s is already deactivated, ignoring", activation_id
             )
+            metrics.DEACTIVATIONS.labels(result="already_deactivated").inc()
             return activation
 
         activation.deactivated_at = timezone.now()
         activation.save()
+        metrics.DEACTIVATIONS.labels(result="deactivated").inc()
+        OutboxService.record(
+            catalog_cache.get_product(activation.license.product_id).brand,
+            "activation.deactivated",
+            lambda: ActivationService._event_payload(activation),
+        )
 
         logger.info(
-            f"Deactivated activation {activation_id} for license {activation.license.id}"
+            "Deactivated activation %s for license %s",
+            activation_id,
+            activation.license_id,
         )
 
         return activation
 
     @staticmethod
+    def _event_payload(activation: Activation) -> dict:
+        license_obj = activation.license
+        return {
+            "activation_id": activation.id,
+            "license_id": license_obj.id,
+            "license_key": license_obj.license_key.key,
+            "instance_identifier": activation.instance_identifier,
+            "seats_used": license_obj.get_active_activations_count(),
+            "seat_limit": license_obj.get_seat_limit(),
+        }
+
+    @staticmethod
+    @metrics.timed("status")
     def get_license_status(license_key_str: str) -> dict:
         """
-        Get status and entitlements for a license key (US4).
+        Get status and entitlements for a license key (US4). Served from the
+        shared status cache, which rebuilds a missing entry once for all
+        concurrent requests (core/status_cache.py).
         """
         try:
-            license_key = LicenseKey.objects.get(key=license_key_str)
-        except LicenseKey.DoesNotExist:
+            if not license_key_filter.might_contain(license_key_str):
+                raise LicenseNotFoundError(f"License key {license_key_str} not found")
+            result = status_cache.get(
+                license_key_str,
+                lambda: ActivationService._build_license_status(license_key_str),
+            )
+        except LicenseNotFoundError:
+            metrics.STATUS_CHECKS.labels(result="not_found").inc()
+            raise
+
+        metrics.STATUS_CHECKS.labels(result="found").inc()
+        logger.info("Retrieved status for license key %s", license_key_str)
+
+        return result
+
+    @staticmethod
+    def get_license_status_or_last_known(license_key_str: str):
+        """
+        get_license_status that survives database outages: if the database
+        fails, or its circuit breaker is open, the key's last known good
+        status is returned from the local fallback store.
+
+        Returns (status, stored_at) where stored_at is the Unix time a stale
+        status was stored, None for a current one. Raises
+        StatusUnavailableError if the database fails and nothing is stored.
+        """
+        try:
+            return ActivationService.get_license_status(license_key_str), None
+        except (DatabaseError, CircuitOpenError) as e:
+            stale = status_store.get(license_key_str)
+            if stale is None:
+                metrics.STATUS_FALLBACKS.labels(result="unavailable").inc()
+                raise StatusUnavailableError(
+                    f"Status of license key {license_key_str} is unavailable"
+                ) from e
+            metrics.STATUS_FALLBACKS.labels(result="served").inc()
+            logger.warning(
+                "Serving last known good status for %s: %s: %s",
+                license_key_str,
+                type(e).__name__,
+                e,
+            )
+            return stale
+
+    @staticmethod
+    @metrics.timed("status_batch")
+    def get_license_statuses(license_keys) -> dict:
+        """
+        Statuses of many license keys at once: maps each key to its status,
+        or to None if it does not exist. Cached entries are reused; the
+        others are built together in a constant number of queries, however
+        many keys are asked for.
+
+        Raises StatusUnavailableError if the database fails or its circuit
+        breaker is open.
+        """
+        statuses, _ = ActivationService._get_license_statuses(
+            license_keys, last_known=False
+        )
+        return statuses
+
+    @staticmethod
+    @metrics.timed("status_batch")
+    def get_license_statuses_or_last_known(license_keys):
+        """
+        get_license_statuses that survives database outages: if the database
+        fails, or its circuit breaker is open, the keys missing from the
+        status cache are served from the local fallback store.
+
+        Returns (statuses, stored_at): statuses as from get_license_statuses,
+        leaving out the keys with nothing stored; stored_at maps the keys
+        served stale to the Unix time they were stored. Raises
+        StatusUnavailableError if no key could be resolved.
+        """
+        return ActivationService._get_license_statuses(license_keys, last_known=True)
+
+    @staticmethod
+    def _get_license_statuses(license_keys, last_known: bool):
+        results = dict.fromkeys(license_keys)
+        candidates = [key for key in results if license_key_filter.might_contain(key)]
+        results.update(status_cache.get_many(candidates))
+
+        stored_at = {}
+        missing = [key for key in candidates if results[key] is None]
+        if missing:
+            started = time.time()
+            try:
+                built = ActivationService._build_license_statuses(missing)
+            except (DatabaseError, CircuitOpenError) as e:
+                if last_known:
+                    for key in missing:
+                        stale = status_store.get(key)
+                        if stale is None:
+                            del results[key]
+                        else:
+                            results[key], stored_at[key] = stale
+                unavailable = len(missing) - len(stored_at)
+                if not last_known or not results:
+                    metrics.STATUS_FALLBACKS.labels(result="unavailable").inc(
+                        unavailable
+                    )
+                    raise StatusUnavailableError(
+                        "License statuses are unavailable, retry later"
+                    ) from e
+                metrics.STATUS_FALLBACKS.labels(result="served").inc(len(stored_at))
+                metrics.STATUS_FALLBACKS.labels(result="unavailable").inc(unavailable)
+                logger.warning(
+                    "Serving %s last known good statuses (%s unavailable): %s: %s",
+                    len(stored_at),
+                    unavailable,
+                    type(e).__name__,
+                    e,
+                )
+            else:
+                status_cache.set_many(built, started)
+                results.update(built)
+
+        found = sum(status is not None for status in results.values())
+        metrics.STATUS_CHECKS.labels(result="found").inc(found)
+        metrics.STATUS_CHECKS.labels(result="not_found").inc(len(results) - found)
+        logger.info("Retrieved status for %s of %s license keys", found, len(results))
+
+        return results, stored_at
+
+    @staticmethod
+    def _build_license_status(license_key_str: str) -> dict:
+        statuses = ActivationService._build_license_statuses([license_key_str])
+        if license_key_str not in statuses:
             raise LicenseNotFoundError(f"License key {license_key_str} not found")
+        return statuses[license_key_str]
 
-        licenses = license_key.licenses.select_related("product").all()
+    @staticmethod
+    def _build_license_statuses(license_keys) -> dict:
+        if not status_breaker.allow():
+            raise CircuitOpenError("Status database circuit is open")
+        try:
+            with ActivationService._status_query_timeout():
+                statuses = ActivationService._query_license_statuses(license_keys)
+        except DatabaseError:
+            status_breaker.record_failure()
+            raise
 
-        license_data = []
-        for license_obj in licenses:
-            seats_used = license_obj.get_active_activations_count()
-            seats_total = license_obj.get_seat_limit()
+        status_breaker.record_success()
+        status_store.put_many(statuses)
+        return statuses
 
-            license_data.append(
+    @staticmethod
+    @contextmanager
+    def _status_query_timeout():
+        # A slow database must fail the build, not hold the request
+        if connection.vendor != "postgresql":
+            yield
+            return
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL statement_timeout = %s",
+                    [settings.STATUS_DB_TIMEOUT_MS],
+                )
+            yield
+
+    @staticmethod
+    def _query_license_statuses(license_keys) -> dict:
+        """
+        Build the statuses of existing keys among `license_keys` in two
+        queries: the keys, then their licenses with product and seat count.
+        """
+        key_rows = list(
+            LicenseKey.objects.filter(key__in=license_keys).values_list(
+                "id", "key", "customer_email"
+            )
+        )
+        if not key_rows:
+            return {}
+        license_data = {key_id: [] for key_id, _, _ in key_rows}
+
+        licenses = (
+            License.objects.filter(license_key_id__in=license_data)
+            .select_related("product")
+            .with_validity()
+            .with_seats_used()
+        )
+        for license_obj in licenses:
+            license_data[license_obj.license_key_id].append(
                 {
                     "license_id": str(license_obj.id),
                     "product": license_obj.product.name,
@@ -191,19 +448,53 @@ class ActivationService:
                         if license_obj.expires_at
                         else None
                     ),
-                    "seats_used": seats_used,
-                    "seats_total": seats_total,
-                    "is_valid": license_obj.is_valid(),
+                    "seats_used": license_obj.get_active_activations_count(),
+                    "seats_total": license_obj.get_seat_limit(),
+                    "is_valid": license_obj.currently_valid,
                 }
             )
 
-        result = {
-            "license_key": license_key_str,
-            "customer_email": license_key.customer_email,
-            "valid": any(lic["is_valid"] for lic in license_data),
-            "licenses": license_data,
-        }
+        statuses = {}
+        for key_id, key, customer_email in key_rows:
+            statuses[key] = {
+                "license_key": key,
+                "customer_email": customer_email,
+                "valid": any(lic["is_valid"] for lic in license_data[key_id]),
+                "licenses": license_data[key_id],
+            }
+        return statuses
 
-        logger.info(f"Retrieved status for license key {license_key_str}")
+    @staticmethod
+    def backfill_instance_digests(batch_size: int = 1000, recompute: bool = False):
+        """
+        Fill in `instance_digest` for activations written before it existed
+        (or for every activation with `recompute`, after the normalization
+        rules changed). Walks the table in primary key order, one short
+        transaction per batch. Returns the number of rows updated.
+        """
+        rows = Activation.objects.order_by("id")
+        if not recompute:
+            rows = rows.filter(instance_digest__isnull=True)
+
+        updated = 0
+        last_id = None
+        while True:
+            batch = rows if last_id is None else rows.filter(id__gt=last_id)
+            batch = list(batch.values_list("id", "instance_identifier")[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                Activation.objects.bulk_update(
+                    [
+                        Activation(
+                            id=activation_id, instance_digest=instance_digest(raw)
+                        )
+                        for activation_id, raw in batch
+                    ],
+                    ["instance_digest"],
+                )
+            updated += len(batch)
+            last_id = batch[-1][0]
+            logger.info("Backfilled instance digests: %s rows", updated)
 
-        return result
+        return updated
@@ -0,0 +1,72 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import Activation, ActivationHistory
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveService:
+    """
+    Service moving activations deactivated longer than
+    ACTIVATION_ARCHIVE_AFTER_DAYS ago from `activations` to
+    `activation_history`, so the table and indexes behind live seat checks
+    only hold live and recently deactivated rows.
+    """
+
+    @staticmethod
+    def archive_activations(batch_size: int = 1000, now=None) -> int:
+        """
+        Archive old deactivated activations in batches, one transaction per
+        batch. Returns the number of activations archived.
+        """
+        now = now or timezone.now()
+        cutoff = now - timedelta(days=settings.ACTIVATION_ARCHIVE_AFTER_DAYS)
+        total = 0
+
+        while True:
+            archived = ArchiveService._archive_batch(batch_size, cutoff, now)
+            total += archived
+            if archived < batch_size:
+                break
+
+        logger.info(
+            "Archived %s activations deactivated before %s", total, cutoff.isoformat()
+        )
+
+        return total
+
+    @staticmethod
+    @transaction.atomic
+    def _archive_batch(batch_size: int, cutoff, now) -> int:
+        candidates = Activation.objects.filter(deactivated_at__lt=cutoff).order_by(
+            "deactivated_at"
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            # Concurrent archivers take disjoint batches
+            candidates = candidates.select_for_update(skip_locked=True)
+
+        rows = list(candidates.values(*ActivationHistory.COPIED_FIELDS)[:batch_size])
+        if not rows:
+            return 0
+
+        ActivationHistory.objects.bulk_create(
+            [ActivationHistory(**row, archived_at=now) for row in rows]
+        )
+        # A plain DELETE without post_delete signals: deactivated rows hold
+        # no seats, so the entitlement recount (per row) has nothing to do
+        pk = Activation._meta.pk
+        ids = [pk.get_db_prep_value(row["id"], connection) for row in rows]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {connection.ops.quote_name(Activation._meta.db_table)} "
+                f"WHERE {connection.ops.quote_name(pk.column)} "
+                f"IN ({', '.join(['%s'] * len(ids))})",
+                ids,
+            )
+
+        return len(rows)
@@ -1,6 +1,7 @@
 import logging
 import uuid
 
+from core import metrics
 from core.models import AuditLog, Brand
 
 logger = logging.getLogger(__name__)
@@ -39,10 +40,42 @@ class AuditService:
             entity_id=entity_id,
             metadata=metadata or {},
         )
+        metrics.AUDIT_FLUSHES.inc()
+        metrics.AUDIT_ROWS.inc()
 
         logger.info(
-            f"Audit: {action} by {actor} on {entity_type}:{entity_id} "
-            f"(Brand: {brand.name if brand else 'N/A'})"
+            "Audit: %s by %s on %s:%s (Brand: %s)",
+            action,
+            actor,
+            entity_type,
+            entity_id,
+            brand.name if brand else "N/A",
         )
 
         return audit_log
+
+    @staticmethod
+    def log_actions(entries: list[dict]) -> list[AuditLog]:
+        """
+        Log many actions with a single INSERT.
+
+        Args:
+            entries: dicts with the keyword arguments of log_action
+        """
+        audit_logs = AuditLog.objects.bulk_create(
+            AuditLog(
+                brand_id=entry.get("brand_id"),
+                action=entry["action"],
+                actor=entry["actor"],
+                entity_type=entry["entity_type"],
+                entity_id=entry["entity_id"],
+                metadata=entry.get("metadata") or {},
+            )
+            for entry in entries
+        )
+        metrics.AUDIT_FLUSHES.inc()
+        metrics.AUDIT_ROWS.inc(len(audit_logs))
+
+        logger.info("Audit: wrote %s entries in one batch", len(audit_logs))
+
+        return audit_logs
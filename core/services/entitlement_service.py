@@ -0,0 +1,149 @@
+import logging
+import uuid
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.models import Activation, Entitlement, License, Product
+
+logger = logging.getLogger(__name__)
+
+
+class EntitlementService:
+    """
+    Service maintaining and reading the entitlements read model (US6).
+    """
+
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    def refresh_licenses(license_ids) -> int:
+        """
+        Recompute the entitlement rows of the given licenses from the source
+        tables and upsert them. Returns the number of rows written.
+        """
+        license_ids = list(dict.fromkeys(license_ids))
+        written = 0
+
+        for start in range(0, len(license_ids), EntitlementService.BATCH_SIZE):
+            batch = license_ids[start : start + EntitlementService.BATCH_SIZE]
+            written += EntitlementService._upsert(License.objects.filter(id__in=batch))
+
+        return written
+
+    @staticmethod
+    def refresh_license(license_obj: License) -> None:
+        """
+        Refresh one license's row. Reuses the instance when it was loaded with
+        its key, product, brand and seats_used (one upsert, no reads).
+        """
+        loaded = (
+            hasattr(license_obj, "seats_used")
+            and License.license_key.is_cached(license_obj)
+            and License.product.is_cached(license_obj)
+            and Product.brand.is_cached(license_obj.product)
+        )
+        if not loaded:
+            EntitlementService.refresh_licenses([license_obj.id])
+            return
+
+        EntitlementService._write([Entitlement.from_license(license_obj)])
+
+    @staticmethod
+    def refresh_seats(license_id: uuid.UUID) -> None:
+        """
+        Recount seats_used for one license. Called once an activation change
+        has committed (core/receivers.py), and counts with the entitlement
+        row locked: the count then sees every activation committed before
+        the lock was granted, so of concurrent recounts the last one to
+        write stores the right number.
+        """
+        active = (
+            Activation.objects.filter(
+                license_id=OuterRef("license_id"), deactivated_at__isnull=True
+            )
+            .order_by()
+            .values("license_id")
+            .annotate(n=Count("id"))
+            .values("n")
+        )
+        with transaction.atomic():
+            entitlement = Entitlement.objects.select_for_update().filter(
+                license_id=license_id
+            )
+            if entitlement.values_list("license_id", flat=True).first() is None:
+                return
+            entitlement.update(
+                seats_used=Coalesce(Subquery(active), 0), refreshed_at=timezone.now()
+            )
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Rebuild the whole read model. Returns the number of rows written.
+        """
+        written = 0
+        last_id = None
+        while True:
+            # Keyset pagination over the primary key
+            licenses = License.objects.order_by("id")
+            if last_id is not None:
+                licenses = licenses.filter(id__gt=last_id)
+            batch = list(
+                licenses.values_list("id", flat=True)[: EntitlementService.BATCH_SIZE]
+            )
+            if not batch:
+                break
+            written += EntitlementService.refresh_licenses(batch)
+            last_id = batch[-1]
+
+        logger.info("Rebuilt %s entitlements", written)
+
+        return written
+
+    @staticmethod
+    def _upsert(licenses) -> int:
+        rows = [
+            Entitlement.from_license(license_obj)
+            for license_obj in licenses.select_related(
+                "license_key", "product__brand"
+            ).with_seats_used()
+        ]
+        if rows:
+            EntitlementService._write(rows)
+        return len(rows)
+
+    @staticmethod
+    def _write(rows: list[Entitlement]) -> None:
+        Entitlement.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["license"],
+            update_fields=Entitlement.REFRESH_FIELDS,
+        )
+
+    @staticmethod
+    def get_entitlements_by_email(customer_email: str, valid_only: bool = False):
+        """
+        Get all entitlements for a customer email across all brands (US6).
+        Served by the (customer_email, license_created_at) index alone.
+        """
+        customer_email = customer_email.lower()
+
+        entitlements = Entitlement.objects.filter(customer_email=customer_email)
+        if valid_only:
+            entitlements = entitlements.filter(
+                Q(status=License.Status.VALID)
+                & (Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now()))
+            )
+        entitlements = list(entitlements.order_by("license_created_at"))
+
+        logger.info(
+            "Retrieved %s entitlements for customer %s",
+            len(entitlements),
+            customer_email,
+        )
+
+        return entitlements
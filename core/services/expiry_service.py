@@ -0,0 +1,96 @@
+import logging
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.catalog import catalog_cache
+from core.models import License
+from core.services.audit_service import AuditService
+from core.services.outbox_service import OutboxService
+from core.signals import license_status_changed, licenses_changed
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryService:
+    """
+    Service that materializes license expiry into the `status` column.
+    """
+
+    ACTOR = "system:expiry"
+
+    @staticmethod
+    def expire_licenses(batch_size: int = 1000, now=None) -> int:
+        """
+        Transition valid licenses past their expiry to EXPIRED, in batches.
+        Each batch is one transaction: status update, audit entries and the
+        license_status_changed event. Returns the number of licenses expired.
+        """
+        now = now or timezone.now()
+        total = 0
+
+        while True:
+            expired = ExpiryService._expire_batch(batch_size, now)
+            total += expired
+            if expired < batch_size:
+                break
+
+        logger.info("Expired %s licenses (as of %s)", total, now.isoformat())
+
+        return total
+
+    @staticmethod
+    @transaction.atomic
+    def _expire_batch(batch_size: int, now) -> int:
+        candidates = License.objects.past_expiry(now).order_by("expires_at")
+        if connection.features.has_select_for_update_skip_locked:
+            # Concurrent processors take disjoint batches
+            candidates = candidates.select_for_update(skip_locked=True, of=("self",))
+
+        rows = list(
+            candidates.values_list("id", "license_key__brand_id", "expires_at")[
+                :batch_size
+            ]
+        )
+        if not rows:
+            return 0
+
+        license_ids = [license_id for license_id, _, _ in rows]
+        License.objects.filter(id__in=license_ids).update(
+            status=License.Status.EXPIRED, updated_at=now
+        )
+
+        AuditService.log_actions(
+            [
+                {
+                    "action": "license.expired",
+                    "actor": ExpiryService.ACTOR,
+                    "entity_type": "license",
+                    "entity_id": license_id,
+                    "brand_id": brand_id,
+                    "metadata": {"expires_at": expires_at.isoformat()},
+                }
+                for license_id, brand_id, expires_at in rows
+            ]
+        )
+
+        OutboxService.record_many(
+            [
+                {
+                    "brand": catalog_cache.get_brand(brand_id),
+                    "event_type": "license.expired",
+                    "payload": {"license_id": license_id, "expires_at": expires_at},
+                }
+                for license_id, brand_id, expires_at in rows
+            ]
+        )
+
+        licenses_changed.send(sender=License, license_ids=license_ids)
+        license_status_changed.send(
+            sender=License,
+            license_ids=license_ids,
+            status=License.Status.EXPIRED,
+            actor=ExpiryService.ACTOR,
+        )
+
+        return len(rows)
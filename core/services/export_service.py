@@ -0,0 +1,166 @@
+import csv
+import io
+import logging
+import zlib
+from datetime import datetime
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from core.models import Activation, ActivationHistory, Brand, Entitlement
+
+logger = logging.getLogger(__name__)
+
+
+class ExportService:
+    """
+    Service streaming full per-brand exports as NDJSON or CSV.
+
+    Rows are read with `.values_list().iterator(chunk_size=EXPORT_CHUNK_SIZE)`,
+    i.e. through a server-side cursor on PostgreSQL, and encoded and
+    compressed chunk by chunk, so memory stays flat however many rows a
+    brand has.
+    """
+
+    FORMATS = {
+        "ndjson": ("application/x-ndjson", "ndjson"),
+        "csv": ("text/csv", "csv"),
+    }
+
+    # Dataset -> [(column, lookup)]. Licenses are read from the
+    # entitlements read model, which already carries key, email and seat
+    # usage without joins or per-row counts.
+    DATASETS = {
+        "licenses": [
+            ("license_id", "license_id"),
+            ("license_key", "license_key_str"),
+            ("customer_email", "customer_email"),
+            ("product_slug", "product_slug"),
+            ("status", "status"),
+            ("expires_at", "expires_at"),
+            ("seats_total", "seats_total"),
+            ("seats_used", "seats_used"),
+            ("created_at", "license_created_at"),
+            ("updated_at", "license_updated_at"),
+        ],
+        "activations": [
+            ("activation_id", "id"),
+            ("license_id", "license_id"),
+            ("license_key", "license__license_key__key"),
+            ("customer_email", "license__license_key__customer_email"),
+            ("product_slug", "license__product__slug"),
+            ("instance_identifier", "instance_identifier"),
+            ("activated_at", "activated_at"),
+            ("deactivated_at", "deactivated_at"),
+        ],
+    }
+
+    # Encoded output is flushed in chunks of about this many bytes
+    FLUSH_BYTES = 64 * 1024
+
+    @staticmethod
+    def get_queryset(brand: Brand, dataset: str):
+        """
+        Unordered `.values_list()` queryset of one dataset for a brand. Ordering
+        would force the database to sort the whole export before the first row.
+        """
+        lookups = [lookup for _, lookup in ExportService.DATASETS[dataset]]
+        if dataset == "licenses":
+            rows = Entitlement.objects.filter(product__brand=brand)
+            return rows.order_by().values_list(*lookups)
+        # Activations still in the hot table plus the archived ones
+        return (
+            Activation.objects.filter(license__product__brand=brand)
+            .order_by()
+            .values_list(*lookups)
+            .union(
+                ActivationHistory.objects.filter(license__product__brand=brand)
+                .order_by()
+                .values_list(*lookups),
+                all=True,
+            )
+        )
+
+    @staticmethod
+    def stream(brand: Brand, dataset: str, fmt: str, compress: bool = False):
+        """
+        Return an iterator over the encoded export as bytes chunks,
+        gzip-compressed if asked. Nothing is read before iteration starts.
+        Raises ValueError for an unknown dataset or format.
+        """
+        if dataset not in ExportService.DATASETS:
+            raise ValueError(
+                f"dataset must be one of {', '.join(ExportService.DATASETS)}"
+            )
+        if fmt not in ExportService.FORMATS:
+            raise ValueError(
+                f"format must be one of {', '.join(ExportService.FORMATS)}"
+            )
+
+        chunks = ExportService._encode(brand, dataset, fmt)
+        if compress:
+            chunks = ExportService._gzip(chunks)
+        return chunks
+
+    @staticmethod
+    def _rows(brand: Brand, dataset: str):
+        # Inside a transaction PostgreSQL streams from a plain cursor; in
+        # autocommit Django declares it WITH HOLD, which materializes the whole
+        # result on the server before the first row
+        with transaction.atomic():
+            yield from ExportService.get_queryset(brand, dataset).iterator(
+                chunk_size=settings.EXPORT_CHUNK_SIZE
+            )
+
+    @staticmethod
+    def _encode(brand: Brand, dataset: str, fmt: str):
+        columns = [column for column, _ in ExportService.DATASETS[dataset]]
+        buffer = io.StringIO()
+        if fmt == "csv":
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(columns)
+            write = writer.writerow
+        else:
+
+            def write(row):
+                buffer.write(_json_encoder.encode(dict(zip(columns, row))))
+                buffer.write("\n")
+
+        count = 0
+        for row in ExportService._rows(brand, dataset):
+            if fmt == "csv":
+                row = [_csv_value(value) for value in row]
+            write(row)
+            count += 1
+            if buffer.tell() >= ExportService.FLUSH_BYTES:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+        logger.info(
+            "Exported %s %s for brand %s as %s", count, dataset, brand.slug, fmt
+        )
+
+    @staticmethod
+    def _gzip(chunks):
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+_json_encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+
+def _csv_value(value):
+    # Same timestamp format as the NDJSON export
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return _json_encoder.default(value)
+    return value
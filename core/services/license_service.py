@@ -2,14 +2,20 @@ import logging
 import uuid
 
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 
+from core.catalog import catalog_cache
 from core.exceptions import (
     BrandNotFoundError,
     LicenseAlreadyExistsError,
+    LicenseNotFoundError,
     ProductNotFoundError,
 )
-from core.models import Brand, License, LicenseKey, Product
+from core.models import Brand, License, LicenseKey
+from core.services.audit_service import AuditService
+from core.services.outbox_service import OutboxService
+from core.signals import license_status_changed, licenses_changed
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +39,10 @@ class LicenseService:
         )
 
         logger.info(
-            f"Generated license key {license_key.key} for {customer_email} (Brand: {brand.name})"
+            "Generated license key %s for %s (Brand: %s)",
+            license_key.key,
+            customer_email,
+            brand.name,
         )
 
         return license_key
@@ -68,9 +77,8 @@ class LicenseService:
             license_key = LicenseService.generate_license_key(brand, customer_email)
 
         # Get product
-        try:
-            product = Product.objects.get(slug=product_slug, brand=brand)
-        except Product.DoesNotExist:
+        product = catalog_cache.get_product_by_slug(brand.id, product_slug)
+        if product is None:
             raise ProductNotFoundError(
                 f"Product {product_slug} not found for brand {brand.name}"
             )
@@ -90,14 +98,32 @@ class LicenseService:
             seat_limit=seat_limit,
         )
 
+        OutboxService.record(
+            brand,
+            "license.created",
+            {
+                "license_id": license_obj.id,
+                "license_key": license_key.key,
+                "customer_email": customer_email,
+                "product_slug": product.slug,
+                "status": license_obj.status,
+                "expires_at": expires_at,
+                "seat_limit": seat_limit,
+            },
+        )
+
         logger.info(
-            f"Created license {license_obj.id} for product {product.name} "
-            f"on key {license_key.key} (customer: {customer_email})"
+            "Created license %s for product %s on key %s (customer: %s)",
+            license_obj.id,
+            product.name,
+            license_key.key,
+            customer_email,
         )
 
         return license_obj
 
     @staticmethod
+    @transaction.atomic
     def update_license_status(
         license_id: uuid.UUID, status: str, expires_at: timezone.datetime = None
     ) -> License:
@@ -109,36 +135,220 @@ class LicenseService:
         except License.DoesNotExist:
             raise ValueError(f"License {license_id} not found")
 
-        if status:
-            license_obj.status = status
+        LicenseService._apply_update(license_obj, status, expires_at, actor="brand")
+
+        return license_obj
 
+    @staticmethod
+    @transaction.atomic
+    def update_brand_license(
+        brand: Brand,
+        license_id: uuid.UUID,
+        status: str,
+        expires_at: timezone.datetime = None,
+    ) -> License:
+        """
+        Update a license owned by `brand` (US2).
+        The license is loaded once, together with everything the response
+        serializer reads (key, product, brand, seats used), and only the
+        changed columns are written.
+        """
+        try:
+            license_obj = (
+                License.objects.select_related("license_key", "product__brand")
+                .with_seats_used()
+                .get(id=license_id, license_key__brand=brand)
+            )
+        except License.DoesNotExist:
+            raise LicenseNotFoundError(
+                f"License {license_id} not found or does not belong to this brand"
+            )
+
+        LicenseService._apply_update(
+            license_obj, status, expires_at, actor=f"brand:{brand.slug}"
+        )
+
+        return license_obj
+
+    @staticmethod
+    def _apply_update(license_obj: License, status: str, expires_at, actor: str):
+        update_fields = []
         if expires_at is not None:
             license_obj.expires_at = expires_at
+            update_fields.append("expires_at")
+            status = LicenseService._resolve_status(
+                license_obj.status, status, expires_at
+            )
+
+        if status:
+            license_obj.status = status
+            update_fields.append("status")
+
+        if update_fields:
+            license_obj.save(update_fields=update_fields + ["updated_at"])
+            if License.product.is_cached(license_obj):
+                brand = license_obj.product.brand
+            else:
+                brand = catalog_cache.get_product(license_obj.product_id).brand
+            OutboxService.record(
+                brand,
+                "license.updated",
+                {
+                    "license_id": license_obj.id,
+                    "status": license_obj.status,
+                    "expires_at": license_obj.expires_at,
+                },
+            )
 
-        license_obj.save()
+        if status:
+            license_status_changed.send(
+                sender=License,
+                license_ids=[license_obj.id],
+                status=status,
+                actor=actor,
+            )
 
         logger.info(
-            f"Updated license {license_id}: status={status}, expires_at={expires_at}"
+            "Updated license %s: status=%s, expires_at=%s",
+            license_obj.id,
+            status,
+            expires_at,
         )
 
-        return license_obj
+    @staticmethod
+    def _resolve_status(current_status: str, status: str, expires_at):
+        """
+        Extending an expired license renews it unless a status is given.
+        """
+        if (
+            not status
+            and expires_at is not None
+            and current_status == License.Status.EXPIRED
+            and expires_at > timezone.now()
+        ):
+            return License.Status.VALID
+        return status
 
     @staticmethod
-    def get_licenses_by_email(customer_email: str):
+    @transaction.atomic
+    def bulk_update_licenses(brand: Brand, updates: list[dict]) -> list[License]:
+        """
+        Apply many status/expiration changes for one brand (US2, bulk).
+
+        Ownership is checked with a single query and the whole batch is
+        rejected if any license is missing or belongs to another brand.
+        Rows are written with bulk_update and audited with one INSERT.
+
+        Args:
+            brand: Brand performing the update
+            updates: dicts with license_id and optional status / expires_at
+        """
+        license_ids = [update["license_id"] for update in updates]
+        licenses = {
+            license_obj.id: license_obj
+            for license_obj in License.objects.filter(
+                id__in=license_ids, license_key__brand=brand
+            )
+            .select_for_update()
+            .only("id", "status", "expires_at")
+        }
+
+        missing = [str(i) for i in license_ids if i not in licenses]
+        if missing:
+            raise LicenseNotFoundError(
+                f"{len(missing)} licenses not found or do not belong to this "
+                f"brand: {', '.join(missing[:20])}"
+            )
+
+        now = timezone.now()
+        changed_by_status = {}
+        audit_entries = []
+        for update in updates:
+            license_obj = licenses[update["license_id"]]
+            status = update.get("status")
+            expires_at = update.get("expires_at")
+
+            if expires_at is not None:
+                license_obj.expires_at = expires_at
+                status = LicenseService._resolve_status(
+                    license_obj.status, status, expires_at
+                )
+            if status:
+                license_obj.status = status
+                changed_by_status.setdefault(status, []).append(license_obj.id)
+            license_obj.updated_at = now
+
+            audit_entries.append(
+                {
+                    "action": "license.updated",
+                    "actor": f"brand:{brand.slug}",
+                    "entity_type": "license",
+                    "entity_id": license_obj.id,
+                    "brand_id": brand.id,
+                    "metadata": {
+                        "status": update.get("status"),
+                        "expires_at": expires_at.isoformat() if expires_at else None,
+                        "bulk": True,
+                    },
+                }
+            )
+
+        updated = [licenses[license_id] for license_id in license_ids]
+        License.objects.bulk_update(
+            updated, ["status", "expires_at", "updated_at"], batch_size=1000
+        )
+        AuditService.log_actions(audit_entries)
+        OutboxService.record_many(
+            [
+                {
+                    "brand": brand,
+                    "event_type": "license.updated",
+                    "payload": {
+                        "license_id": license_obj.id,
+                        "status": license_obj.status,
+                        "expires_at": license_obj.expires_at,
+                    },
+                }
+                for license_obj in updated
+            ]
+        )
+
+        licenses_changed.send(sender=License, license_ids=license_ids)
+        for status, changed_ids in changed_by_status.items():
+            license_status_changed.send(
+                sender=License,
+                license_ids=changed_ids,
+                status=status,
+                actor=f"brand:{brand.slug}",
+            )
+
+        logger.info("Bulk updated %s licenses for brand %s", len(updated), brand.slug)
+
+        return updated
+
+    @staticmethod
+    def get_licenses_by_email(customer_email: str, valid_only: bool = False):
         """
         Get all licenses for a customer email across all brands (US6).
+        With `valid_only`, only currently valid licenses (filtered in SQL).
         """
         customer_email = customer_email.lower()
 
+        license_queryset = License.objects.select_related("product__brand")
+        if valid_only:
+            license_queryset = license_queryset.effectively_valid()
+
         license_keys = LicenseKey.objects.filter(
             customer_email=customer_email
-        ).prefetch_related("licenses__product__brand")
+        ).prefetch_related(Prefetch("licenses", queryset=license_queryset))
 
         licenses = []
         for lk in license_keys:
             for license_obj in lk.licenses.all():
                 licenses.append(license_obj)
 
-        logger.info(f"Retrieved {len(licenses)} licenses for customer {customer_email}")
+        logger.info(
+            "Retrieved %s licenses for customer %s", len(licenses), customer_email
+        )
 
         return licenses
@@ -0,0 +1,297 @@
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core import metrics
+from core.catalog import catalog_cache
+from core.models import Brand, OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxService:
+    """
+    Transactional outbox for brand webhooks.
+
+    Services record events inside the transaction of the change, so an
+    event exists if and only if the change committed. `dispatch` claims due
+    events, POSTs them to each brand's webhook URL in batches and retries
+    failures with backoff. Delivery is at least once; receivers deduplicate
+    on the event id.
+    """
+
+    @staticmethod
+    def is_subscribed(brand: Brand) -> bool:
+        return bool(brand.webhook_url)
+
+    @staticmethod
+    def record(brand: Brand, event_type: str, payload) -> OutboxEvent | None:
+        """
+        Record one event for a brand. `payload` is a dict or a callable
+        returning one; a callable is only evaluated for brands with a
+        webhook, so payloads that need queries cost nothing otherwise.
+        """
+        if not OutboxService.is_subscribed(brand):
+            return None
+        if callable(payload):
+            payload = payload()
+        return OutboxEvent.objects.create(
+            brand=brand,
+            event_type=event_type,
+            payload=payload,
+            next_attempt_at=timezone.now(),
+        )
+
+    @staticmethod
+    def record_many(entries: list[dict]) -> int:
+        """
+        Record many events with a single INSERT.
+
+        Args:
+            entries: dicts with brand (a Brand), event_type and payload (a dict)
+        """
+        now = timezone.now()
+        events = [
+            OutboxEvent(
+                brand=entry["brand"],
+                event_type=entry["event_type"],
+                payload=entry["payload"],
+                next_attempt_at=now,
+            )
+            for entry in entries
+            if OutboxService.is_subscribed(entry["brand"])
+        ]
+        OutboxEvent.objects.bulk_create(events, batch_size=1000)
+        return len(events)
+
+    @staticmethod
+    def dispatch(limit: int = 1000, now=None) -> int:
+        """
+        Deliver up to `limit` due events. Returns the number of events
+        claimed (0 when nothing was due).
+        """
+        now = now or timezone.now()
+        events, lease_until = OutboxService._claim(limit, now)
+        if not events:
+            return 0
+
+        by_brand = {}
+        for event in events:
+            by_brand.setdefault(event.brand_id, []).append(event)
+
+        delivered, failed, abandoned = [], [], []
+        deliveries = []
+        for brand_id, brand_events in by_brand.items():
+            brand = catalog_cache.get_brand(brand_id)
+            if brand is None or not brand.webhook_url:
+                abandoned.extend((event, "No webhook URL") for event in brand_events)
+            else:
+                deliveries.append((brand, brand_events))
+
+        # No POST starts unless it can finish within the lease; events not
+        # attempted become due again when it expires
+        deadline = time.monotonic() + (
+            (lease_until - now).total_seconds() - 2 * settings.WEBHOOK_TIMEOUT
+        )
+
+        # HTTP calls run in threads; the database is only touched here
+        with ThreadPoolExecutor(max_workers=settings.WEBHOOK_CONCURRENCY) as pool:
+            results = pool.map(
+                lambda d: OutboxService._deliver_brand(*d, deadline=deadline),
+                deliveries,
+            )
+            for (_, brand_events), (sent, error) in zip(deliveries, results):
+                delivered.extend(brand_events[:sent])
+                if error is not None:
+                    failed.extend((event, error) for event in brand_events[sent:])
+
+        OutboxService._record_results(delivered, failed, abandoned, lease_until)
+
+        return len(events)
+
+    @staticmethod
+    @transaction.atomic
+    def _claim(limit: int, now) -> tuple[list[OutboxEvent], object]:
+        due = OutboxEvent.objects.filter(next_attempt_at__lte=now).order_by("id")
+        if connection.features.has_select_for_update_skip_locked:
+            # Concurrent dispatchers take disjoint events
+            due = due.select_for_update(skip_locked=True)
+        events = list(due[:limit])
+        # Lease: if this dispatcher dies, the events become due again. It
+        # also identifies this claim when the results are written.
+        lease_until = now + timedelta(seconds=OutboxService._lease_seconds(events))
+        OutboxEvent.objects.filter(id__in=[event.id for event in events]).update(
+            next_attempt_at=lease_until
+        )
+        return events, lease_until
+
+    @staticmethod
+    def _lease_seconds(events: list[OutboxEvent]) -> float:
+        """
+        Lease covering the worst-case delivery of `events`: brands are called
+        WEBHOOK_CONCURRENCY at a time, each POSTing its batches one after
+        another, and a POST may take a timeout to connect and one to answer.
+        """
+        per_brand = {}
+        for event in events:
+            per_brand[event.brand_id] = per_brand.get(event.brand_id, 0) + 1
+        if not per_brand:
+            return settings.WEBHOOK_LEASE
+        batches = -(-max(per_brand.values()) // settings.WEBHOOK_BATCH_SIZE)
+        waves = -(-len(per_brand) // settings.WEBHOOK_CONCURRENCY)
+        return settings.WEBHOOK_LEASE + waves * batches * 2 * settings.WEBHOOK_TIMEOUT
+
+    @staticmethod
+    def _deliver_brand(
+        brand, events: list[OutboxEvent], deadline: float
+    ) -> tuple[int, str | None]:
+        """
+        POST a brand's events batch by batch, stopping at the first failure
+        or when the lease is about to run out (`deadline`, monotonic time).
+        Returns (events delivered, error or None).
+        """
+        for start in range(0, len(events), settings.WEBHOOK_BATCH_SIZE):
+            if time.monotonic() > deadline:
+                logger.warning(
+                    "Webhooks: lease running out, %s events of brand %s left",
+                    len(events) - start,
+                    brand.slug,
+                )
+                return start, None
+            error = OutboxService._post(
+                brand, events[start : start + settings.WEBHOOK_BATCH_SIZE]
+            )
+            if error is not None:
+                return start, error
+        return len(events), None
+
+    @staticmethod
+    def _post(brand, events: list[OutboxEvent]) -> str | None:
+        body = json.dumps(
+            {
+                "events": [
+                    {
+                        "id": event.id,
+                        "type": event.event_type,
+                        "created_at": event.created_at,
+                        "data": event.payload,
+                    }
+                    for event in events
+                ]
+            },
+            cls=DjangoJSONEncoder,
+        ).encode()
+        headers = {"Content-Type": "application/json"}
+        if brand.webhook_secret:
+            timestamp = str(int(time.time()))
+            signature = hmac.new(
+                brand.webhook_secret.encode(),
+                timestamp.encode() + b"." + body,
+                hashlib.sha256,
+            ).hexdigest()
+            headers["X-Webhook-Signature"] = f"t={timestamp},v1={signature}"
+
+        request = urllib.request.Request(
+            brand.webhook_url, data=body, headers=headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(
+                request, timeout=settings.WEBHOOK_TIMEOUT
+            ) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            return f"HTTP {e.code}"
+        except (urllib.error.URLError, OSError) as e:
+            return str(getattr(e, "reason", e))
+        return None
+
+    @staticmethod
+    @transaction.atomic
+    def _record_results(delivered, failed, abandoned, lease_until):
+        # Only events still under this claim's lease: if it expired, another
+        # dispatcher may have claimed them and owns their state now
+        claimed = [event.id for event in delivered]
+        claimed += [event.id for event, _ in failed + abandoned]
+        owned = set(
+            OutboxEvent.objects.select_for_update()
+            .filter(id__in=claimed, next_attempt_at=lease_until)
+            .values_list("id", flat=True)
+        )
+        if len(owned) < len(claimed):
+            logger.warning(
+                "Webhooks: lease expired for %s events, results not recorded",
+                len(claimed) - len(owned),
+            )
+        delivered = [event for event in delivered if event.id in owned]
+        failed = [(event, error) for event, error in failed if event.id in owned]
+        abandoned = [(event, error) for event, error in abandoned if event.id in owned]
+
+        now = timezone.now()
+        retried = []
+        for event in delivered:
+            event.attempts += 1
+            event.delivered_at = now
+            event.next_attempt_at = None
+            event.last_error = ""
+        for event, error in failed:
+            event.attempts += 1
+            if event.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+                abandoned.append((event, error))
+                continue
+            event.last_error = error
+            event.next_attempt_at = now + timedelta(
+                seconds=OutboxService.backoff(event.attempts)
+            )
+            retried.append(event)
+        for event, error in abandoned:
+            event.next_attempt_at = None
+            event.last_error = error
+
+        OutboxEvent.objects.bulk_update(
+            delivered + retried + [event for event, _ in abandoned],
+            ["attempts", "delivered_at", "next_attempt_at", "last_error"],
+            batch_size=1000,
+        )
+
+        metrics.WEBHOOK_EVENTS.labels(result="delivered").inc(len(delivered))
+        metrics.WEBHOOK_EVENTS.labels(result="failed").inc(len(retried))
+        metrics.WEBHOOK_EVENTS.labels(result="abandoned").inc(len(abandoned))
+
+        logger.info(
+            "Webhooks: %s delivered, %s to retry, %s abandoned",
+            len(delivered),
+            len(retried),
+            len(abandoned),
+        )
+
+    @staticmethod
+    def backoff(attempts: int) -> float:
+        """Seconds before retry number `attempts`, with jitter."""
+        delay = min(
+            settings.WEBHOOK_BACKOFF_BASE * 2 ** (attempts - 1),
+            settings.WEBHOOK_BACKOFF_MAX,
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def purge(now=None) -> int:
+        """Delete delivered and abandoned events past WEBHOOK_RETENTION_DAYS."""
+        cutoff = (now or timezone.now()) - timedelta(
+            days=settings.WEBHOOK_RETENTION_DAYS
+        )
+        deleted, _ = OutboxEvent.objects.filter(
+            created_at__lt=cutoff, next_attempt_at__isnull=True
+        ).delete()
+        return deleted
@@ -0,0 +1,292 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from core.models import (
+    Activation,
+    ActivationHistory,
+    AuditLog,
+    Entitlement,
+    License,
+    Product,
+    UsageRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+SEAT_LIMIT_ACTION = "activation.seat_limit_reached"
+
+
+def _floor_hour(moment: datetime) -> datetime:
+    return moment.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _floor_day(moment: datetime) -> datetime:
+    return _floor_hour(moment).replace(hour=0)
+
+
+class RollupService:
+    """
+    Service maintaining the usage rollups read by the brand analytics API.
+
+    Each run recomputes the hourly buckets from the last bucket of the
+    previous run (which was still open, plus one hour of slack for late
+    commits) up to the current hour, then the daily buckets of the days it
+    touched. Only the activations and audit rows in that window are
+    scanned; recomputing a bucket is idempotent, so runs may overlap or be
+    retried. Hours without events are not stored: a missing hourly bucket
+    has no events, and its seat gauges are those of the last stored bucket
+    before it.
+    """
+
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    def run(now: datetime = None, since: datetime = None) -> int:
+        """
+        Bring the rollups up to `now`. `since` forces a recompute from that
+        time (backfill); the first run otherwise starts at the oldest
+        activation. Returns the number of rows written.
+
+        The range is processed one UTC day at a time, oldest first, each day
+        in its own transaction: an interrupted backfill resumes after the
+        last day it committed.
+        """
+        end = _floor_hour(now or timezone.now())
+        start = RollupService._resume_point(end) if since is None else since
+        start = min(_floor_hour(start), end)
+
+        products = dict(Product.objects.values_list("id", "brand_id"))
+        seats = RollupService._current_seats()
+        # Seat gauges walk back from the current counts: keep the net
+        # activations from the end of the window being written to now
+        daily = RollupService._count_events(start, end + HOUR, TruncDay)
+        net_after = defaultdict(int)
+        for (product_id, _), (activations, deactivations, _) in daily.items():
+            net_after[product_id] += activations - deactivations
+
+        written = 0
+        window_start = start
+        while window_start <= end:
+            day = _floor_day(window_start)
+            window_end = min(day + timedelta(days=1), end + HOUR)
+            for product_id in products:
+                activations, deactivations, _ = daily.get((product_id, day), (0, 0, 0))
+                net_after[product_id] -= activations - deactivations
+            written += RollupService._roll_up_window(
+                window_start, window_end, products, seats, net_after
+            )
+            window_start = window_end
+
+        logger.info(
+            "Rolled up usage from %s to %s: %s rows",
+            start.isoformat(),
+            end.isoformat(),
+            written,
+        )
+
+        return written
+
+    @staticmethod
+    def _roll_up_window(
+        start: datetime, end: datetime, products: dict, seats: dict, net_after: dict
+    ) -> int:
+        """
+        Recompute the hourly buckets in [start, end), within one day, and
+        that day's buckets. Hours without events are not stored, except the
+        last one of the window: it carries the seat gauges, and marks how
+        far the rollups got.
+        """
+        events = RollupService._count_events(start, end)
+        last = end - HOUR
+
+        rows = []
+        for product_id, brand_id in products.items():
+            active_seats, seats_purchased = seats.get(product_id, (0, 0))
+            active_seats -= net_after[product_id]
+            product_rows = []
+            # Walk back from the seat count at the end of the window: the
+            # count at the end of the previous hour is this one's minus its
+            # net activations
+            hour = last
+            while hour >= start:
+                counts = events.get((product_id, hour))
+                if counts is not None or hour == last:
+                    activations, deactivations, rejections = counts or (0, 0, 0)
+                    product_rows.append(
+                        UsageRollup(
+                            product_id=product_id,
+                            brand_id=brand_id,
+                            granularity=UsageRollup.Granularity.HOUR,
+                            bucket_start=hour,
+                            activations=activations,
+                            deactivations=deactivations,
+                            seat_limit_rejections=rejections,
+                            active_seats=max(active_seats, 0),
+                            seats_purchased=seats_purchased,
+                        )
+                    )
+                    active_seats -= activations - deactivations
+                hour -= HOUR
+            rows.extend(reversed(product_rows))
+
+        with transaction.atomic():
+            # Hours that no longer have events must not keep old counts
+            UsageRollup.objects.filter(
+                granularity=UsageRollup.Granularity.HOUR,
+                bucket_start__gte=start,
+                bucket_start__lt=end,
+            ).delete()
+            written = RollupService._write(rows)
+            written += RollupService._roll_up_days([_floor_day(start)])
+        return written
+
+    @staticmethod
+    def _resume_point(end: datetime) -> datetime:
+        last = UsageRollup.objects.filter(
+            granularity=UsageRollup.Granularity.HOUR
+        ).aggregate(last=Max("bucket_start"))["last"]
+        if last is not None:
+            return last - HOUR
+        firsts = [
+            model.objects.aggregate(first=Min("activated_at"))["first"]
+            for model in (Activation, ActivationHistory)
+        ]
+        return min((first for first in firsts if first is not None), default=end)
+
+    @staticmethod
+    def _count_events(start: datetime, end: datetime, trunc=TruncHour) -> dict:
+        """
+        {(product_id, bucket): (activations, deactivations, rejections)},
+        with buckets truncated by `trunc` (hours or days).
+        """
+        counts = defaultdict(lambda: [0, 0, 0])
+
+        # Archived activations only matter when recomputing old buckets
+        for model in (Activation, ActivationHistory):
+            for index, field in enumerate(("activated_at", "deactivated_at")):
+                rows = (
+                    model.objects.filter(
+                        **{f"{field}__gte": start, f"{field}__lt": end}
+                    )
+                    .annotate(bucket=trunc(field, tzinfo=dt_timezone.utc))
+                    .values("license__product_id", "bucket")
+                    .annotate(n=Count("id"))
+                    .order_by()
+                )
+                for row in rows:
+                    key = (row["license__product_id"], row["bucket"])
+                    counts[key][index] += row["n"]
+
+        rejections = list(
+            AuditLog.objects.filter(
+                action=SEAT_LIMIT_ACTION, created_at__gte=start, created_at__lt=end
+            )
+            .annotate(bucket=trunc("created_at", tzinfo=dt_timezone.utc))
+            .values("entity_id", "bucket")
+            .annotate(n=Count("id"))
+            .order_by()
+        )
+        if rejections:
+            product_ids = dict(
+                License.objects.filter(
+                    id__in={row["entity_id"] for row in rejections}
+                ).values_list("id", "product_id")
+            )
+            for row in rejections:
+                product_id = product_ids.get(row["entity_id"])
+                if product_id is not None:
+                    counts[(product_id, row["bucket"])][2] += row["n"]
+
+        return {key: tuple(value) for key, value in counts.items()}
+
+    @staticmethod
+    def _current_seats() -> dict:
+        """
+        {product_id: (active_seats, seats_purchased)} from the entitlements
+        read model. Purchased seats are the seat limits of currently valid
+        licenses; unlimited licenses add none.
+        """
+        rows = (
+            Entitlement.objects.values("product_id")
+            .annotate(
+                active=Sum("seats_used"),
+                purchased=Sum(
+                    "seats_total",
+                    filter=Q(status=License.Status.VALID)
+                    & (Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())),
+                ),
+            )
+            .order_by()
+        )
+        return {
+            row["product_id"]: (row["active"] or 0, row["purchased"] or 0)
+            for row in rows
+        }
+
+    @staticmethod
+    def _roll_up_days(days: list) -> int:
+        if not days:
+            return 0
+        hourly = UsageRollup.objects.filter(
+            granularity=UsageRollup.Granularity.HOUR,
+            bucket_start__gte=days[0],
+            bucket_start__lt=days[-1] + timedelta(days=1),
+        ).order_by("bucket_start")
+
+        totals = {}
+        for row in hourly.iterator(chunk_size=RollupService.BATCH_SIZE):
+            key = (row.product_id, _floor_day(row.bucket_start))
+            day = totals.get(key)
+            if day is None:
+                day = totals[key] = UsageRollup(
+                    product_id=row.product_id,
+                    brand_id=row.brand_id,
+                    granularity=UsageRollup.Granularity.DAY,
+                    bucket_start=key[1],
+                )
+            day.activations += row.activations
+            day.deactivations += row.deactivations
+            day.seat_limit_rejections += row.seat_limit_rejections
+            # Gauges: the day ends where its last hour ends
+            day.active_seats = row.active_seats
+            day.seats_purchased = row.seats_purchased
+
+        return RollupService._write(list(totals.values()))
+
+    @staticmethod
+    def _write(rows: list[UsageRollup]) -> int:
+        UsageRollup.objects.bulk_create(
+            rows,
+            batch_size=RollupService.BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["product", "granularity", "bucket_start"],
+            update_fields=UsageRollup.UPDATE_FIELDS,
+        )
+        return len(rows)
+
+    @staticmethod
+    def get_usage(
+        brand, granularity: str, since: datetime, until: datetime, product=None
+    ):
+        """
+        Rollup rows of a brand in [since, until), ordered by product and
+        time. Served by the (brand, granularity, bucket_start) index.
+        """
+        rows = UsageRollup.objects.filter(
+            brand=brand,
+            granularity=granularity,
+            bucket_start__gte=since,
+            bucket_start__lt=until,
+        )
+        if product is not None:
+            rows = rows.filter(product=product)
+        return list(rows.order_by("product_id", "bucket_start"))
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Change feed for license state. Sent with `license_ids` (list of UUIDs),
+# `status` (the new status) and `actor` once the change is saved; receivers
+# run inside the caller's transaction when there is one.
+license_status_changed = Signal()
+
+# Sent with `license_ids` when license rows are written in bulk (queryset
+# update or bulk_update), which bypasses post_save.
+licenses_changed = Signal()
@@ -0,0 +1,243 @@
+"""
+Shared cache of license status responses with single-flight rebuilds.
+
+Status responses are cached in the STATUS_CACHE_ALIAS Django cache for
+STATUS_CACHE_TTL seconds, or until the first license of the key expires if
+that is sooner. Cache keys include the catalog version, so brand and product
+edits retire every entry. Changes to a key, its licenses or its activations
+invalidate that key's entry (core/receivers.py), once right away and once
+after commit.
+
+When an entry is missing, only one caller rebuilds it:
+
+- within a process, callers asking for a key that a thread is already
+  building wait for that thread's result (or exception)
+- across processes, the building process holds a lock taken with
+  `cache.add()`; other processes poll the cache for its result
+
+A caller that waited STATUS_CACHE_WAIT seconds without a result builds the
+entry itself, so a stuck builder delays requests but never fails them.
+
+Batch status checks read and store many entries at once (`get_many()`,
+`set_many()`) without single flight: their keys are built together anyway.
+
+Invalidation writes a timestamped tombstone rather than deleting the entry:
+a build that started before the invalidation must not store its result,
+which may predate the change.
+
+Cache backend errors (e.g. Redis down) never fail a request or a write:
+they are logged, failed reads count as misses and failed writes as no-ops.
+Entries missed by a failed invalidation expire within STATUS_CACHE_TTL.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from core import metrics
+from core.catalog import catalog_cache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATED = "invalidated"
+
+# Seconds between cache reads while another process builds an entry
+POLL_INTERVAL = 0.02
+
+
+class _Flight:
+    """One in-process build of an entry, shared by every caller waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class _TolerantCache:
+    """The cache methods StatusCache uses, logging backend errors instead of raising."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def get(self, key):
+        return self._call("get", None, key)
+
+    def get_many(self, keys):
+        return self._call("get_many", {}, keys)
+
+    def add(self, key, value, timeout):
+        # Without a shared lock, build the entry here
+        return self._call("add", True, key, value, timeout=timeout)
+
+    def set(self, key, value, timeout):
+        self._call("set", None, key, value, timeout=timeout)
+
+    def set_many(self, values, timeout):
+        self._call("set_many", None, values, timeout=timeout)
+
+    def delete(self, key):
+        self._call("delete", None, key)
+
+    def _call(self, method: str, default, *args, **kwargs):
+        try:
+            return getattr(self.cache, method)(*args, **kwargs)
+        except Exception as e:
+            metrics.STATUS_CACHE_REQUESTS.labels(result="error").inc()
+            logger.warning(
+                "Status cache %s failed: %s: %s", method, type(e).__name__, e
+            )
+            return default
+
+
+class StatusCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+
+    def get(self, license_key: str, build):
+        """
+        Cached status of `license_key`; on a miss `build()` computes it,
+        once for all concurrent callers.
+        """
+        if not settings.STATUS_CACHE_ENABLED:
+            return build()
+
+        cache = self._cache()
+        key = self._key(license_key)
+        value = cache.get(key)
+        if isinstance(value, dict):
+            metrics.STATUS_CACHE_REQUESTS.labels(result="hit").inc()
+            return value
+
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = _Flight()
+
+        if not leader:
+            metrics.STATUS_CACHE_REQUESTS.labels(result="coalesced").inc()
+            if not flight.done.wait(settings.STATUS_CACHE_WAIT):
+                return build()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self._build(cache, key, build)
+            return flight.value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+    def get_many(self, license_keys) -> dict:
+        """Cached statuses of the given keys that have an entry, in one read."""
+        if not settings.STATUS_CACHE_ENABLED or not license_keys:
+            return {}
+        keys = {self._key(license_key): license_key for license_key in license_keys}
+        values = self._cache().get_many(keys)
+        hits = {
+            keys[key]: value for key, value in values.items() if isinstance(value, dict)
+        }
+        if hits:
+            metrics.STATUS_CACHE_REQUESTS.labels(result="hit").inc(len(hits))
+        metrics.STATUS_CACHE_REQUESTS.labels(result="miss").inc(len(keys) - len(hits))
+        return hits
+
+    def set_many(self, statuses: dict, started: float):
+        """
+        Store statuses (license key to status) built from a read that
+        started at Unix time `started`, except those invalidated since.
+        """
+        if not settings.STATUS_CACHE_ENABLED or not statuses:
+            return
+        cache = self._cache()
+        keys = {self._key(license_key): license_key for license_key in statuses}
+        current = cache.get_many(keys)
+        by_timeout = defaultdict(dict)
+        for key, license_key in keys.items():
+            if not self._invalidated_since(current.get(key), started):
+                value = statuses[license_key]
+                by_timeout[self._timeout(value)][key] = value
+        for timeout, values in by_timeout.items():
+            cache.set_many(values, timeout=timeout)
+
+    def invalidate(self, license_keys):
+        """Retire the cached status of the given license key strings."""
+        if not settings.STATUS_CACHE_ENABLED or not license_keys:
+            return
+        tombstone = (INVALIDATED, time.time())
+        self._cache().set_many(
+            {self._key(license_key): tombstone for license_key in license_keys},
+            timeout=settings.STATUS_CACHE_TTL,
+        )
+
+    def _build(self, cache, key: str, build):
+        lock_key = f"{key}:lock"
+        locked = cache.add(lock_key, 1, timeout=settings.STATUS_CACHE_LOCK_TIMEOUT)
+        if not locked:
+            # Another process is building it: wait for its result
+            deadline = time.monotonic() + settings.STATUS_CACHE_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(POLL_INTERVAL)
+                value = cache.get(key)
+                if isinstance(value, dict):
+                    metrics.STATUS_CACHE_REQUESTS.labels(result="coalesced").inc()
+                    return value
+
+        metrics.STATUS_CACHE_REQUESTS.labels(result="miss").inc()
+        started = time.time()
+        try:
+            value = build()
+            if not self._invalidated_since(cache.get(key), started):
+                cache.set(key, value, timeout=self._timeout(value))
+        finally:
+            if locked:
+                cache.delete(lock_key)
+        return value
+
+    @staticmethod
+    def _cache() -> _TolerantCache:
+        return _TolerantCache(caches[settings.STATUS_CACHE_ALIAS])
+
+    @staticmethod
+    def _invalidated_since(current, started: float) -> bool:
+        # Clocks of different hosts only need to agree within a build
+        return (
+            isinstance(current, tuple)
+            and current[0] == INVALIDATED
+            and current[1] >= started
+        )
+
+    @staticmethod
+    def _key(license_key: str) -> str:
+        # Hashed: license keys come from the URL and may not be valid cache keys
+        digest = hashlib.blake2b(license_key.encode(), digest_size=16).hexdigest()
+        return f"status:{catalog_cache.get_version()}:{digest}"
+
+    @staticmethod
+    def _timeout(value: dict) -> float:
+        # `is_valid` flips when a license expires: do not serve it past that
+        timeout = settings.STATUS_CACHE_TTL
+        now = timezone.now()
+        for license_data in value["licenses"]:
+            if license_data["expires_at"] is not None:
+                expires_at = datetime.fromisoformat(license_data["expires_at"])
+                if expires_at > now:
+                    timeout = min(timeout, (expires_at - now).total_seconds())
+        return max(timeout, 1)
+
+
+status_cache = StatusCache()
@@ -0,0 +1,171 @@
+"""
+Last-known-good license statuses for serving during database outages.
+
+Every successful status build is also written to a SQLite file on the local
+disk (STATUS_FALLBACK_PATH), shared by the workers of a host in WAL mode.
+When the database fails or its circuit breaker is open, the status view
+serves the stored status, marked stale, instead of an error, so client
+plugins keep working. Entries older than STATUS_FALLBACK_MAX_AGE are not
+served. Licenses whose expiry passed since the entry was stored are served
+as invalid.
+
+Entries are stored under a digest of the license key, without the key
+itself; the customer email is encrypted with a keystream derived from the
+key. Both are restored from the key asked for when reading, so the file
+alone reveals neither. The file is created with mode 0600.
+
+The store is best effort: its own errors are logged and never fail a
+request.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from core.circuit import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class LastKnownGoodStore:
+    def __init__(self):
+        # One connection per thread (and process: never used across fork)
+        self.local = threading.local()
+
+    def put(self, license_key: str, status: dict):
+        self.put_many({license_key: status})
+
+    def put_many(self, statuses: dict):
+        """Store statuses (license key to status) in one transaction."""
+        if not settings.STATUS_FALLBACK_ENABLED or not statuses:
+            return
+        now = time.time()
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(
+                    "INSERT INTO status (key, payload, stored_at) "
+                    "VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "payload = excluded.payload, stored_at = excluded.stored_at",
+                    [
+                        (
+                            self._key(license_key),
+                            json.dumps(
+                                self._seal(license_key, status), cls=DjangoJSONEncoder
+                            ),
+                            now,
+                        )
+                        for license_key, status in statuses.items()
+                    ],
+                )
+        except (sqlite3.Error, OSError):
+            logger.warning("Could not store last known good status", exc_info=True)
+
+    def get(self, license_key: str) -> tuple[dict, float] | None:
+        """(status, stored_at as Unix time) of a key, or None."""
+        if not settings.STATUS_FALLBACK_ENABLED:
+            return None
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT payload, stored_at FROM status WHERE key = ? "
+                    "AND stored_at >= ?",
+                    (
+                        self._key(license_key),
+                        time.time() - settings.STATUS_FALLBACK_MAX_AGE,
+                    ),
+                )
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError):
+            logger.warning("Could not read last known good status", exc_info=True)
+            return None
+        if row is None:
+            return None
+        return self._expire(self._unseal(license_key, json.loads(row[0]))), row[1]
+
+    @staticmethod
+    def _expire(status: dict) -> dict:
+        now = timezone.now()
+        for license_data in status["licenses"]:
+            expires_at = license_data["expires_at"]
+            if expires_at is not None and datetime.fromisoformat(expires_at) <= now:
+                license_data["is_valid"] = False
+        status["valid"] = any(lic["is_valid"] for lic in status["licenses"])
+        return status
+
+    @staticmethod
+    def _key(license_key: str) -> bytes:
+        return hashlib.blake2b(license_key.encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _xor(license_key: str, data: bytes) -> bytes:
+        stream = hashlib.shake_256(b"customer_email:" + license_key.encode())
+        return bytes(a ^ b for a, b in zip(data, stream.digest(len(data))))
+
+    @classmethod
+    def _seal(cls, license_key: str, status: dict) -> dict:
+        sealed = {
+            name: value
+            for name, value in status.items()
+            if name not in ("license_key", "customer_email")
+        }
+        email = status["customer_email"]
+        if email is not None:
+            email = base64.b64encode(cls._xor(license_key, email.encode())).decode()
+        sealed["customer_email"] = email
+        return sealed
+
+    @classmethod
+    def _unseal(cls, license_key: str, sealed: dict) -> dict:
+        email = sealed.pop("customer_email")
+        if email is not None:
+            email = cls._xor(license_key, base64.b64decode(email)).decode()
+        return {"license_key": license_key, "customer_email": email, **sealed}
+
+    def _connection(self) -> sqlite3.Connection:
+        path = str(settings.STATUS_FALLBACK_PATH)
+        owner = (os.getpid(), path)
+        if getattr(self.local, "owner", None) != owner:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            # SQLite gives its -wal and -shm files the mode of the database
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+            os.chmod(path, 0o600)
+            connection = sqlite3.connect(path, timeout=1, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS status "
+                "(key BLOB PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "DELETE FROM status WHERE stored_at < ?",
+                (time.time() - settings.STATUS_FALLBACK_MAX_AGE,),
+            )
+            self.local.connection = connection
+            self.local.owner = owner
+        return self.local.connection
+
+
+status_store = LastKnownGoodStore()
+
+# Guards the database calls of status builds
+status_breaker = CircuitBreaker(
+    "status_db",
+    failure_threshold=settings.STATUS_BREAKER_FAILURES,
+    reset_timeout=settings.STATUS_BREAKER_RESET_TIMEOUT,
+)
@@ -0,0 +1,39 @@
+"""
+Built-in background tasks, run by `manage.py run_worker` (see core/jobs.py).
+"""
+
+from core import jobs
+from core.jobs import task
+from core.services import ArchiveService, ExpiryService, OutboxService, RollupService
+
+
+@task("expire_licenses")
+def expire_licenses(batch_size: int = 1000):
+    ExpiryService.expire_licenses(batch_size=batch_size)
+
+
+@task("archive_activations")
+def archive_activations(batch_size: int = 1000):
+    ArchiveService.archive_activations(batch_size=batch_size)
+
+
+@task("rollup_usage")
+def rollup_usage():
+    RollupService.run()
+
+
+@task("dispatch_webhooks")
+def dispatch_webhooks(limit: int = 1000):
+    # Drain what is due now; the schedule brings the next run
+    while OutboxService.dispatch(limit=limit) == limit:
+        pass
+
+
+@task("purge_outbox")
+def purge_outbox():
+    OutboxService.purge()
+
+
+@task("purge_jobs")
+def purge_jobs():
+    jobs.purge()
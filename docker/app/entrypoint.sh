@@ -1,6 +1,12 @@
 #!/bin/sh
 set -e
 
+# Per-worker metric files must not survive a restart
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 python manage.py migrate --noinput
 
 exec "$@"
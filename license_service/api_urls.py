@@ -0,0 +1,9 @@
+from django.urls import include, path
+
+from api.v1.views import MetricsView
+
+# URLconf of API-only workers (settings/api.py): no admin
+urlpatterns = [
+    path("api/v1/", include("api.v1.urls")),
+    path("metrics", MetricsView.as_view(), name="metrics"),
+]
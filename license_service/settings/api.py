@@ -0,0 +1,7 @@
+from .prod import *
+
+# API workers only; the admin runs as a separate deployment on prod settings
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_EXCLUDED_APPS]
+MIDDLEWARE = API_MIDDLEWARE
+ROOT_URLCONF = "license_service.api_urls"
+TEMPLATES = []
@@ -35,6 +35,20 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "license_service.urls"
 
+# Lean profile for API-only workers (settings/api.py): header-based API key
+# auth needs no sessions, CSRF, messages, templates or admin. auth and
+# contenttypes stay for DRF's AnonymousUser and the permission models.
+API_EXCLUDED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+]
+API_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -61,6 +75,9 @@ DATABASES = {
         "PASSWORD": os.environ.get("DB_PASSWORD", "postgres"),
         "HOST": os.environ.get("DB_HOST", "db"),
         "PORT": os.environ.get("DB_PORT", "5432"),
+        # Fail fast when the server is unreachable, so the status endpoint
+        # can fall back to the last known good status (core/status_fallback.py)
+        "OPTIONS": {"connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", 3))},
     }
 }
 
@@ -102,6 +119,139 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
     "EXCEPTION_HANDLER": "api.v1.views.custom_exception_handler",
+    # Token buckets for public endpoints: "<scope>_ip" per client IP,
+    # "<scope>_key" per license key (or activation id). N/period is the
+    # burst size, refilled evenly over the period.
+    "DEFAULT_THROTTLE_RATES": {
+        "activation_ip": "60/min",
+        "activation_key": "20/min",
+        "deactivation_ip": "60/min",
+        "deactivation_key": "20/min",
+        "status_ip": "600/min",
+        "status_key": "120/min",
+        # Batch status checks cost one token per key
+        "status_batch_ip": "1000/min",
+    },
+}
+
+# Caches shared by every process (API workers, job workers, admin): the
+# catalog version key, the status cache and its invalidations must reach all
+# of them. core/checks.py rejects a process-local backend for those aliases
+# outside DEBUG.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://redis:6379/0"),
+        "OPTIONS": {"socket_connect_timeout": 0.5, "socket_timeout": 0.5},
+    }
+}
+
+# "local": per-process buckets, no I/O. "cache": buckets shared by all
+# workers through the RATE_LIMIT_CACHE alias (use Redis/Memcached there).
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "local")
+RATE_LIMIT_CACHE = "default"
+
+# In-process Brand/Product cache (core/catalog.py). Workers poll a version
+# key in CATALOG_CACHE_ALIAS every CHECK_INTERVAL seconds to pick up changes
+# made by other workers; TTL bounds staleness if that cache is unreachable.
+CATALOG_CACHE_ALIAS = "default"
+CATALOG_CACHE_CHECK_INTERVAL = float(os.environ.get("CATALOG_CACHE_CHECK_INTERVAL", 1))
+CATALOG_CACHE_TTL = float(os.environ.get("CATALOG_CACHE_TTL", 300))
+
+# Shared cache of license status responses (core/status_cache.py). Concurrent
+# misses for one key are rebuilt once: other threads wait on the builder,
+# other processes poll STATUS_CACHE_ALIAS for its result, in both cases for
+# up to STATUS_CACHE_WAIT seconds. The alias must be shared by all processes.
+STATUS_CACHE_ENABLED = os.environ.get("STATUS_CACHE_ENABLED", "1") == "1"
+STATUS_CACHE_ALIAS = "default"
+STATUS_CACHE_TTL = float(os.environ.get("STATUS_CACHE_TTL", 30))
+STATUS_CACHE_WAIT = 2.0
+STATUS_CACHE_LOCK_TIMEOUT = 10
+
+# Stale-if-error for the status endpoint (core/status_fallback.py). Status
+# builds run with a STATUS_DB_TIMEOUT_MS statement timeout on PostgreSQL;
+# after STATUS_BREAKER_FAILURES consecutive database errors the worker stops
+# querying for STATUS_BREAKER_RESET_TIMEOUT seconds. Meanwhile statuses come
+# from a per-host SQLite file of the last good builds, up to MAX_AGE old.
+# The file is created readable by the service user only, in a directory it
+# owns (not a shared one like /tmp).
+STATUS_FALLBACK_ENABLED = os.environ.get("STATUS_FALLBACK_ENABLED", "1") == "1"
+STATUS_FALLBACK_PATH = os.environ.get(
+    "STATUS_FALLBACK_PATH", BASE_DIR / "var" / "status_fallback.sqlite3"
+)
+STATUS_FALLBACK_MAX_AGE = 7 * 24 * 3600
+STATUS_DB_TIMEOUT_MS = int(os.environ.get("STATUS_DB_TIMEOUT_MS", 2000))
+STATUS_BREAKER_FAILURES = 5
+STATUS_BREAKER_RESET_TIMEOUT = 10.0
+
+# Worker-local Bloom filter rejecting unknown license keys without a query
+# (core/bloom.py). Needs a CATALOG_CACHE_ALIAS cache shared by all workers,
+# otherwise a worker cannot learn about keys created by another one.
+LICENSE_KEY_FILTER_ENABLED = os.environ.get("LICENSE_KEY_FILTER_ENABLED") == "1"
+LICENSE_KEY_FILTER_ERROR_RATE = 0.001
+LICENSE_KEY_FILTER_OVERLAP = 300
+
+# Preload apps, URLs, caches (and the key filter) when a worker starts
+WARMUP_ON_STARTUP = os.environ.get("WARMUP_ON_STARTUP", "1") == "1"
+
+# Rows fetched per server-side cursor round trip by the streaming exports
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
+
+# Admin changelists of large tables show planner estimates instead of
+# COUNT(*) (core/admin.py); estimates below this are counted exactly
+ADMIN_EXACT_COUNT_LIMIT = 10_000
+
+# Webhook delivery of outbox events (core/services/outbox_service.py).
+# Events of one brand are POSTed in batches of up to WEBHOOK_BATCH_SIZE; at
+# most WEBHOOK_CONCURRENCY brands are called in parallel. Failed batches are
+# retried with exponential backoff (BASE * 2^attempt seconds, capped at MAX,
+# jittered) up to WEBHOOK_MAX_ATTEMPTS times.
+WEBHOOK_BATCH_SIZE = 100
+WEBHOOK_CONCURRENCY = int(os.environ.get("WEBHOOK_CONCURRENCY", 8))
+WEBHOOK_TIMEOUT = 5
+WEBHOOK_MAX_ATTEMPTS = 12
+WEBHOOK_BACKOFF_BASE = 10
+WEBHOOK_BACKOFF_MAX = 3600
+# Claimed events are invisible to other dispatchers for this many seconds,
+# plus the worst-case time to POST them (OutboxService._lease_seconds)
+WEBHOOK_LEASE = 60
+WEBHOOK_RETENTION_DAYS = 7
+
+# Background job queue (core/jobs.py, `manage.py run_worker`). JOB_SCHEDULE
+# maps a task to its interval in seconds; workers enqueue one run per
+# interval between them. Running jobs renew their JOB_LEASE every
+# JOB_HEARTBEAT_INTERVAL seconds; a job is only requeued when its worker
+# stopped renewing it.
+JOB_POLL_INTERVAL = 1.0
+JOB_LEASE = 600
+JOB_HEARTBEAT_INTERVAL = 60
+JOB_RETRY_DELAY = 30
+JOB_RETENTION_DAYS = 7
+JOB_SCHEDULE = {
+    "expire_licenses": 300,
+    "rollup_usage": 300,
+    "dispatch_webhooks": 10,
+    "purge_outbox": 3600,
+    "purge_jobs": 3600,
+    "archive_activations": 3600,
+}
+
+# Activations deactivated longer ago than this move to activation_history
+# (core/services/archive_service.py)
+ACTIVATION_ARCHIVE_AFTER_DAYS = int(os.environ.get("ACTIVATION_ARCHIVE_AFTER_DAYS", 30))
+
+# Optional bearer token protecting the Prometheus /metrics endpoint
+METRICS_AUTH_TOKEN = os.environ.get("METRICS_AUTH_TOKEN")
+
+# Log records are written by a background thread (core/log.py) from a queue
+# of up to LOG_QUEUE_SIZE records; LOG_ASYNC=0 writes them synchronously.
+# LOG_SAMPLE_RATES keeps that fraction of the INFO/DEBUG records of chatty
+# loggers (and their children); warnings and errors are always kept.
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "1") == "1"
+LOG_QUEUE_SIZE = 10_000
+LOG_SAMPLE_RATES = {
+    "core.services.activation_service": 0.1,
+    "core.services.audit_service": 0.1,
 }
 
 LOGGING = {
@@ -117,10 +267,21 @@ LOGGING = {
             "format": "%(asctime)s %(name)s %(levelname)s %(message)s",
         },
     },
+    "filters": {
+        "sampling": {
+            "()": "core.log.SamplingFilter",
+            "rates": LOG_SAMPLE_RATES,
+        },
+    },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            **(
+                {"()": "core.log.QueueListenerHandler", "queue_size": LOG_QUEUE_SIZE}
+                if LOG_ASYNC
+                else {"class": "logging.StreamHandler"}
+            ),
             "formatter": "verbose",
+            "filters": ["sampling"],
         },
     },
     "root": {
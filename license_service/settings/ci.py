@@ -11,6 +11,11 @@ DATABASES = {
     }
 }
 
+# Tests run in one process: a process-local cache is shared by everything
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
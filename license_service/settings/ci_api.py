@@ -0,0 +1,7 @@
+from .ci import *
+
+# The API worker profile on the CI database, to run the suite against it
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_EXCLUDED_APPS]
+MIDDLEWARE = API_MIDDLEWARE
+ROOT_URLCONF = "license_service.api_urls"
+TEMPLATES = []
@@ -9,3 +9,4 @@ INSTALLED_APPS += []
 LOGGING["root"]["level"] = "DEBUG"
 LOGGING["loggers"]["core"]["level"] = "DEBUG"
 LOGGING["loggers"]["api"]["level"] = "DEBUG"
+LOGGING["filters"]["sampling"]["rates"] = {}
@@ -0,0 +1,99 @@
+"""
+Worker warm-up, run from wsgi.py/asgi.py before a worker accepts traffic.
+
+With uWSGI `lazy-apps` every worker (and every worker recycled by
+`max-requests`) loads the application itself, so without this the first
+requests of each worker pay for lazy imports, URL resolver population and
+empty caches.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.urls import get_resolver, reverse
+from rest_framework.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+# One representative path per endpoint; resolving them fills the resolver's
+# per-pattern caches
+WARMUP_PATHS = [
+    "/api/v1/licenses/WARMUP/status",
+    "/api/v1/products/activations",
+    "/api/v1/products/activations/00000000-0000-0000-0000-000000000000",
+    "/api/v1/brands/license-keys",
+    "/api/v1/brands/licenses",
+    "/api/v1/brands/licenses/search",
+    "/api/v1/brands/licenses/bulk",
+    "/api/v1/brands/licenses/00000000-0000-0000-0000-000000000000",
+    "/api/v1/brands/exports/licenses",
+    "/api/v1/brands/analytics",
+    "/metrics",
+]
+
+
+def _warm_urls():
+    resolver = get_resolver()
+    for path in WARMUP_PATHS:
+        resolver.resolve(path)
+    # Populates the reverse lookup tables
+    reverse("license-status", args=["WARMUP"])
+
+
+def _warm_drf():
+    # Importing the configured classes is otherwise done by the first request
+    for name in (
+        "DEFAULT_RENDERER_CLASSES",
+        "DEFAULT_PARSER_CLASSES",
+        "DEFAULT_AUTHENTICATION_CLASSES",
+        "DEFAULT_PERMISSION_CLASSES",
+        "DEFAULT_THROTTLE_CLASSES",
+        "EXCEPTION_HANDLER",
+    ):
+        getattr(api_settings, name)
+
+    from api.v1 import serializers
+
+    for name in serializers.__all__:
+        getattr(serializers, name)().fields
+
+
+def _warm_catalog():
+    from core.catalog import catalog_cache
+
+    return catalog_cache.preload()
+
+
+def _warm_license_keys():
+    from core.bloom import license_key_filter
+
+    if settings.LICENSE_KEY_FILTER_ENABLED:
+        return license_key_filter.build()
+
+
+STEPS = [
+    ("urls", _warm_urls),
+    ("drf", _warm_drf),
+    ("catalog", _warm_catalog),
+    ("license_keys", _warm_license_keys),
+]
+
+
+def warm_up() -> dict:
+    """
+    Run every warm-up step and return {step: seconds}. A failing step is
+    logged and skipped: warm-up must never keep a worker from starting.
+    """
+    timings = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
+        timings[name] = round(time.perf_counter() - start, 4)
+
+    logger.info("Worker warm-up done: %s", timings)
+
+    return timings
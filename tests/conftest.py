@@ -1,10 +1,39 @@
 import hashlib
 
 import pytest
+from django.core.cache import caches
 from django.utils import timezone
 from rest_framework.test import APIClient
 
+from api.v1.throttling import _local_store
+from core.catalog import catalog_cache
 from core.models import Activation, Brand, License, LicenseKey, Product
+from core.status_fallback import status_breaker
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start every test with full token buckets."""
+    _local_store.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog_cache():
+    """Start every test with an empty brand/product cache."""
+    catalog_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_status_cache(settings):
+    """Start every test with an empty status cache."""
+    caches[settings.STATUS_CACHE_ALIAS].clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_status_fallback(settings, tmp_path):
+    """Give every test its own last known good store and a closed circuit."""
+    settings.STATUS_FALLBACK_PATH = tmp_path / "status_fallback.sqlite3"
+    status_breaker.reset()
 
 
 @pytest.fixture
@@ -100,10 +129,11 @@ def license_rankmath_pro(license_key_rankmath, product_rankmath_pro):
 
 
 @pytest.fixture
-def activation(license_rankmath_pro):
-    """Create an activation for testing."""
-    return Activation.objects.create(
-        license=license_rankmath_pro,
-        instance_identifier="https://example.com",
-        metadata={"plugin_version": "1.0.0"},
-    )
+def activation(license_rankmath_pro, django_capture_on_commit_callbacks):
+    """Create an activation for testing (seat counts refreshed as on commit)."""
+    with django_capture_on_commit_callbacks(execute=True):
+        return Activation.objects.create(
+            license=license_rankmath_pro,
+            instance_identifier="https://example.com",
+            metadata={"plugin_version": "1.0.0"},
+        )
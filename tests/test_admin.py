@@ -0,0 +1,83 @@
+import pytest
+from django.apps import apps
+from django.urls import reverse
+
+from core.models import Activation, AuditLog, License, LicenseKey
+
+pytestmark = pytest.mark.skipif(
+    not apps.is_installed("django.contrib.admin"),
+    reason="the API-only settings profile has no admin",
+)
+
+
+@pytest.fixture
+def licenses(license_rankmath_pro, product_content_ai):
+    """Twenty more licenses with an activation each, besides RankMath Pro."""
+    for i in range(20):
+        other = License.objects.create(
+            license_key=LicenseKey.objects.create(
+                key=f"RANKMATH-OTHER-{i:02d}",
+                brand=license_rankmath_pro.license_key.brand,
+                customer_email=f"other{i}@example.com",
+            ),
+            product=product_content_ai,
+        )
+        Activation.objects.create(
+            license=other, instance_identifier=f"https://other{i}.com"
+        )
+    return license_rankmath_pro
+
+
+@pytest.mark.django_db
+class TestAdmin:
+    """Test the admin changelists of the large tables."""
+
+    @pytest.mark.parametrize(
+        "model", ["licensekey", "license", "activation", "auditlog"]
+    )
+    def test_changelist_queries_do_not_grow_with_rows(
+        self, model, admin_client, licenses, django_assert_max_num_queries
+    ):
+        """Test that related rows are joined instead of loaded per row."""
+        with django_assert_max_num_queries(12):
+            response = admin_client.get(reverse(f"admin:core_{model}_changelist"))
+
+        assert response.status_code == 200
+
+    def test_search_exact_and_prefix(self, admin_client, licenses):
+        """Test key, email and identifier search without substring matching."""
+        url = reverse("admin:core_license_changelist")
+        key = licenses.license_key.key
+
+        response = admin_client.get(url, {"q": key})
+        assert list(response.context["cl"].result_list) == [licenses]
+
+        response = admin_client.get(url, {"q": key[:-1]})
+        assert list(response.context["cl"].result_list) == []
+
+        response = admin_client.get(
+            reverse("admin:core_licensekey_changelist"), {"q": "RANKMATH-OTHER-1"}
+        )
+        assert response.context["cl"].result_count == 10
+
+        activation = Activation.objects.get(instance_identifier="https://other7.com")
+        response = admin_client.get(
+            reverse("admin:core_activation_changelist"), {"q": "WWW.other7.com/"}
+        )
+        assert list(response.context["cl"].result_list) == [activation]
+
+    def test_audit_log_search_by_entity(self, admin_client, licenses):
+        """Test finding the audit history of an entity by its id."""
+        AuditLog.objects.create(
+            action="license.created",
+            actor="test",
+            entity_type="license",
+            entity_id=licenses.id,
+        )
+        url = reverse("admin:core_auditlog_changelist")
+
+        response = admin_client.get(url, {"q": str(licenses.id)})
+        assert response.context["cl"].result_count == 1
+
+        response = admin_client.get(url, {"action": "license.created"})
+        assert response.context["cl"].result_count == 1
@@ -1,6 +1,14 @@
+import csv
+import gzip
+import io
+import json
+
 import pytest
 from rest_framework import status
 
+from core.models import AuditLog, License
+from core.services import RollupService
+
 
 @pytest.mark.django_db
 class TestBrandLicenseKeyAPI:
@@ -123,6 +131,28 @@ class TestListLicensesByEmailAPI:
         assert response.data["customer_email"] == "test@example.com"
         assert len(response.data["licenses"]) == 2
 
+    def test_list_valid_licenses_by_email(
+        self, api_client, brand_rankmath, license_rankmath_pro, product_content_ai
+    ):
+        """Test that valid=true drops licenses that are not currently valid."""
+        License.objects.create(
+            license_key=license_rankmath_pro.license_key,
+            product=product_content_ai,
+            expires_at="2020-01-01T00:00:00Z",
+        )
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.get(
+            "/api/v1/brands/licenses/search",
+            {"customer_email": "test@example.com", "valid": "true"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [lic["id"] for lic in response.data["licenses"]] == [
+            str(license_rankmath_pro.id)
+        ]
+        assert response.data["licenses"][0]["product"]["brand_name"] == "RankMath"
+
     def test_list_licenses_missing_email(self, api_client, brand_rankmath):
         """Test that missing email parameter returns error."""
         api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
@@ -151,6 +181,56 @@ class TestUpdateLicenseAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "suspended"
 
+    def test_update_license_rejects_expired_status(
+        self, api_client, brand_rankmath, license_rankmath_pro
+    ):
+        """Test that brands cannot set the status only expiry processing sets."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.patch(
+            f"/api/v1/brands/licenses/{license_rankmath_pro.id}",
+            {"status": "expired"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = api_client.patch(
+            "/api/v1/brands/licenses/bulk",
+            {
+                "updates": [
+                    {"license_id": str(license_rankmath_pro.id), "status": "expired"}
+                ]
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        license_rankmath_pro.refresh_from_db()
+        assert license_rankmath_pro.status == "valid"
+
+    def test_update_license_query_count(
+        self,
+        api_client,
+        brand_rankmath,
+        license_rankmath_pro,
+        activation,
+        django_assert_num_queries,
+    ):
+        """Test that an update runs a fixed number of queries."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        # Brand auth, license load, UPDATE, entitlement upsert, audit INSERT,
+        # plus the savepoint pair of the update transaction (in tests only)
+        with django_assert_num_queries(7):
+            response = api_client.patch(
+                f"/api/v1/brands/licenses/{license_rankmath_pro.id}",
+                {"expires_at": "2030-01-01T00:00:00Z"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["seats_used"] == 1
+        assert response.data["product"]["brand_name"] == brand_rankmath.name
+
     def test_update_license_not_found(self, api_client, brand_rankmath):
         """Test updating non-existent license."""
         api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
@@ -163,3 +243,199 @@ class TestUpdateLicenseAPI:
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestBulkUpdateLicensesAPI:
+    """Test bulk license update endpoint (US2, bulk)."""
+
+    def test_bulk_update_licenses(
+        self,
+        api_client,
+        brand_rankmath,
+        license_rankmath_pro,
+        license_key_rankmath,
+        product_content_ai,
+        django_assert_max_num_queries,
+    ):
+        """Test updating several licenses in one request."""
+        content_ai = License.objects.create(
+            license_key=license_key_rankmath, product=product_content_ai
+        )
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        with django_assert_max_num_queries(10):
+            response = api_client.patch(
+                "/api/v1/brands/licenses/bulk",
+                {
+                    "updates": [
+                        {
+                            "license_id": str(license_rankmath_pro.id),
+                            "status": "suspended",
+                        },
+                        {
+                            "license_id": str(content_ai.id),
+                            "expires_at": "2030-01-01T00:00:00Z",
+                        },
+                    ]
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 2
+        license_rankmath_pro.refresh_from_db()
+        content_ai.refresh_from_db()
+        assert license_rankmath_pro.status == "suspended"
+        assert content_ai.expires_at.year == 2030
+        audit = {
+            entry.entity_id: entry.metadata
+            for entry in AuditLog.objects.filter(action="license.updated")
+        }
+        assert len(audit) == 2
+        assert audit[license_rankmath_pro.id]["expires_at"] is None
+        assert audit[content_ai.id]["expires_at"] == "2030-01-01T00:00:00+00:00"
+
+    def test_bulk_update_rejects_foreign_license(
+        self, api_client, brand_wprocket, license_rankmath_pro
+    ):
+        """Test that a license of another brand rejects the whole batch."""
+        api_client.credentials(HTTP_X_API_KEY=brand_wprocket.plain_api_key)
+
+        response = api_client.patch(
+            "/api/v1/brands/licenses/bulk",
+            {
+                "updates": [
+                    {"license_id": str(license_rankmath_pro.id), "status": "cancelled"}
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        license_rankmath_pro.refresh_from_db()
+        assert license_rankmath_pro.status == "valid"
+
+    def test_bulk_update_validation(
+        self, api_client, brand_rankmath, license_rankmath_pro
+    ):
+        """Test that empty entries and duplicate ids are rejected."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+        license_id = str(license_rankmath_pro.id)
+
+        for updates in (
+            [],
+            [{"license_id": license_id}],
+            [
+                {"license_id": license_id, "status": "valid"},
+                {"license_id": license_id, "status": "cancelled"},
+            ],
+        ):
+            response = api_client.patch(
+                "/api/v1/brands/licenses/bulk", {"updates": updates}, format="json"
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestExportAPI:
+    """Test streaming brand exports."""
+
+    def test_export_licenses_ndjson(
+        self, api_client, brand_rankmath, license_rankmath_pro, activation
+    ):
+        """Test exporting licenses with seat usage as NDJSON."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.get("/api/v1/brands/exports/licenses")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "attachment" in response["Content-Disposition"]
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        assert len(rows) == 1
+        assert rows[0]["license_id"] == str(license_rankmath_pro.id)
+        assert rows[0]["product_slug"] == "rankmath-pro"
+        assert rows[0]["seats_used"] == 1
+        assert AuditLog.objects.filter(action="brand.exported").exists()
+
+    def test_export_activations_csv_gzip(
+        self, api_client, brand_rankmath, brand_wprocket, activation
+    ):
+        """Test exporting activations as gzip-compressed CSV, own brand only."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.get(
+            "/api/v1/brands/exports/activations", {"output": "csv", "gzip": "true"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/gzip"
+        assert response["Content-Disposition"].endswith('.csv.gz"')
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert len(rows) == 1
+        assert rows[0]["activation_id"] == str(activation.id)
+        assert rows[0]["deactivated_at"] == ""
+
+        api_client.credentials(HTTP_X_API_KEY=brand_wprocket.plain_api_key)
+        response = api_client.get("/api/v1/brands/exports/activations")
+        assert b"".join(response.streaming_content) == b""
+
+    def test_export_unknown_dataset(self, api_client, brand_rankmath):
+        """Test that an unknown dataset or format is rejected."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.get("/api/v1/brands/exports/customers")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"]["code"] == "INVALID_PARAMETER"
+
+        response = api_client.get("/api/v1/brands/exports/licenses", {"output": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestAnalyticsAPI:
+    """Test the brand analytics endpoint."""
+
+    def test_analytics_reads_rollups(
+        self,
+        api_client,
+        brand_rankmath,
+        product_wprocket_standard,
+        activation,
+        django_assert_max_num_queries,
+    ):
+        """Test daily usage per product, own brand only, from the rollups."""
+        RollupService.run()
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        # Authentication, product lookup and the rollup query
+        with django_assert_max_num_queries(3):
+            response = api_client.get("/api/v1/brands/analytics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["granularity"] == "day"
+        [product] = response.data["products"]
+        assert product["product_slug"] == "rankmath-pro"
+        assert product["seats_used"] == 1
+        assert product["seats_purchased"] == 5
+        assert sum(bucket["activations"] for bucket in product["buckets"]) == 1
+
+    def test_analytics_validates_range(self, api_client, brand_rankmath):
+        """Test that oversized ranges and unknown products are rejected."""
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        response = api_client.get(
+            "/api/v1/brands/analytics",
+            {"granularity": "hour", "since": "2020-01-01T00:00:00Z"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = api_client.get(
+            "/api/v1/brands/analytics", {"product_slug": "unknown"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
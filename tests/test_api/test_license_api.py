@@ -85,3 +85,88 @@ class TestLicenseStatusAPI:
         product_names = [lic["product"] for lic in response.data["licenses"]]
         assert "RankMath Pro" in product_names
         assert "Content AI" in product_names
+
+
+def create_keys(brand, products, count):
+    """Create `count` keys with a license per product, each activated once."""
+    from core.models import Activation, License, LicenseKey
+
+    keys = []
+    for i in range(count):
+        license_key = LicenseKey.objects.create(
+            key=f"BATCH-{i}", brand=brand, customer_email=f"c{i}@example.com"
+        )
+        for product in products:
+            license_obj = License.objects.create(
+                license_key=license_key, product=product
+            )
+            Activation.objects.create(
+                license=license_obj, instance_identifier=f"https://site-{i}.com"
+            )
+        keys.append(license_key.key)
+    return keys
+
+
+@pytest.mark.django_db
+class TestLicenseStatusBatchAPI:
+    """Test the batch license status endpoint (US4, batch)."""
+
+    url = "/api/v1/licenses/status"
+
+    def test_batch_status(self, api_client, license_rankmath_pro):
+        """Test that known keys map to their status and unknown ones are listed."""
+        key = license_rankmath_pro.license_key.key
+        response = api_client.post(
+            self.url, {"license_keys": [key, "UNKNOWN", key]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.data["results"]) == [key]
+        assert response.data["not_found"] == ["UNKNOWN"]
+        single = api_client.get(f"/api/v1/licenses/{key}/status")
+        assert response.data["results"][key] == single.data
+
+    def test_constant_number_of_queries(
+        self, brand_rankmath, product_rankmath_pro, product_content_ai, settings
+    ):
+        """Test that 3 or 30 keys are resolved in the same number of queries."""
+        from django.core.cache import caches
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from core.services import ActivationService
+
+        keys = create_keys(
+            brand_rankmath, [product_rankmath_pro, product_content_ai], 30
+        )
+
+        query_counts = []
+        for batch in (keys[:3], keys):
+            caches[settings.STATUS_CACHE_ALIAS].clear()
+            with CaptureQueriesContext(connection) as ctx:
+                statuses = ActivationService.get_license_statuses(batch)
+            query_counts.append(len(ctx.captured_queries))
+            assert all(
+                [lic["seats_used"] for lic in statuses[key]["licenses"]] == [1, 1]
+                for key in batch
+            )
+
+        assert query_counts[0] == query_counts[1] == 2
+
+        # Warm entries are served from the status cache
+        with CaptureQueriesContext(connection) as ctx:
+            ActivationService.get_license_statuses(keys)
+        assert len(ctx.captured_queries) == 0
+
+    def test_batch_validation(self, api_client):
+        """Test that empty and oversized batches are rejected."""
+        from api.v1.serializers import LicenseStatusBatchSerializer
+
+        response = api_client.post(self.url, {"license_keys": []}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        too_many = [
+            f"KEY-{i}" for i in range(LicenseStatusBatchSerializer.MAX_KEYS + 1)
+        ]
+        response = api_client.post(self.url, {"license_keys": too_many}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
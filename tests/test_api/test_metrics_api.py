@@ -0,0 +1,87 @@
+import pytest
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+class TestMetricsAPI:
+    """Test Prometheus metrics endpoint."""
+
+    def test_metrics_endpoint(self, api_client):
+        """Test that metrics are exposed in the Prometheus text format."""
+        response = api_client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert "license_activations_total" in body
+        assert "license_operation_duration_seconds_bucket" in body
+
+    def test_metrics_endpoint_requires_token(self, api_client, settings):
+        """Test that the configured bearer token is enforced."""
+        settings.METRICS_AUTH_TOKEN = "scrape-secret"
+
+        response = api_client.get("/metrics")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        response = api_client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_activation_metrics(self, api_client, license_rankmath_pro):
+        """Test that activations and seat-limit rejections are counted."""
+        created_before = sample("license_activations_total", result="created")
+        rejected_before = sample("license_seat_limit_rejections_total")
+
+        for i in range(6):
+            api_client.post(
+                "/api/v1/products/activations",
+                {
+                    "license_key": license_rankmath_pro.license_key.key,
+                    "instance_identifier": f"https://site{i}.com",
+                },
+                format="json",
+            )
+
+        assert sample("license_activations_total", result="created") == (
+            created_before + 5
+        )
+        assert sample("license_seat_limit_rejections_total") == rejected_before + 1
+
+    def test_status_check_metrics(self, api_client, license_rankmath_pro):
+        """Test that status checks are counted by result."""
+        found_before = sample("license_status_checks_total", result="found")
+        missing_before = sample("license_status_checks_total", result="not_found")
+
+        api_client.get(
+            f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+        )
+        api_client.get("/api/v1/licenses/INVALID-KEY/status")
+
+        assert sample("license_status_checks_total", result="found") == (
+            found_before + 1
+        )
+        assert sample("license_status_checks_total", result="not_found") == (
+            missing_before + 1
+        )
+
+    def test_auth_cache_metrics(self, api_client, brand_rankmath):
+        """Test that brand API key lookups are counted as cache hits/misses."""
+        hits_before = sample("license_auth_cache_requests_total", result="hit")
+        misses_before = sample("license_auth_cache_requests_total", result="miss")
+        api_client.credentials(HTTP_X_API_KEY=brand_rankmath.plain_api_key)
+
+        for _ in range(3):
+            api_client.get(
+                "/api/v1/brands/licenses/search", {"customer_email": "a@example.com"}
+            )
+
+        assert sample("license_auth_cache_requests_total", result="miss") == (
+            misses_before + 1
+        )
+        assert sample("license_auth_cache_requests_total", result="hit") == (
+            hits_before + 2
+        )
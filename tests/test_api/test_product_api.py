@@ -1,6 +1,10 @@
 import pytest
+from django.utils import timezone
 from rest_framework import status
 
+from core.models import Activation, AuditLog
+from core.services import ArchiveService
+
 
 @pytest.mark.django_db
 class TestActivationAPI:
@@ -62,6 +66,10 @@ class TestActivationAPI:
 
         assert response.status_code == status.HTTP_409_CONFLICT
         assert response.data["error"]["code"] == "SEAT_LIMIT_REACHED"
+        assert AuditLog.objects.filter(
+            action="activation.seat_limit_reached",
+            entity_id=license_rankmath_pro.id,
+        ).exists()
 
     def test_activate_license_idempotent(self, api_client, license_rankmath_pro):
         """Test that activating same instance twice is idempotent."""
@@ -94,6 +102,20 @@ class TestActivationAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["deactivated_at"] is not None
 
+    def test_deactivate_archived_activation(self, api_client, activation):
+        """Test that an archived activation still answers as deactivated."""
+        deactivated_at = timezone.now() - timezone.timedelta(days=365)
+        Activation.objects.filter(id=activation.id).update(
+            deactivated_at=deactivated_at
+        )
+        ArchiveService.archive_activations()
+
+        response = api_client.delete(f"/api/v1/products/activations/{activation.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == str(activation.id)
+        assert response.data["deactivated_at"] is not None
+
     def test_deactivate_activation_not_found(self, api_client):
         """Test deactivating non-existent activation."""
         fake_uuid = "00000000-0000-0000-0000-000000000000"
@@ -0,0 +1,110 @@
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+
+from api.v1.throttling import LocalBucketStore, parse_rate
+
+
+@pytest.fixture
+def tight_rates(settings):
+    """Allow a burst of 2 per license key and 3 per IP."""
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {
+            "activation_ip": "3/min",
+            "activation_key": "2/min",
+            "status_ip": "3/min",
+            "status_key": "2/min",
+            "status_batch_ip": "3/min",
+        },
+    }
+
+
+class TestTokenBucket:
+    """Test token bucket primitives."""
+
+    def test_parse_rate(self):
+        """Test that rates map to burst capacity and refill speed."""
+        assert parse_rate("60/min") == (60, 1.0)
+        assert parse_rate("10/s") == (10, 10.0)
+
+    def test_bucket_refills(self, monkeypatch):
+        """Test that an empty bucket refills over time."""
+        now = [1000.0]
+        monkeypatch.setattr("api.v1.throttling.time.monotonic", lambda: now[0])
+        store = LocalBucketStore()
+
+        assert store.consume("k", capacity=2, refill_rate=1.0) == 0.0
+        assert store.consume("k", capacity=2, refill_rate=1.0) == 0.0
+        assert store.consume("k", capacity=2, refill_rate=1.0) == pytest.approx(1.0)
+
+        now[0] += 1.0
+        assert store.consume("k", capacity=2, refill_rate=1.0) == 0.0
+
+
+@pytest.mark.django_db
+class TestRateLimitAPI:
+    """Test rate limiting of public endpoints."""
+
+    def test_status_rate_limited_per_key(
+        self, api_client, license_rankmath_pro, tight_rates
+    ):
+        """Test that a license key exhausts its bucket and gets 429."""
+        url = f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) >= 1
+
+    def test_status_rate_limited_per_ip(self, api_client, tight_rates):
+        """Test that one client IP is limited across different keys."""
+        for i in range(3):
+            response = api_client.get(f"/api/v1/licenses/KEY-{i}/status")
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = api_client.get("/api/v1/licenses/KEY-4/status")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_batch_status_costs_one_token_per_key(self, api_client, tight_rates):
+        """Test that a batch status check counts each of its keys."""
+        url = "/api/v1/licenses/status"
+        response = api_client.post(url, {"license_keys": ["A", "B"]}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.post(url, {"license_keys": ["C", "D"]}, format="json")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_activation_rate_limited_per_key(
+        self, api_client, license_rankmath_pro, tight_rates
+    ):
+        """Test that activations are limited by the key in the request body."""
+        payload = {
+            "license_key": license_rankmath_pro.license_key.key,
+            "instance_identifier": "https://example.com",
+        }
+
+        for _ in range(2):
+            response = api_client.post(
+                "/api/v1/products/activations", payload, format="json"
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+        response = api_client.post(
+            "/api/v1/products/activations", payload, format="json"
+        )
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+
+    def test_cache_backend(
+        self, api_client, license_rankmath_pro, tight_rates, settings
+    ):
+        """Test that the shared cache backend enforces the same limits."""
+        settings.RATE_LIMIT_BACKEND = "cache"
+        cache.clear()
+        url = f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+
+        statuses = [api_client.get(url).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
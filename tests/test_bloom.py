@@ -0,0 +1,81 @@
+import pytest
+from rest_framework import status
+
+from core.bloom import BloomFilter, license_key_filter
+from core.models import LicenseKey
+
+
+class TestBloomFilter:
+    """Test the Bloom filter data structure."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported present."""
+        bloom = BloomFilter(1000, 0.01)
+        keys = [f"KEY-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate(self):
+        """Test that the false positive rate stays near the target."""
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"KEY-{i}")
+
+        false_positives = sum(f"OTHER-{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+
+
+@pytest.mark.django_db
+class TestLicenseKeyFilter:
+    """Test the license key filter used by the public endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.LICENSE_KEY_FILTER_ENABLED = True
+        yield
+        license_key_filter.clear()
+
+    def test_unknown_key_skips_database(
+        self, api_client, license_rankmath_pro, django_assert_num_queries
+    ):
+        """Test that an unknown key is rejected without a query."""
+        license_key_filter.build()
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/api/v1/licenses/UNKNOWN-KEY/status")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = api_client.get(
+            f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_key_created_after_build(
+        self, license_rankmath_pro, django_capture_on_commit_callbacks
+    ):
+        """Test that keys created after the build are never rejected."""
+        license_key_filter.build()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            LicenseKey.objects.create(
+                key="RANKMATH-new-key",
+                brand=license_rankmath_pro.license_key.brand,
+                customer_email="new@example.com",
+            )
+        assert license_key_filter.might_contain("RANKMATH-new-key")
+
+    def test_key_created_by_other_worker(self, license_rankmath_pro):
+        """Test catch-up when another worker announced new keys."""
+        license_key_filter.build()
+        LicenseKey.objects.create(
+            key="RANKMATH-other-worker",
+            brand=license_rankmath_pro.license_key.brand,
+            customer_email="other@example.com",
+        )
+        # What the creating worker does after commit
+        other_worker = type(license_key_filter)()
+        other_worker.key_created("RANKMATH-other-worker")
+
+        assert license_key_filter.might_contain("RANKMATH-other-worker")
@@ -0,0 +1,91 @@
+import pytest
+from django.core.cache import cache
+
+from core.catalog import VERSION_KEY, CatalogCache, catalog_cache
+from license_service.warmup import warm_up
+
+
+@pytest.mark.django_db
+class TestCatalogCache:
+    """Test the in-process Brand/Product cache."""
+
+    def test_read_through(self, product_rankmath_pro, django_assert_num_queries):
+        """Test that repeated lookups are served from memory."""
+        with django_assert_num_queries(1):
+            for _ in range(3):
+                product = catalog_cache.get_product_by_slug(
+                    product_rankmath_pro.brand_id, "rankmath-pro"
+                )
+                assert product.brand.name == "RankMath"
+
+        assert (
+            catalog_cache.get_product_by_slug(product_rankmath_pro.brand_id, "missing")
+            is None
+        )
+
+    def test_save_invalidates(self, brand_rankmath):
+        """Test that saving a brand drops cached copies."""
+        assert catalog_cache.get_brand(brand_rankmath.id).name == "RankMath"
+
+        brand_rankmath.name = "Rank Math"
+        brand_rankmath.save()
+
+        assert catalog_cache.get_brand(brand_rankmath.id).name == "Rank Math"
+
+    def test_other_worker_invalidation(
+        self, brand_rankmath, settings, django_assert_num_queries
+    ):
+        """Test that a version bump from another worker is picked up."""
+        settings.CATALOG_CACHE_CHECK_INTERVAL = 0
+        worker = CatalogCache()
+        worker.get_brand(brand_rankmath.id)
+
+        with django_assert_num_queries(0):
+            worker.get_brand(brand_rankmath.id)
+
+        # Another worker saved a brand and bumped the shared version
+        cache.set(VERSION_KEY, cache.get(VERSION_KEY, 0) + 1, timeout=None)
+
+        with django_assert_num_queries(1):
+            worker.get_brand(brand_rankmath.id)
+
+    def test_save_with_cache_down(self, brand_rankmath, monkeypatch, settings):
+        """Test that a failing shared cache does not fail catalog writes."""
+
+        class BrokenCache:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise ConnectionError("Error 111 connecting to redis:6379")
+
+                return fail
+
+        monkeypatch.setattr(
+            "core.catalog.caches", {settings.CATALOG_CACHE_ALIAS: BrokenCache()}
+        )
+        settings.CATALOG_CACHE_CHECK_INTERVAL = 0
+        version = catalog_cache.get_version()
+
+        brand_rankmath.name = "Rank Math"
+        brand_rankmath.save()
+
+        assert catalog_cache.get_brand(brand_rankmath.id).name == "Rank Math"
+        assert catalog_cache.get_version() != version
+
+
+@pytest.mark.django_db
+class TestWarmUp:
+    """Test worker warm-up."""
+
+    def test_warm_up_preloads_catalog(
+        self, product_rankmath_pro, django_assert_num_queries
+    ):
+        """Test that warm-up runs every step and fills the catalog cache."""
+        timings = warm_up()
+
+        assert set(timings) == {"urls", "drf", "catalog", "license_keys"}
+        with django_assert_num_queries(0):
+            product = catalog_cache.get_product_by_slug(
+                product_rankmath_pro.brand_id, "rankmath-pro"
+            )
+            assert product.brand.name == "RankMath"
+            assert catalog_cache.get_brand_by_api_key_hash(product.brand.api_key_hash)
@@ -0,0 +1,38 @@
+from core.checks import check_shared_caches
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379/0",
+    }
+}
+
+
+class TestSharedCachesCheck:
+    """Test the check rejecting process-local caches for shared state."""
+
+    def test_local_cache_rejected_outside_debug(self, settings):
+        """Test that catalog and status caches on LocMem are errors in prod."""
+        settings.DEBUG = False
+        settings.CACHES = LOCMEM
+        settings.STATUS_CACHE_ENABLED = True
+
+        errors = check_shared_caches(None)
+
+        assert [error.id for error in errors] == ["core.E001", "core.E001"]
+        assert "STATUS_CACHE_ALIAS" in errors[1].msg
+
+    def test_local_cache_allowed_in_debug(self, settings):
+        """Test that single-process DEBUG setups only get a warning."""
+        settings.DEBUG = True
+        settings.CACHES = LOCMEM
+
+        assert {error.id for error in check_shared_caches(None)} == {"core.W001"}
+
+    def test_shared_cache_passes(self, settings):
+        """Test that a shared backend passes."""
+        settings.DEBUG = False
+        settings.CACHES = REDIS
+
+        assert check_shared_caches(None) == []
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db.models import Count, Q
+
+from core.dataset import DatasetConfig, DatasetGenerator, flush_dataset
+from core.models import Activation, AuditLog, License, LicenseKey
+
+
+def generate(seed=7):
+    config = DatasetConfig(
+        seed=seed,
+        customers=200,
+        chunk_size=500,
+        as_of=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    return DatasetGenerator(config).run()
+
+
+@pytest.mark.django_db
+class TestDatasetGenerator:
+    """Test synthetic dataset generation."""
+
+    def test_counts_match_database(self):
+        """Test that reported counts match inserted rows."""
+        manifest = generate()
+
+        assert manifest["counts"]["license_keys"] == LicenseKey.objects.count()
+        assert manifest["counts"]["licenses"] == License.objects.count()
+        assert manifest["counts"]["activations"] == Activation.objects.count()
+        assert manifest["counts"]["audit_logs"] == AuditLog.objects.count()
+        assert LicenseKey.objects.filter(key__in=manifest["license_keys"]).count() == (
+            len(manifest["license_keys"])
+        )
+
+    def test_deterministic_under_seed(self):
+        """Test that the same seed produces the same keys."""
+        first = generate(seed=7)
+        keys = set(LicenseKey.objects.values_list("key", flat=True))
+        flush_dataset()
+
+        second = generate(seed=7)
+        assert first["license_keys"] == second["license_keys"]
+        assert set(LicenseKey.objects.values_list("key", flat=True)) == keys
+
+    def test_active_activations_within_seat_limit(self):
+        """Test that generated active seats never exceed the seat limit."""
+        generate()
+
+        licenses = License.objects.select_related("product").annotate(
+            active=Count("activations", filter=Q(activations__deactivated_at=None))
+        )
+        for license_obj in licenses:
+            seat_limit = license_obj.get_seat_limit()
+            if seat_limit is not None:
+                assert license_obj.active <= seat_limit
@@ -0,0 +1,55 @@
+import time
+import uuid
+
+import pytest
+
+from core.ids import uuid7, uuid7_time
+from core.models import AuditLog
+
+
+class TestUuid7:
+    """Test time-ordered UUID generation."""
+
+    def test_layout(self):
+        """Test the version, variant and embedded timestamp."""
+        before = time.time()
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert before - 0.001 <= uuid7_time(value) <= time.time() + 0.001
+
+    def test_monotonic(self):
+        """Test that ids sort in creation order, within a millisecond too."""
+        values = [uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert sorted(str(value) for value in values) == [str(v) for v in values]
+        assert len(set(values)) == len(values)
+
+
+@pytest.mark.django_db
+class TestUuid7Keys:
+    """Test uuid7 primary keys alongside existing uuid4 rows."""
+
+    def test_mixed_keys(self, brand_rankmath):
+        """Test that new rows get uuid7 keys and old uuid4 rows still load."""
+        old = AuditLog.objects.create(
+            id=uuid.uuid4(),
+            brand=brand_rankmath,
+            action="license.created",
+            actor="test",
+            entity_type="license",
+            entity_id=uuid.uuid4(),
+        )
+        new = AuditLog.objects.create(
+            brand=brand_rankmath,
+            action="license.created",
+            actor="test",
+            entity_type="license",
+            entity_id=uuid.uuid4(),
+        )
+
+        assert new.id.version == 7
+        assert AuditLog.objects.get(id=old.id).id.version == 4
+        assert AuditLog.objects.count() == 2
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+from django.utils import timezone
+
+from core import jobs
+from core.models import Job
+
+CALLS = []
+
+
+@jobs.task("test_record", max_attempts=2)
+def record_call(value=None):
+    CALLS.append(value)
+
+
+@jobs.task("test_fail", max_attempts=2)
+def always_fail():
+    raise RuntimeError("boom")
+
+
+@jobs.task("test_lease")
+def outlive_lease():
+    # Run past the claimed lease, then do another worker's housekeeping
+    time.sleep(0.3)
+    CALLS.append(jobs.requeue_expired())
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    """Start every test with no recorded task calls."""
+    CALLS.clear()
+
+
+@pytest.mark.django_db
+class TestJobQueue:
+    """Test the database-backed job queue."""
+
+    def test_enqueue_and_run(self):
+        """Test that due jobs run once with their arguments."""
+        job = jobs.enqueue("test_record", value=7)
+        later = jobs.enqueue(
+            "test_record", run_at=timezone.now() + timezone.timedelta(hours=1)
+        )
+
+        assert jobs.Worker(schedule=False).run_burst() == 1
+
+        assert CALLS == [7]
+        job.refresh_from_db()
+        assert job.status == Job.Status.DONE
+        assert job.attempts == 1
+        later.refresh_from_db()
+        assert later.status == Job.Status.QUEUED
+
+    def test_unique_key_and_unknown_task(self):
+        """Test deduplication by key and rejection of unknown tasks."""
+        assert jobs.enqueue("test_record", unique_key="once") is not None
+        assert jobs.enqueue("test_record", unique_key="once") is None
+
+        with pytest.raises(ValueError):
+            jobs.enqueue("no_such_task")
+
+    def test_retry_then_fail(self):
+        """Test that a failing job is retried later, then marked failed."""
+        job = jobs.enqueue("test_fail")
+
+        assert jobs.run_job(jobs.claim("w1")) == "retry"
+        job.refresh_from_db()
+        assert job.status == Job.Status.QUEUED
+        assert job.run_at > timezone.now()
+        assert job.last_error == "RuntimeError: boom"
+
+        assert jobs.run_job(jobs.claim("w1", now=job.run_at)) == "failed"
+        job.refresh_from_db()
+        assert job.status == Job.Status.FAILED
+        assert job.attempts == 2
+
+    def test_claim_is_exclusive(self):
+        """Test that a claimed job is invisible to other workers until its lease ends."""
+        job = jobs.enqueue("test_record")
+
+        assert jobs.claim("w1").id == job.id
+        assert jobs.claim("w2") is None
+
+        later = timezone.now() + timezone.timedelta(hours=1)
+        assert jobs.requeue_expired(now=later) == 1
+        assert jobs.claim("w2", now=later).id == job.id
+
+    def test_schedule_recurring(self, settings):
+        """Test that each interval is enqueued once across workers."""
+        settings.JOB_SCHEDULE = {"test_record": 60}
+        now = timezone.now()
+
+        assert jobs.schedule_recurring(now) == 1
+        assert jobs.schedule_recurring(now) == 0
+        assert jobs.schedule_recurring(now + timezone.timedelta(minutes=1)) == 1
+        assert Job.objects.filter(task="test_record").count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+class TestJobLease:
+    """Test lease renewal of running jobs."""
+
+    def test_heartbeat_renews_lease(self, settings):
+        """Test that a job running past its lease keeps it and is not requeued."""
+        settings.JOB_LEASE = 0.1
+        settings.JOB_HEARTBEAT_INTERVAL = 0.02
+        job = jobs.enqueue("test_lease")
+
+        assert jobs.run_job(jobs.claim("w1")) == "done"
+
+        assert CALLS == [0]
+        job.refresh_from_db()
+        assert job.status == Job.Status.DONE
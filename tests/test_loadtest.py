@@ -0,0 +1,194 @@
+import asyncio
+import json
+import random
+
+from api.coldstart import scenario_requests, send_requests, wsgi_environ
+from api.loadtest import (
+    ASGITransport,
+    HTTPTransport,
+    LoadTest,
+    RequestFactory,
+    percentile,
+)
+from api.startup_profile import compare_reports, parse_importtime
+
+MANIFEST = {
+    "brands": [{"slug": "dsbrand0", "api_key": "dataset-dsbrand0-42"}],
+    "license_keys": ["DSBRAND0-key-1", "DSBRAND0-key-2"],
+    "licenses": [{"id": "00000000-0000-4000-8000-000000000001", "brand": "dsbrand0"}],
+}
+
+
+async def stub_asgi_app(scope, receive, send):
+    """Return 200 for status checks and 500 for everything else."""
+    await receive()
+    status = 200 if scope["path"].endswith("/status") else 500
+    await send({"type": "http.response.start", "status": status, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+class TestLoadTest:
+    """Test the load-test harness."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 95) == 0.0
+
+    def test_report_counts_requests_and_errors(self):
+        """Test that the report aggregates per request type."""
+        load_test = LoadTest(
+            ASGITransport(stub_asgi_app),
+            RequestFactory(MANIFEST, random.Random(1)),
+            scenario="mixed",
+            concurrency=4,
+            max_requests=200,
+        )
+        report = asyncio.run(load_test.run())
+
+        assert report["overall"]["requests"] == 200
+        assert report["requests"]["status"]["errors"] == 0
+        non_status = 200 - report["requests"]["status"]["requests"]
+        assert report["overall"]["errors"] == non_status
+        assert report["overall"]["p99_ms"] >= report["overall"]["p50_ms"]
+
+    def test_http_transport_keep_alive(self):
+        """Test the HTTP client against a local keep-alive server."""
+        connections = []
+
+        async def handle(reader, writer):
+            connections.append(writer)
+            while True:
+                try:
+                    await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            load_test = LoadTest(
+                HTTPTransport(f"http://127.0.0.1:{port}"),
+                RequestFactory(MANIFEST, random.Random(1)),
+                scenario="status",
+                concurrency=2,
+                max_requests=20,
+            )
+            report = await load_test.run()
+            server.close()
+            return report
+
+        report = asyncio.run(run())
+
+        assert report["requests"]["status"]["status_codes"] == {"200": 20}
+        assert len(connections) == 2
+
+
+def stub_wsgi_app(environ, start_response):
+    """Echo the request method and path back as the response body."""
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [f"{environ['REQUEST_METHOD']} {environ['PATH_INFO']}".encode()]
+
+    def test_brand_bulk_update(self):
+        """Test that bulk updates carry distinct licenses of one brand."""
+        manifest = {
+            **MANIFEST,
+            "brands": [
+                *MANIFEST["brands"],
+                {"slug": "dsbrand1", "api_key": "dataset-dsbrand1-42"},
+            ],
+            "licenses": [
+                {"id": f"00000000-0000-4000-8000-{i:012d}", "brand": f"dsbrand{i % 2}"}
+                for i in range(300)
+            ],
+        }
+        request = RequestFactory(manifest, random.Random(1)).brand_bulk_update()
+
+        brand = request.headers["X-API-Key"].split("-")[1]
+        updates = json.loads(request.body)["updates"]
+        assert request.path == "/api/v1/brands/licenses/bulk"
+        assert len({update["license_id"] for update in updates}) == 100
+        assert {int(update["license_id"][-12:]) % 2 for update in updates} == {
+            int(brand[-1])
+        }
+
+
+class TestColdStart:
+    """Test the cold-start request driver."""
+
+    def test_send_requests(self):
+        """Test that requests are translated to WSGI calls and timed."""
+        factory = RequestFactory(MANIFEST, random.Random(1))
+        results = send_requests(stub_wsgi_app, scenario_requests(factory, "status", 5))
+
+        assert len(results) == 5
+        assert all(name == "status" and status == 200 for name, status, _ in results)
+
+    def test_wsgi_environ_headers(self):
+        """Test that headers map to CGI-style environ keys."""
+        request = RequestFactory(MANIFEST, random.Random(1)).brand_update()
+        environ = wsgi_environ(request)
+
+        assert environ["CONTENT_TYPE"] == "application/json"
+        assert environ["HTTP_X_API_KEY"] == "dataset-dsbrand0-42"
+        assert environ["wsgi.input"].read() == request.body
+
+
+IMPORTTIME_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |       5000 | django
+import time:      2000 |       2000 |   django.db
+import time:       500 |        500 | core.models
+import time:        40 |        40 |     rest_framework
+import time:        70 |        70 | yaml
+"""
+
+
+class TestStartupProfile:
+    """Test start-up profile parsing and comparison."""
+
+    def test_parse_importtime(self):
+        """Test that self times are summed per root package."""
+        parsed = parse_importtime(IMPORTTIME_LOG)
+
+        assert parsed["modules"]["django.db"] == 2000
+        assert len(parsed["modules"]) == 6
+        assert parsed["groups"]["django"] == 5000
+        assert parsed["groups"]["core"] == 500
+        assert parsed["groups"]["rest_framework"] == 40
+        assert parsed["groups"]["other"] == 190
+
+    def test_compare_reports(self):
+        """Test that only growth above both thresholds is a regression."""
+        baseline = {
+            "phases_ms": {"app_registry": 300.0, "urlconf": 100.0},
+            "imports_ms": {"core": 10.0},
+            "first_request_ms": {"/metrics": 1.0},
+        }
+        current = {
+            "phases_ms": {"app_registry": 400.0, "urlconf": 110.0},
+            "imports_ms": {"core": 14.0, "new_package": 50.0},
+            "first_request_ms": {"/metrics": 3.0},
+        }
+
+        regressions = compare_reports(baseline, current, threshold=0.2, min_ms=5.0)
+
+        assert regressions == [
+            "phases_ms.app_registry: 300.0 ms -> 400.0 ms (+33%)",
+            "imports_ms.new_package: new, 50.0 ms",
+        ]
+
+    def test_compare_reports_zero_baseline(self):
+        """Test that a group not imported in the baseline is reported as new."""
+        regressions = compare_reports(
+            {"imports_ms": {"x": 0.0, "y": 0.0}},
+            {"imports_ms": {"x": 40.0, "y": 1.0}},
+        )
+
+        assert regressions == ["imports_ms.x: new, 40.0 ms"]
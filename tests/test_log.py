@@ -0,0 +1,96 @@
+import io
+import logging
+import os
+import threading
+
+from core import metrics
+from core.log import QueueListenerHandler, SamplingFilter
+
+
+def make_record(name: str, level: int, msg: str = "event", args=()):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestQueueListenerHandler:
+    """Test the background logging handler."""
+
+    def test_writes_on_listener_thread(self):
+        """Test that records are formatted and written by the listener."""
+        stream = io.StringIO()
+        handler = QueueListenerHandler(stream=stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        args = {"count": 1}
+        handler.handle(
+            make_record("core.test", logging.INFO, "seen %(count)s", (args,))
+        )
+        # Arguments are merged at the call, not when the record is written
+        args["count"] = 2
+        handler.close()
+
+        assert stream.getvalue() == "INFO seen 1\n"
+
+    def test_drops_records_when_queue_is_full(self):
+        """Test that a full queue drops records instead of blocking."""
+        written = threading.Event()
+        release = threading.Event()
+
+        class SlowStream(io.StringIO):
+            def write(self, text):
+                written.set()
+                release.wait()
+                return super().write(text)
+
+        handler = QueueListenerHandler(stream=SlowStream(), queue_size=1)
+        dropped = metrics.LOG_RECORDS_DROPPED.labels(logger="core.test")
+        before = dropped._value.get()
+
+        # The listener blocks writing the first, the second fills the queue
+        handler.handle(make_record("core.test", logging.INFO))
+        assert written.wait(1)
+        handler.handle(make_record("core.test", logging.INFO))
+        handler.handle(make_record("core.test", logging.INFO))
+        assert dropped._value.get() == before + 1
+
+        release.set()
+        handler.close()
+
+    def test_writes_in_forked_child(self, tmp_path):
+        """Test that a forked child's records are written by a new listener."""
+        path = tmp_path / "fork.log"
+        with open(path, "w") as stream:
+            handler = QueueListenerHandler(stream=stream)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    handler.handle(make_record("core.test", logging.INFO, "child"))
+                    handler.close()
+                    code = 0
+                finally:
+                    os._exit(code)
+            _, exit_status = os.waitpid(pid, 0)
+            handler.handle(make_record("core.test", logging.INFO, "parent"))
+            handler.close()
+
+        assert exit_status == 0
+        assert path.read_text().split() == ["child", "parent"]
+
+
+class TestSamplingFilter:
+    """Test per-logger sampling of log records."""
+
+    def test_samples_info_of_configured_loggers(self, monkeypatch):
+        """Test that child loggers inherit rates and warnings always pass."""
+        sampling = SamplingFilter({"core.services": 0.25})
+        monkeypatch.setattr("core.log.random.random", lambda: 0.5)
+
+        record = make_record("core.services.audit_service", logging.INFO)
+        assert sampling.filter(record) is False
+        assert record.sample_rate == 0.25
+        assert sampling.filter(make_record("core.services", logging.WARNING))
+        assert sampling.filter(make_record("core.jobs", logging.INFO))
+
+        monkeypatch.setattr("core.log.random.random", lambda: 0.1)
+        assert sampling.filter(make_record("core.services.x", logging.DEBUG))
@@ -1,6 +1,7 @@
 import pytest
 from django.utils import timezone
 
+from core.identifiers import instance_digest, normalize_instance_identifier
 from core.models import Activation, License, LicenseKey
 
 
@@ -63,6 +64,25 @@ class TestLicense:
         assert expired_license.is_expired() is True
         assert expired_license.is_valid() is False
 
+    def test_effectively_valid_queryset(
+        self, license_rankmath_pro, license_key_rankmath, product_content_ai
+    ):
+        """Test that validity is filtered and annotated in SQL."""
+        expired_license = License.objects.create(
+            license_key=license_key_rankmath,
+            product=product_content_ai,
+            status=License.Status.VALID,
+            expires_at=timezone.now() - timezone.timedelta(days=1),
+        )
+
+        assert list(License.objects.effectively_valid()) == [license_rankmath_pro]
+        assert list(License.objects.past_expiry()) == [expired_license]
+
+        validity = dict(
+            License.objects.with_validity().values_list("id", "currently_valid")
+        )
+        assert validity == {license_rankmath_pro.id: True, expired_license.id: False}
+
     def test_license_seat_limit(self, license_rankmath_pro):
         """Test seat limit logic."""
         assert license_rankmath_pro.get_seat_limit() == 5
@@ -95,3 +115,15 @@ class TestActivation:
         activation.deactivated_at = timezone.now()
         activation.save()
         assert activation.deactivated_at is not None
+
+    def test_instance_digest(self, activation):
+        """Test that spellings of one site share the stored digest."""
+        for spelling in ["example.com", "HTTP://www.Example.com:80/", " example.com "]:
+            assert normalize_instance_identifier(spelling) == "example.com"
+        assert normalize_instance_identifier("https://example.com/shop/") == (
+            "example.com/shop"
+        )
+
+        assert len(activation.instance_digest) == 16
+        assert bytes(activation.instance_digest) == instance_digest("example.com")
+        assert instance_digest("example.com") != instance_digest("example.org")
@@ -0,0 +1,203 @@
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import OutboxEvent
+from core.services import ActivationService, LicenseService, OutboxService
+
+
+class WebhookStandIn:
+    """Local HTTP server recording webhook calls and answering `status`."""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stand_in.requests.append((dict(self.headers), body))
+                self.send_response(stand_in.status)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hooks"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def events(self):
+        return [
+            event for _, body in self.requests for event in json.loads(body)["events"]
+        ]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def webhook():
+    """Run a local webhook receiver for the test."""
+    stand_in = WebhookStandIn()
+    yield stand_in
+    stand_in.close()
+
+
+@pytest.fixture
+def subscribed_brand(brand_rankmath, webhook):
+    """Point the RankMath brand's webhook at the local receiver."""
+    brand_rankmath.webhook_url = webhook.url
+    brand_rankmath.webhook_secret = "s3cret"
+    brand_rankmath.save()
+    return brand_rankmath
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    """Test outbox recording and webhook delivery."""
+
+    def test_records_only_for_subscribed_brands(self, license_rankmath_pro):
+        """Test that brands without a webhook URL get no events."""
+        ActivationService.activate_license(
+            license_key_str=license_rankmath_pro.license_key.key,
+            instance_identifier="https://site.com",
+        )
+
+        assert not OutboxEvent.objects.exists()
+
+    def test_event_commits_with_change(self, subscribed_brand, product_rankmath_pro):
+        """Test that a rolled-back change leaves no event behind."""
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                LicenseService.create_license(
+                    brand=subscribed_brand,
+                    customer_email="a@example.com",
+                    product_slug="rankmath-pro",
+                )
+                raise RuntimeError
+
+        assert not OutboxEvent.objects.exists()
+
+        LicenseService.create_license(
+            brand=subscribed_brand,
+            customer_email="a@example.com",
+            product_slug="rankmath-pro",
+        )
+        assert list(OutboxEvent.objects.values_list("event_type", flat=True)) == [
+            "license.created"
+        ]
+
+    def test_dispatch_batches_and_signs(
+        self, subscribed_brand, license_rankmath_pro, webhook, settings
+    ):
+        """Test batched, signed delivery in order."""
+        settings.WEBHOOK_BATCH_SIZE = 2
+        activation = ActivationService.activate_license(
+            license_key_str=license_rankmath_pro.license_key.key,
+            instance_identifier="https://site.com",
+        )
+        ActivationService.deactivate_activation(activation.id)
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+
+        assert OutboxService.dispatch() == 3
+
+        assert len(webhook.requests) == 2
+        assert [event["type"] for event in webhook.events()] == [
+            "activation.created",
+            "activation.deactivated",
+            "license.updated",
+        ]
+        assert webhook.events()[0]["data"]["seats_used"] == 1
+        headers, body = webhook.requests[0]
+        timestamp, signature = [
+            part.split("=", 1)[1] for part in headers["X-Webhook-Signature"].split(",")
+        ]
+        expected = hmac.new(
+            b"s3cret", timestamp.encode() + b"." + body, hashlib.sha256
+        ).hexdigest()
+        assert signature == expected
+        assert not OutboxEvent.objects.filter(delivered_at__isnull=True).exists()
+        assert OutboxService.dispatch() == 0
+
+    def test_failed_delivery_backs_off(
+        self, subscribed_brand, license_rankmath_pro, webhook, settings
+    ):
+        """Test retry scheduling and giving up after the last attempt."""
+        settings.WEBHOOK_MAX_ATTEMPTS = 2
+        webhook.status = 500
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+
+        assert OutboxService.dispatch() == 1
+        event = OutboxEvent.objects.get()
+        assert event.attempts == 1
+        assert event.last_error == "HTTP 500"
+        assert event.next_attempt_at > timezone.now()
+        assert OutboxService.dispatch() == 0
+
+        assert OutboxService.dispatch(now=event.next_attempt_at) == 1
+        event.refresh_from_db()
+        assert event.attempts == 2
+        assert event.next_attempt_at is None
+        assert event.delivered_at is None
+
+    def test_results_dropped_when_lease_expired(
+        self, subscribed_brand, license_rankmath_pro, webhook, monkeypatch
+    ):
+        """Test that a dispatcher whose events were re-claimed keeps out."""
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+        claim = OutboxService._claim
+
+        def claim_then_lose_lease(limit, now):
+            events, lease_until = claim(limit, now)
+            # The lease expires and another dispatcher re-claims the events
+            OutboxEvent.objects.update(
+                next_attempt_at=lease_until + timezone.timedelta(minutes=5)
+            )
+            return events, lease_until
+
+        monkeypatch.setattr(
+            OutboxService, "_claim", staticmethod(claim_then_lose_lease)
+        )
+
+        assert OutboxService.dispatch() == 1
+        event = OutboxEvent.objects.get()
+        assert event.delivered_at is None
+        assert event.attempts == 0
+        assert len(webhook.requests) == 1
+
+    def test_stops_posting_when_lease_runs_out(
+        self, subscribed_brand, license_rankmath_pro, webhook, settings
+    ):
+        """Test that batches left at the deadline stay leased, not failed."""
+        settings.WEBHOOK_BATCH_SIZE = 1
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+        LicenseService.update_license_status(license_rankmath_pro.id, "valid")
+        events = list(OutboxEvent.objects.order_by("id"))
+
+        sent, error = OutboxService._deliver_brand(subscribed_brand, events, deadline=0)
+
+        assert (sent, error) == (0, None)
+        assert webhook.requests == []
+
+    def test_lease_covers_claimed_work(self, brand_rankmath, settings):
+        """Test that the lease grows with batches per brand and brand waves."""
+        settings.WEBHOOK_BATCH_SIZE = 10
+        settings.WEBHOOK_CONCURRENCY = 2
+        settings.WEBHOOK_TIMEOUT = 5
+        settings.WEBHOOK_LEASE = 60
+        events = [OutboxEvent(brand_id=brand_id) for brand_id in (1, 2, 3)]
+        events += [OutboxEvent(brand_id=1) for _ in range(20)]
+
+        # 2 waves of brands, up to 3 batches each, 10 s per POST
+        assert OutboxService._lease_seconds(events) == 60 + 2 * 3 * 10
+        assert OutboxService._lease_seconds([]) == 60
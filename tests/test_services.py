@@ -7,8 +7,24 @@ from core.exceptions import (
     LicenseNotFoundError,
     SeatLimitReachedError,
 )
-from core.models import Activation, License
-from core.services import ActivationService, LicenseService
+from core.models import (
+    Activation,
+    ActivationHistory,
+    AuditLog,
+    Entitlement,
+    License,
+    UsageRollup,
+)
+from core.services import (
+    ActivationService,
+    ArchiveService,
+    EntitlementService,
+    ExpiryService,
+    ExportService,
+    LicenseService,
+    RollupService,
+)
+from core.signals import license_status_changed
 
 
 @pytest.mark.django_db
@@ -68,6 +84,19 @@ class TestLicenseService:
 
         assert updated_license.status == License.Status.SUSPENDED
 
+    def test_extend_expired_license_renews_it(self, license_rankmath_pro):
+        """Test that a new future expiry revives an expired license."""
+        license_rankmath_pro.status = License.Status.EXPIRED
+        license_rankmath_pro.save()
+
+        updated_license = LicenseService.update_license_status(
+            license_id=license_rankmath_pro.id,
+            status=None,
+            expires_at=timezone.now() + timezone.timedelta(days=30),
+        )
+
+        assert updated_license.status == License.Status.VALID
+
     def test_get_licenses_by_email(
         self,
         brand_rankmath,
@@ -125,6 +154,67 @@ class TestActivationService:
 
         assert activation1.id == activation2.id
 
+    def test_activate_license_normalizes_identifier(self, license_rankmath_pro):
+        """Test that spellings of the same site use one seat."""
+        activation = ActivationService.activate_license(
+            license_key_str=license_rankmath_pro.license_key.key,
+            instance_identifier="https://same-site.com/",
+        )
+
+        again = ActivationService.activate_license(
+            license_key_str=license_rankmath_pro.license_key.key,
+            instance_identifier="www.Same-Site.com",
+        )
+
+        assert again.id == activation.id
+        assert license_rankmath_pro.get_active_activations_count() == 1
+
+    def test_backfill_instance_digests(self, license_rankmath_pro):
+        """Test that rows without a digest are filled in batches."""
+        for i in range(5):
+            Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier=f"https://s{i}.com"
+            )
+        Activation.objects.update(instance_digest=None)
+
+        assert ActivationService.backfill_instance_digests(batch_size=2) == 5
+        assert not Activation.objects.filter(instance_digest__isnull=True).exists()
+        assert ActivationService.backfill_instance_digests(batch_size=2) == 0
+
+        again = ActivationService.activate_license(
+            license_key_str=license_rankmath_pro.license_key.key,
+            instance_identifier="s3.com",
+        )
+        assert again.instance_identifier == "https://s3.com"
+
+    def test_activation_without_digest_is_found(self, license_rankmath_pro):
+        """Test that re-activating a row not yet backfilled reuses its seat."""
+        key = license_rankmath_pro.license_key.key
+        activation = ActivationService.activate_license(key, "https://legacy.com")
+        Activation.objects.update(instance_digest=None)
+
+        again = ActivationService.activate_license(key, "https://legacy.com")
+
+        assert again.id == activation.id
+        assert Activation.objects.count() == 1
+
+    def test_migration_fills_instance_digests(self, license_rankmath_pro):
+        """Test that migration 0012 fills digests of rows written before 0008."""
+        from importlib import import_module
+
+        from django.apps import apps
+
+        migration = import_module("core.migrations.0012_fill_instance_digests")
+        for i in range(3):
+            Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier=f"https://m{i}.com"
+            )
+        Activation.objects.update(instance_digest=None)
+
+        migration.fill_instance_digests(apps, None)
+
+        assert not Activation.objects.filter(instance_digest__isnull=True).exists()
+
     def test_activate_license_seat_limit(self, license_rankmath_pro):
         """Test that seat limit is enforced."""
         # Activate up to the limit
@@ -177,3 +267,303 @@ class TestActivationService:
         """Test that invalid license key raises error."""
         with pytest.raises(LicenseNotFoundError):
             ActivationService.get_license_status("INVALID-KEY")
+
+
+@pytest.mark.django_db
+class TestExpiryService:
+    """Test ExpiryService."""
+
+    def test_expire_licenses(self, license_rankmath_pro, license_key_rankmath):
+        """Test that past-expiry licenses are expired in batches."""
+        past = timezone.now() - timezone.timedelta(days=1)
+        expired_ids = []
+        for i in range(5):
+            key = license_key_rankmath.brand.license_keys.create(
+                key=f"RANKMATH-expired-{i}", customer_email="old@example.com"
+            )
+            expired_ids.append(
+                License.objects.create(
+                    license_key=key,
+                    product=license_rankmath_pro.product,
+                    expires_at=past,
+                ).id
+            )
+
+        events = []
+
+        def receiver(sender, license_ids, status, **kwargs):
+            events.append((list(license_ids), status))
+
+        license_status_changed.connect(receiver)
+        try:
+            expired = ExpiryService.expire_licenses(batch_size=2)
+        finally:
+            license_status_changed.disconnect(receiver)
+
+        assert expired == 5
+        assert set(
+            License.objects.filter(status=License.Status.EXPIRED).values_list(
+                "id", flat=True
+            )
+        ) == set(expired_ids)
+        license_rankmath_pro.refresh_from_db()
+        assert license_rankmath_pro.status == License.Status.VALID
+        assert AuditLog.objects.filter(action="license.expired").count() == 5
+        assert [len(ids) for ids, _ in events] == [2, 2, 1]
+        assert all(status == License.Status.EXPIRED for _, status in events)
+
+    def test_activate_expired_status(self, license_rankmath_pro):
+        """Test that a processed (EXPIRED) license cannot be activated."""
+        license_rankmath_pro.expires_at = timezone.now() - timezone.timedelta(days=1)
+        license_rankmath_pro.save()
+        ExpiryService.expire_licenses()
+
+        with pytest.raises(LicenseExpiredError):
+            ActivationService.activate_license(
+                license_key_str=license_rankmath_pro.license_key.key,
+                instance_identifier="https://test.com",
+            )
+
+
+@pytest.mark.django_db
+class TestEntitlementService:
+    """Test EntitlementService and the read model receivers."""
+
+    def test_entitlement_follows_license(
+        self, license_rankmath_pro, django_capture_on_commit_callbacks
+    ):
+        """Test that license and activation changes refresh the row."""
+        entitlement = Entitlement.objects.get(license=license_rankmath_pro)
+        assert entitlement.customer_email == "test@example.com"
+        assert entitlement.brand_name == "RankMath"
+        assert entitlement.seats_used == 0
+
+        # Seats are recounted once the activation commits
+        with django_capture_on_commit_callbacks() as callbacks:
+            activation = ActivationService.activate_license(
+                license_key_str=license_rankmath_pro.license_key.key,
+                instance_identifier="https://site.com",
+            )
+        entitlement.refresh_from_db()
+        assert entitlement.seats_used == 0
+        for callback in callbacks:
+            callback()
+        entitlement.refresh_from_db()
+        assert entitlement.seats_used == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ActivationService.deactivate_activation(activation.id)
+        entitlement.refresh_from_db()
+        assert entitlement.seats_used == 0
+
+        LicenseService.update_license_status(
+            license_id=license_rankmath_pro.id,
+            status=License.Status.SUSPENDED,
+        )
+        entitlement.refresh_from_db()
+        assert entitlement.status == License.Status.SUSPENDED
+
+    def test_entitlement_follows_bulk_changes(self, license_rankmath_pro):
+        """Test that expiry and bulk updates, which bypass save(), refresh rows."""
+        License.objects.filter(id=license_rankmath_pro.id).update(
+            expires_at=timezone.now() - timezone.timedelta(days=1)
+        )
+        ExpiryService.expire_licenses()
+
+        entitlement = Entitlement.objects.get(license=license_rankmath_pro)
+        assert entitlement.status == License.Status.EXPIRED
+
+        LicenseService.bulk_update_licenses(
+            brand=license_rankmath_pro.license_key.brand,
+            updates=[
+                {
+                    "license_id": license_rankmath_pro.id,
+                    "status": License.Status.CANCELLED,
+                }
+            ],
+        )
+        entitlement.refresh_from_db()
+        assert entitlement.status == License.Status.CANCELLED
+
+    def test_get_entitlements_by_email(
+        self, license_rankmath_pro, license_key_rankmath, product_content_ai
+    ):
+        """Test email lookup with and without the validity filter."""
+        License.objects.create(
+            license_key=license_key_rankmath,
+            product=product_content_ai,
+            status=License.Status.SUSPENDED,
+        )
+
+        assert (
+            len(EntitlementService.get_entitlements_by_email("TEST@example.com")) == 2
+        )
+        valid = EntitlementService.get_entitlements_by_email(
+            "test@example.com", valid_only=True
+        )
+        assert [e.license_id for e in valid] == [license_rankmath_pro.id]
+
+    def test_rebuild(self, license_rankmath_pro):
+        """Test that rebuild restores rows missed by raw writes."""
+        Entitlement.objects.all().delete()
+
+        assert EntitlementService.rebuild() == 1
+        assert Entitlement.objects.filter(license=license_rankmath_pro).exists()
+
+
+@pytest.mark.django_db
+class TestRollupService:
+    """Test RollupService usage rollups."""
+
+    def test_run_counts_events_and_seats(
+        self,
+        license_rankmath_pro,
+        product_rankmath_pro,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test hourly and daily buckets, seat gauges and rejections."""
+        now = timezone.now()
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        with django_capture_on_commit_callbacks(execute=True):
+            kept = Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier="https://a.com"
+            )
+            removed = Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier="https://b.com"
+            )
+            # An hour ago: activated then; deactivated in the current hour
+            Activation.objects.filter(id__in=[kept.id, removed.id]).update(
+                activated_at=hour - timezone.timedelta(minutes=30)
+            )
+            ActivationService.deactivate_activation(removed.id)
+        AuditLog.objects.create(
+            action="activation.seat_limit_reached",
+            actor="license_key:test",
+            entity_type="license",
+            entity_id=license_rankmath_pro.id,
+        )
+
+        assert RollupService.run(now=now) > 0
+
+        rows = {
+            row.bucket_start: row
+            for row in UsageRollup.objects.filter(
+                product=product_rankmath_pro, granularity="hour"
+            )
+        }
+        previous, current = rows[hour - timezone.timedelta(hours=1)], rows[hour]
+        assert (previous.activations, previous.deactivations) == (2, 0)
+        assert previous.active_seats == 2
+        assert (current.deactivations, current.seat_limit_rejections) == (1, 1)
+        assert current.active_seats == 1
+        assert current.seats_purchased == 5
+
+        days = UsageRollup.objects.filter(
+            product=product_rankmath_pro, granularity="day"
+        ).order_by("bucket_start")
+        assert sum(day.activations for day in days) == 2
+        assert sum(day.deactivations for day in days) == 1
+        assert days.last().active_seats == 1
+
+    def test_run_is_incremental(self, license_rankmath_pro, product_rankmath_pro):
+        """Test that a second run only recomputes the recent buckets."""
+        Activation.objects.create(
+            license=license_rankmath_pro, instance_identifier="https://a.com"
+        )
+        Activation.objects.filter(license=license_rankmath_pro).update(
+            activated_at=timezone.now() - timezone.timedelta(days=2)
+        )
+        first = RollupService.run()
+        hours = UsageRollup.objects.filter(granularity="hour").count()
+        days = UsageRollup.objects.filter(granularity="day").count()
+        second = RollupService.run()
+
+        # The activation's hour and the last hour of each of the three days:
+        # hours without events are not stored
+        assert days == 3
+        assert hours <= 4
+        assert first == hours + days
+        # At most two hours (previous and current), and their days
+        assert second <= 4
+
+    def test_interrupted_backfill_resumes(
+        self,
+        license_rankmath_pro,
+        product_rankmath_pro,
+        monkeypatch,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that a backfill commits day by day and resumes after the last."""
+        with django_capture_on_commit_callbacks(execute=True):
+            Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier="https://a.com"
+            )
+        Activation.objects.filter(license=license_rankmath_pro).update(
+            activated_at=timezone.now() - timezone.timedelta(days=3)
+        )
+        roll_up_window = RollupService._roll_up_window
+        windows = []
+
+        def interrupted(*args):
+            if windows:
+                raise RuntimeError("worker stopped")
+            windows.append(args[0])
+            return roll_up_window(*args)
+
+        monkeypatch.setattr(RollupService, "_roll_up_window", staticmethod(interrupted))
+        with pytest.raises(RuntimeError):
+            RollupService.run()
+        assert UsageRollup.objects.filter(granularity="day").count() == 1
+
+        monkeypatch.undo()
+        RollupService.run()
+        days = UsageRollup.objects.filter(
+            product=product_rankmath_pro, granularity="day"
+        )
+        assert days.count() == 4
+        assert sum(day.activations for day in days) == 1
+        assert days.order_by("bucket_start").last().active_seats == 1
+
+
+@pytest.mark.django_db
+class TestArchiveService:
+    """Test archiving of old deactivated activations."""
+
+    def test_archive_activations(self, license_rankmath_pro, settings):
+        """Test that only activations deactivated before the window move."""
+        settings.ACTIVATION_ARCHIVE_AFTER_DAYS = 30
+        now = timezone.now()
+        live, recent, *old = [
+            Activation.objects.create(
+                license=license_rankmath_pro, instance_identifier=f"https://s{i}.com"
+            )
+            for i in range(5)
+        ]
+        Activation.objects.filter(id=recent.id).update(
+            deactivated_at=now - timezone.timedelta(days=29)
+        )
+        Activation.objects.filter(id__in=[a.id for a in old]).update(
+            activated_at=now - timezone.timedelta(days=60),
+            deactivated_at=now - timezone.timedelta(days=31),
+        )
+
+        assert ArchiveService.archive_activations(batch_size=2, now=now) == 3
+
+        assert set(Activation.objects.values_list("id", flat=True)) == {
+            live.id,
+            recent.id,
+        }
+        archived = ActivationHistory.objects.get(id=old[0].id)
+        assert archived.instance_identifier == old[0].instance_identifier
+        assert bytes(archived.instance_digest) == bytes(old[0].instance_digest)
+        assert archived.archived_at == now
+
+        # Deactivating an archived activation reports it as deactivated
+        deactivated = ActivationService.deactivate_activation(old[0].id)
+        assert deactivated.deactivated_at is not None
+        assert ArchiveService.archive_activations(now=now) == 0
+
+        # Exports and rollups still see archived activations
+        brand = license_rankmath_pro.product.brand
+        assert len(list(ExportService.get_queryset(brand, "activations"))) == 5
+        assert RollupService._resume_point(now) == now - timezone.timedelta(days=60)
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.services import ActivationService, LicenseService
+from core.status_cache import StatusCache
+
+
+def count_queries(func, *args):
+    with CaptureQueriesContext(connection) as ctx:
+        result = func(*args)
+    return result, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestStatusCache:
+    """Test the license status cache."""
+
+    def test_hit_and_invalidation(self, license_rankmath_pro):
+        """Test that writes to a key's licenses or activations invalidate it."""
+        key = license_rankmath_pro.license_key.key
+
+        _, queries = count_queries(ActivationService.get_license_status, key)
+        assert queries > 0
+        _, queries = count_queries(ActivationService.get_license_status, key)
+        assert queries == 0
+
+        ActivationService.activate_license(key, "https://site.com")
+        status = ActivationService.get_license_status(key)
+        assert status["licenses"][0]["seats_used"] == 1
+
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+        status = ActivationService.get_license_status(key)
+        assert status["valid"] is False
+
+    def test_build_before_invalidation_is_not_stored(self):
+        """Test that a rebuild racing with a write does not cache old data."""
+        cache = StatusCache()
+
+        def build():
+            cache.invalidate(["KEY"])
+            return {"licenses": [], "stale": True}
+
+        assert cache.get("KEY", build)["stale"] is True
+        assert cache.get("KEY", lambda: {"licenses": []}) == {"licenses": []}
+
+    def test_cache_errors_do_not_fail_requests(
+        self, license_rankmath_pro, monkeypatch, settings
+    ):
+        """Test that a failing cache backend counts as misses and skipped writes."""
+
+        class BrokenCache:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise ConnectionError("Error 111 connecting to redis:6379")
+
+                return fail
+
+        monkeypatch.setattr(
+            "core.status_cache.caches", {settings.STATUS_CACHE_ALIAS: BrokenCache()}
+        )
+        key = license_rankmath_pro.license_key.key
+
+        ActivationService.activate_license(key, "https://site.com")
+        LicenseService.update_license_status(license_rankmath_pro.id, "suspended")
+
+        status = ActivationService.get_license_status(key)
+        assert status["valid"] is False
+        assert status["licenses"][0]["seats_used"] == 1
+        assert ActivationService.get_license_statuses([key])[key] == status
+
+    def test_waits_for_other_process(self, settings):
+        """Test that a process polls for the entry another one is building."""
+        other_process = StatusCache()
+        key = other_process._key("KEY")
+        cache = caches[settings.STATUS_CACHE_ALIAS]
+        cache.add(f"{key}:lock", 1)
+        builds = []
+
+        def finish_build():
+            time.sleep(0.1)
+            cache.set(key, {"licenses": [], "built_by": "other"})
+
+        threading.Thread(target=finish_build).start()
+        value = StatusCache().get("KEY", lambda: builds.append(1))
+
+        assert value["built_by"] == "other"
+        assert builds == []
+
+
+def burst(key: str, requests: int = 20) -> tuple[list, int]:
+    """Run `requests` concurrent status checks; return results and total queries."""
+    barrier = threading.Barrier(requests)
+    queries, results = [], []
+
+    def request():
+        barrier.wait()
+        try:
+            result, count = count_queries(ActivationService.get_license_status, key)
+            queries.append(count)
+            results.append(result)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=request) for _ in range(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, sum(queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_burst_of_identical_requests_builds_once(
+    license_rankmath_pro, monkeypatch, settings
+):
+    """Test that 20 concurrent misses for one key run one build's queries."""
+    key = license_rankmath_pro.license_key.key
+    _, build_queries = count_queries(ActivationService._build_license_status, key)
+
+    build = ActivationService._build_license_status
+
+    def slow_build(license_key_str):
+        # Keep the build in flight while the other requests arrive
+        time.sleep(0.2)
+        return build(license_key_str)
+
+    monkeypatch.setattr(
+        ActivationService, "_build_license_status", staticmethod(slow_build)
+    )
+
+    settings.STATUS_CACHE_ENABLED = False
+    results, queries = burst(key)
+    assert len(results) == 20
+    assert queries == 20 * build_queries
+
+    settings.STATUS_CACHE_ENABLED = True
+    results, queries = burst(key)
+    assert len(results) == 20
+    assert all(result == results[0] for result in results)
+    assert queries == build_queries
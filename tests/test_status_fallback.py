@@ -0,0 +1,198 @@
+import sqlite3
+import stat
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.cache import caches
+from django.db import OperationalError
+from django.utils import timezone
+
+from core.circuit import CircuitBreaker
+from core.exceptions import StatusUnavailableError
+from core.models import LicenseKey
+from core.services import ActivationService
+from core.status_fallback import status_breaker, status_store
+
+
+@pytest.fixture
+def take_database_down(monkeypatch, settings):
+    """
+    Return a function making status queries fail like an unreachable
+    database; it returns the list of attempted queries.
+    """
+
+    def take_down():
+        calls = []
+
+        def query(license_keys):
+            calls.append(license_keys)
+            raise OperationalError("could not connect to server")
+
+        caches[settings.STATUS_CACHE_ALIAS].clear()
+        monkeypatch.setattr(
+            ActivationService, "_query_license_statuses", staticmethod(query)
+        )
+        return calls
+
+    return take_down
+
+
+@pytest.mark.django_db
+class TestStatusFallback:
+    """Test serving the last known good status during database outages."""
+
+    def test_serves_last_known_good_status(
+        self, api_client, license_rankmath_pro, take_database_down
+    ):
+        """Test that a stored status is served, marked stale, when the DB fails."""
+        url = f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+        fresh = api_client.get(url)
+        assert fresh.status_code == 200
+        assert "X-Status-Stale" not in fresh
+
+        take_database_down()
+        stale = api_client.get(url)
+
+        assert stale.status_code == 200
+        assert stale["X-Status-Stale"] == "1"
+        assert int(stale["Age"]) >= 0
+        assert stale.data == fresh.data
+
+    def test_unavailable_without_stored_status(
+        self, api_client, license_rankmath_pro, take_database_down
+    ):
+        """Test that a key never served before gets a 503 during an outage."""
+        take_database_down()
+        url = f"/api/v1/licenses/{license_rankmath_pro.license_key.key}/status"
+        response = api_client.get(url)
+
+        assert response.status_code == 503
+        assert response.data["error"]["code"] == "SERVICE_UNAVAILABLE"
+        assert "Retry-After" in response
+
+    def test_batch_serves_last_known_good_statuses(
+        self, api_client, license_rankmath_pro, brand_wprocket, take_database_down
+    ):
+        """Test that a batch serves stored keys stale and lists the others."""
+        stored = license_rankmath_pro.license_key.key
+        other = LicenseKey.objects.create(
+            key="WPROCKET-test-key-456",
+            brand=brand_wprocket,
+            customer_email="other@example.com",
+        ).key
+        fresh = ActivationService.get_license_status(stored)
+
+        take_database_down()
+        response = api_client.post(
+            "/api/v1/licenses/status",
+            {"license_keys": [stored, other]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response["X-Status-Stale"] == "1"
+        assert response.data["results"] == {stored: fresh}
+        assert response.data["stale"][stored] >= 0
+        assert response.data["unavailable"] == [other]
+        assert response.data["not_found"] == []
+
+    def test_batch_unavailable_during_outage(
+        self, api_client, license_rankmath_pro, take_database_down
+    ):
+        """Test that a batch with no key resolved gets a 503 during an outage."""
+        take_database_down()
+        response = api_client.post(
+            "/api/v1/licenses/status",
+            {"license_keys": [license_rankmath_pro.license_key.key]},
+            format="json",
+        )
+
+        assert response.status_code == 503
+        assert response.data["error"]["code"] == "SERVICE_UNAVAILABLE"
+
+    def test_store_hides_key_and_email(self, license_rankmath_pro, settings):
+        """Test that the store file is private and holds no raw key or email."""
+        key = license_rankmath_pro.license_key.key
+        status = ActivationService.get_license_status(key)
+
+        path = settings.STATUS_FALLBACK_PATH
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        with sqlite3.connect(path) as connection:
+            payload = connection.execute("SELECT payload FROM status").fetchone()
+        assert key not in payload[0]
+        assert license_rankmath_pro.license_key.customer_email not in payload[0]
+
+        stored, stored_at = status_store.get(key)
+        assert stored == status
+
+    def test_expired_license_served_invalid(
+        self, license_rankmath_pro, take_database_down
+    ):
+        """Test that a license expiring after it was stored is served as invalid."""
+        key = license_rankmath_pro.license_key.key
+        status = ActivationService.get_license_status(key)
+        assert status["valid"] is True
+        status["licenses"][0]["expires_at"] = (
+            timezone.now() - timedelta(minutes=1)
+        ).isoformat()
+        status_store.put(key, status)
+
+        take_database_down()
+        stale, stored_at = ActivationService.get_license_status_or_last_known(key)
+
+        assert stored_at is not None
+        assert stale["valid"] is False
+        assert stale["licenses"][0]["is_valid"] is False
+
+    def test_old_entries_not_served(
+        self, license_rankmath_pro, take_database_down, settings
+    ):
+        """Test that statuses older than STATUS_FALLBACK_MAX_AGE are not served."""
+        key = license_rankmath_pro.license_key.key
+        ActivationService.get_license_status(key)
+        settings.STATUS_FALLBACK_MAX_AGE = 0
+
+        take_database_down()
+        time.sleep(0.01)
+        with pytest.raises(StatusUnavailableError):
+            ActivationService.get_license_status_or_last_known(key)
+
+    def test_breaker_stops_querying_failing_database(
+        self, license_rankmath_pro, take_database_down, settings
+    ):
+        """Test that after N failures status checks stop hitting the database."""
+        key = license_rankmath_pro.license_key.key
+        ActivationService.get_license_status(key)
+        calls = take_database_down()
+
+        for _ in range(settings.STATUS_BREAKER_FAILURES + 5):
+            status, stored_at = ActivationService.get_license_status_or_last_known(key)
+            assert stored_at is not None
+
+        assert len(calls) == settings.STATUS_BREAKER_FAILURES
+        assert status_breaker.state == CircuitBreaker.OPEN
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker states."""
+
+    def test_half_open_trial(self):
+        """Test that one trial call closes or reopens an open circuit."""
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()